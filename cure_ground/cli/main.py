@@ -85,9 +85,13 @@ def versions(
 
 
 @app.command()
-def post_flight():
+def post_flight(
+    force: bool = typer.Option(
+        False, "--force", help="Re-render every graph, even unchanged ones"
+    ),
+):
     """Run the post-flight data collection & processing flow"""
-    post_flight_flow()
+    post_flight_flow(force)
 
 
 @app.command("regenerate-graphs")
@@ -101,9 +105,12 @@ def regenerate_graphs(
         resolve_path=True,
         help="Path to an existing flight CSV",
     ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-render every graph, even unchanged ones"
+    ),
 ):
     """Regenerate graphs from an existing CSV without running a dump."""
-    regenerate_graphs_flow(str(csv_path))
+    regenerate_graphs_flow(str(csv_path), force)
 
 
 def main():
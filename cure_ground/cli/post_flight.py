@@ -10,6 +10,7 @@ import serial
 import serial.tools.list_ports
 
 from cure_ground.core.functions.flash_dump import flash_dump as flash_dump
+from cure_ground.core.functions.flash_dump import get_checkpoint_pages
 from cure_ground.core.functions.plotting.basic_suite_plotly import plot_flight_data
 from cure_ground.core.protocols.data_names.data_name_loader import (
     get_list_of_available_data_name_configs,
@@ -45,7 +46,7 @@ def _select_csv_path_from_cwd() -> str:
     return selected_csv_path
 
 
-def post_flight_flow():
+def post_flight_flow(force: bool = False):
     data_name_options = get_list_of_available_data_name_configs()
 
     # Ask the user to select a data name version
@@ -83,8 +84,19 @@ def post_flight_flow():
             default=True,
         ).ask()
 
+        # Pick up where a dropped connection left off?
+        saved_pages = get_checkpoint_pages()
+        resume_dump = False
+        if saved_pages:
+            resume_dump = questionary.confirm(
+                f"Resume the interrupted dump ({saved_pages} pages saved)?",
+                default=True,
+            ).ask()
+
         # Do the data dump
-        df = flash_dump(selected_port, False, dump_all_data, data_names)
+        df = flash_dump(
+            selected_port, False, dump_all_data, data_names, resume=resume_dump
+        )
         print("\n--------------------")
         print("Data dump complete.")
         print("---------------------\n")
@@ -140,12 +152,13 @@ def post_flight_flow():
             selected_version,
             selected_states_version,
             just_summary=just_summary,
+            force=force,
         )
 
     print("Done!")
 
 
-def regenerate_graphs_flow(csv_path: str):
+def regenerate_graphs_flow(csv_path: str, force: bool = False):
     if not os.path.isfile(csv_path):
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
@@ -189,6 +202,7 @@ def regenerate_graphs_flow(csv_path: str):
         selected_data_names_version,
         selected_states_version,
         just_summary=just_summary,
+        force=force,
     )
     print("Done!")
 
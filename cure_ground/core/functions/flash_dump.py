@@ -1,11 +1,14 @@
 # For visulazing binary data as text
-import struct
+import os
+import re
 import time
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 import serial
-from tqdm import tqdm
 
+from cure_ground.core.functions.sync_scanner import SyncScanner
 from cure_ground.core.protocols.data_names.data_name_loader import DataNames
 
 """
@@ -17,36 +20,375 @@ Dump spec WIP
 
 """
 
+PAGE_HEADER = b"lsh"
+PAGE_DATA_SIZE = 255
+PAGE_SIZE = len(PAGE_HEADER) + PAGE_DATA_SIZE
+END_MARKER = b"EOF"
+# Sent by the board just before the first page of a dump
+ALIGNMENT_SEQUENCE = b"abcdef"
+ALIGNMENT_TIMEOUT_S = 10.0
+
+# Firmware that can queue page requests advertises how many in its status
+# output, e.g. "dump_window=8". Without it, pages are fetched one at a time.
+DUMP_WINDOW_PATTERN = re.compile(r"dump[_-]window\s*[=:]\s*(\d+)", re.IGNORECASE)
+MAX_DUMP_WINDOW = 32
+# Give up on a pipelined dump after this long without any bytes
+PIPELINED_IDLE_TIMEOUT_S = 2.0
+# Firmware that can start a dump part way through advertises "dump_resume"
+# and accepts "dump -s <page>". Without it a resumed dump is re-read from the
+# first page and checked against the checkpoint.
+DUMP_RESUME_PATTERN = re.compile(r"dump[_-]resume", re.IGNORECASE)
+
+# Raw pages of an in-progress dump, kept until the dump reaches EOF
+DEFAULT_CHECKPOINT_PATH = os.path.join("temp", "flash_dump", "pages.bin")
+# Pages decoded at a time, during a dump or when reading a checkpoint back
+CHECKPOINT_BLOCK_PAGES = 4096
+
+# One flash record: id byte, then 4 value bytes read as both uint32 and float
+RECORD_DTYPE = np.dtype(
+    {
+        "names": ["id", "u4", "f4"],
+        "formats": ["u1", "<u4", "<f4"],
+        "offsets": [0, 1, 1],
+        "itemsize": 5,
+    }
+)
+
+
+def get_dump_window(status_text: str) -> int:
+    """Page requests the board accepts in flight (1 = stop-and-wait only)"""
+    match = DUMP_WINDOW_PATTERN.search(status_text)
+    if match is None:
+        return 1
+    return max(1, min(int(match.group(1)), MAX_DUMP_WINDOW))
+
+
+class DumpCheckpoint:
+    """
+    Raw dump pages appended to a file as they arrive.
+
+    Only whole pages count as confirmed, so a transfer cut off mid-page
+    resumes after the last complete one. Pages the board sends again are
+    compared with the file instead of rewritten, and the file is cut back at
+    the first one that differs. With a decoder, every confirmed page is also
+    decoded in order, starting with those saved by an earlier attempt.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        resume: bool = False,
+        decoder: Optional["DumpDecoder"] = None,
+    ):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        mode = "r+b" if resume and os.path.exists(path) else "w+b"
+        self._file = open(path, mode)
+        self.confirmed_pages = self._file.seek(0, os.SEEK_END) // PAGE_DATA_SIZE
+        self._file.truncate(self.confirmed_pages * PAGE_DATA_SIZE)
+        # Index of the next page the board will send
+        self.next_page = 0
+
+        self.decoder = decoder
+        if decoder is not None:
+            self._decode_saved_pages(self.confirmed_pages)
+
+    def _decode_saved_pages(self, page_count: int):
+        # Restart the decoder on the first page_count pages of the file
+        self.decoder.reset()
+        self._file.seek(0)
+        while page_count:
+            block_pages = min(page_count, self.decoder.block_pages)
+            self.decoder.add_pages(self._file.read(block_pages * PAGE_DATA_SIZE))
+            page_count -= block_pages
+
+    def add_page(self, page: bytes):
+        index = self.next_page
+        self.next_page += 1
+        if index < self.confirmed_pages:
+            self._file.seek(index * PAGE_DATA_SIZE)
+            if self._file.read(PAGE_DATA_SIZE) == page:
+                return
+            print(f"DumpCheckpoint: Page {index} changed, rewriting from there")
+            self._file.truncate(index * PAGE_DATA_SIZE)
+            self.confirmed_pages = index
+            if self.decoder is not None:
+                self._decode_saved_pages(index)
+
+        self._file.seek(index * PAGE_DATA_SIZE)
+        self._file.write(page)
+        self._file.flush()
+        self.confirmed_pages = index + 1
+        if self.decoder is not None:
+            self.decoder.add_pages(page)
+
+    def close(self):
+        self._file.close()
+
+    def remove(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def get_checkpoint_pages(path: str = DEFAULT_CHECKPOINT_PATH) -> int:
+    """Whole pages saved by an interrupted dump (0 if there is none)"""
+    try:
+        return os.path.getsize(path) // PAGE_DATA_SIZE
+    except OSError:
+        return 0
 
-def read_all(ser):
+
+def _report_throughput(page_count: int, elapsed: float):
+    total_bytes = page_count * PAGE_SIZE
+    rate = total_bytes / elapsed / 1024 if elapsed > 0 else 0.0
+    print(
+        f"Read {page_count} pages ({total_bytes} bytes) in {elapsed:.2f} s, "
+        f"{rate:.1f} KiB/s"
+    )
+
+
+def read_all(ser, on_page=None, leftover: bytes = b""):
+    """
+    Read every page, one request at a time.
+
+    Pages are collected in the returned list, or handed to ``on_page``
+    instead when it is given. ``leftover`` holds bytes already read past the
+    alignment sequence. Returns (pages, reached_eof).
+    """
     print("Reading from serial...")
     pages = []
+    add_page = pages.append if on_page is None else on_page
+    page_count = 0
+    reached_eof = False
     i = 0
+    start_time = time.monotonic()
     # Read 255 + 3 bytes per page
     while True:
         i += 1
         # time.sleep(1)
-        chunk = ser.read(255 + 3)
+        chunk = leftover[:PAGE_SIZE]
+        leftover = leftover[PAGE_SIZE:]
+        if len(chunk) < PAGE_SIZE:
+            chunk += ser.read(PAGE_SIZE - len(chunk))
         # print("Chunk: ", chunk)
         if chunk[:3] == b"lsh":
             # print("LSH")
-            pages.append(chunk[3:])
+            add_page(chunk[3:])
+            page_count += 1
         elif b"EOF" in chunk:
             print("\nEOF: ", chunk)
+            reached_eof = True
             break
         else:
             print("\nInvalid chunk: ", chunk)
             break
         if i % 16 == 0:
-            print("Read: ", len(pages), "pages", end="\r")
+            print("Read: ", page_count, "pages", end="\r")
 
         # Send the 'n' to get the next page
         ser.write(b"n")
     print("\nREAD ALL DONE")
-    return pages
+    _report_throughput(page_count, time.monotonic() - start_time)
+    return pages, reached_eof
+
+
+def read_all_pipelined(ser, window: int, on_page=None, leftover: bytes = b""):
+    """
+    Read every page while keeping ``window`` page requests in flight.
+
+    The board sends the first page unprompted and one more per b"n", so
+    window - 1 requests are sent up front and one more per page received.
+    Incoming bytes are collected in a buffer and split into pages as they
+    arrive instead of being read one page at a time. Requests still in
+    flight at EOF are discarded by the board. Pages are returned or passed
+    to ``on_page`` as in read_all.
+    """
+    print(f"Reading from serial ({window} pages in flight)...")
+    pages = []
+    add_page = pages.append if on_page is None else on_page
+    page_count = 0
+    reached_eof = False
+    buffer = bytearray(leftover)
+    start_time = time.monotonic()
+    last_data_time = start_time
+
+    ser.write(b"n" * (window - 1))
+    while True:
+        waiting = ser.in_waiting
+        data = ser.read(waiting if waiting else 1)
+        now = time.monotonic()
+        if data:
+            buffer.extend(data)
+            last_data_time = now
+        elif now - last_data_time > PIPELINED_IDLE_TIMEOUT_S:
+            print("\nTimed out waiting for data, ", len(buffer), "bytes unparsed")
+            break
+
+        # Split off every complete page
+        requested = 0
+        offset = 0
+        while len(buffer) - offset >= PAGE_SIZE and buffer.startswith(
+            PAGE_HEADER, offset
+        ):
+            add_page(bytes(buffer[offset + len(PAGE_HEADER) : offset + PAGE_SIZE]))
+            offset += PAGE_SIZE
+            requested += 1
+        del buffer[:offset]
+        if requested:
+            page_count += requested
+            ser.write(b"n" * requested)
+            print("Read: ", page_count, "pages", end="\r")
+
+        # Anything other than a (partial) page is the end marker or garbage
+        if len(buffer) < len(PAGE_HEADER) or buffer.startswith(PAGE_HEADER):
+            continue
+        if END_MARKER in buffer[:PAGE_SIZE]:
+            print("\nEOF: ", bytes(buffer[:PAGE_SIZE]))
+            reached_eof = True
+            break
+        if len(buffer) >= PAGE_SIZE:
+            print("\nInvalid chunk: ", bytes(buffer[:PAGE_SIZE]))
+            break
+
+    print("\nREAD ALL DONE")
+    _report_throughput(page_count, time.monotonic() - start_time)
+    return pages, reached_eof
+
 
+def decode_pages(pages: list, date_names: DataNames) -> pd.DataFrame:
+    """
+    Decode dumped pages into one row per timestamp record.
 
-def flash_dump(port: str, stat_only: bool, all_data: bool, date_names: DataNames):
+    Records before the first timestamp form their own row, and a value
+    repeated within a row keeps the last one. Unknown IDs are skipped and
+    counted.
+    """
+    data = b"".join(pages)
+    records = np.frombuffer(
+        data, dtype=RECORD_DTYPE, count=len(data) // RECORD_DTYPE.itemsize
+    )
+    expected_columns = date_names.get_name_list()
+    if not len(records):
+        return pd.DataFrame(columns=expected_columns)
+
+    ids = records["id"]
+    timestamp_id = date_names["TIMESTAMP"].id
+    is_timestamp = ids == timestamp_id
+    values = np.empty(len(records))
+    values[is_timestamp] = records["u4"][is_timestamp]
+    values[~is_timestamp] = records["f4"][~is_timestamp]
+
+    # Row of each record, starting at 0 whether or not the first is a timestamp
+    rows = np.cumsum(is_timestamp)
+    rows -= rows[0]
+
+    # Column of each record, -1 for IDs the data names don't define
+    column_lookup = np.full(256, -1, dtype=np.intp)
+    for column, name in enumerate(expected_columns):
+        column_lookup[date_names[name].id] = column
+    columns = column_lookup[ids]
+
+    known = columns >= 0
+    if not known.all():
+        unknown_ids, counts = np.unique(ids[~known], return_counts=True)
+        for data_id, count in zip(unknown_ids.tolist(), counts.tolist()):
+            print("Invalid name: ", data_id, f"({count} records)")
+
+    table = np.full((int(rows[-1]) + 1, len(expected_columns)), np.nan)
+    table[rows[known], columns[known]] = values[known]
+
+    # A leading row made only of unknown IDs has nothing in it
+    filled = np.zeros(len(table), dtype=bool)
+    filled[rows[known]] = True
+    df = pd.DataFrame(table[filled], columns=expected_columns)
+
+    # Timestamps are uint32 counters; keep them integral when none are missing
+    timestamp_name = date_names.get_name(timestamp_id)
+    if df[timestamp_name].notna().all():
+        df[timestamp_name] = df[timestamp_name].astype(np.int64)
+    return df
+
+
+class DumpDecoder:
+    """
+    Decodes dump pages into row blocks as they arrive.
+
+    Pages are decoded once ``block_pages`` of them are buffered. Each block
+    is cut at its last timestamp record so no row is split between blocks;
+    the records after it are carried into the next block.
+    """
+
+    def __init__(
+        self, date_names: DataNames, block_pages: int = CHECKPOINT_BLOCK_PAGES
+    ):
+        self.date_names = date_names
+        self.block_pages = block_pages
+        self._timestamp_id = date_names["TIMESTAMP"].id
+        self.reset()
+
+    def reset(self):
+        self._frames = []
+        self._pending = bytearray()
+        # Pages fed since the last reset
+        self.page_count = 0
+
+    def add_pages(self, data: bytes):
+        """Feed the next whole pages, oldest first."""
+        self._pending += data
+        self.page_count += len(data) // PAGE_DATA_SIZE
+        if len(self._pending) >= self.block_pages * PAGE_DATA_SIZE:
+            self._decode_pending()
+
+    def _decode_pending(self):
+        records = np.frombuffer(
+            self._pending,
+            dtype=RECORD_DTYPE,
+            count=len(self._pending) // RECORD_DTYPE.itemsize,
+        )
+        starts = np.flatnonzero(records["id"] == self._timestamp_id)
+        split = int(starts[-1]) * RECORD_DTYPE.itemsize if len(starts) else 0
+        # The record view pins the buffer; release it before trimming
+        del records
+        if split:
+            frame = decode_pages([bytes(self._pending[:split])], self.date_names)
+            if len(frame):
+                self._frames.append(frame)
+            del self._pending[:split]
+
+    def finish(self) -> pd.DataFrame:
+        """Decode what is left and return every row decoded so far."""
+        frame = decode_pages([bytes(self._pending)], self.date_names)
+        frames = self._frames + ([frame] if len(frame) else [])
+        if not frames:
+            return pd.DataFrame(columns=self.date_names.get_name_list())
+        return pd.concat(frames, ignore_index=True)
+
+
+def decode_dump_file(
+    path: str, date_names: DataNames, block_pages: int = CHECKPOINT_BLOCK_PAGES
+) -> pd.DataFrame:
+    """Decode a checkpoint file a block of pages at a time."""
+    decoder = DumpDecoder(date_names, block_pages)
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(block_pages * PAGE_DATA_SIZE)
+            if not block:
+                break
+            decoder.add_pages(block)
+    return decoder.finish()
+
+
+def flash_dump(
+    port: str,
+    stat_only: bool,
+    all_data: bool,
+    date_names: DataNames,
+    checkpoint_path: str = DEFAULT_CHECKPOINT_PATH,
+    resume: bool = False,
+):
     """
     Dumps flight data from the rocket's flash memory via serial communication.
 
@@ -69,15 +411,19 @@ def flash_dump(port: str, stat_only: bool, all_data: bool, date_names: DataNames
         date_names (DataNames): Data names configuration object containing
                                mappings between data IDs and their corresponding
                                names, units, and column definitions
+        checkpoint_path (str): File the raw pages are streamed to as they
+                              arrive. It is deleted once the dump reaches EOF
+        resume (bool): If True, continue from the pages already in
+                      checkpoint_path instead of starting over
 
     Returns:
         pandas.DataFrame or None: A DataFrame containing the flight data with columns
                                  corresponding to the data names defined in date_names.
-                                 Returns None if stat_only is True.
+                                 Returns None if stat_only is True or the
+                                 connection drops during the dump.
 
     Raises:
         serial.SerialException: If serial port cannot be opened or communication fails
-        struct.error: If binary data cannot be unpacked properly
         UnicodeDecodeError: If alignment data cannot be decoded
 
     Protocol Details:
@@ -109,87 +455,83 @@ def flash_dump(port: str, stat_only: bool, all_data: bool, date_names: DataNames
     time.sleep(0.2)
     print("Status: ")
     read = ser.read(ser.in_waiting)
-    print(read.decode("utf-8"))
+    status_text = read.decode("utf-8")
+    print(status_text)
+    dump_window = get_dump_window(status_text)
+    can_resume = DUMP_RESUME_PATTERN.search(status_text) is not None
 
     if stat_only:
         return
 
+    # Pages are decoded into row blocks as they are saved, so only the
+    # undecoded tail of the dump is held as raw bytes
+    decoder = DumpDecoder(date_names)
+    checkpoint = DumpCheckpoint(checkpoint_path, resume, decoder)
+    start_page = checkpoint.confirmed_pages if can_resume else 0
+    if checkpoint.confirmed_pages:
+        if can_resume:
+            print(f"Resuming dump at page {start_page}")
+        else:
+            print(
+                f"Board can't resume; re-reading and checking "
+                f"{checkpoint.confirmed_pages} saved pages"
+            )
+    checkpoint.next_page = start_page
+
     # 2. Send the command to dump the flash memory
     # Clear the incoming buffer
     while ser.in_waiting:
         print("Clearing: ", ser.read(ser.in_waiting))
 
-    if all_data:
-        ser.write(b"dump -a\n")
-    else:
-        ser.write(b"dump\n")
-
-    # 2.5 Read until we eat a \n, \r, and 's' char for alginment in that order
-    a_queue = ["a", "b", "c", "d", "e", "f"]
-
-    while True:
-        try:
-            data = ser.read(1).decode("utf-8")
-        except UnicodeDecodeError:
-            print("Failed to decode last byte")
-            continue
-        if data == a_queue[0]:
-            a_queue.pop(0)
-            # print("Popped: ", data)
+    command = "dump -a" if all_data else "dump"
+    if start_page:
+        command += f" -s {start_page}"
+    ser.write(f"{command}\n".encode("utf-8"))
+
+    # 2.5 Skip whatever the board prints before the alignment sequence
+    scanner = SyncScanner(ALIGNMENT_SEQUENCE, ALIGNMENT_TIMEOUT_S)
+    leftover = scanner.scan(ser)
+    if leftover is None:
+        checkpoint.close()
+        print(
+            f"No alignment sequence after {ALIGNMENT_TIMEOUT_S:.0f} s "
+            f"({scanner.skipped_bytes} bytes skipped)"
+        )
+        return None
+
+    print(f"Aligned!!! ({scanner.skipped_bytes} bytes skipped)")
+
+    # 3. Stream the pages to the checkpoint, pipelining page requests when
+    # the board supports it
+    try:
+        if dump_window > 1:
+            # Reads must not block forever, so a stalled board can be detected
+            ser.timeout = 0.1
+            _, reached_eof = read_all_pipelined(
+                ser, dump_window, on_page=checkpoint.add_page, leftover=leftover
+            )
         else:
-            a_queue = ["a", "b", "c", "d", "e", "f"]
-            # print("Failed to pop: ", data)
-
-        if not a_queue:
-            break
-
-    print("Aligned!!!")
-
-    # 3. Receive the data
-    all_pages = read_all(ser)
+            _, reached_eof = read_all(
+                ser, on_page=checkpoint.add_page, leftover=leftover
+            )
+    except serial.SerialException as e:
+        checkpoint.close()
+        print(f"\nConnection lost: {e}")
+        print(
+            f"{checkpoint.confirmed_pages} pages saved to {checkpoint_path}, "
+            "dump again with resume to continue"
+        )
+        return None
+    checkpoint.close()
 
     # 3.5 Parse the data
-    data_stream = []
-
-    print("Number of pages: ", len(all_pages))
-
-    for page in all_pages:
-        for i in range(0, len(page), 5):
-            # print("i: ", i, "page len: ", len(page))
-            name = page[i]
-            value = page[i + 1 : i + 5]
-            # print(len(value))
-            if name == 14:
-                value = struct.unpack("<I", value)[0]
-            else:
-                value = struct.unpack("<f", value)[0]
-            data_stream.append((name, value))
-
-    print()
+    print("Number of pages: ", checkpoint.confirmed_pages)
     print("Processing")
 
-    # 4. For each timestamp that is encountered, create a new row in the CSV file
-    rows = []
-    building_row = {}
-    for d in tqdm(data_stream):
-        if d[0] == date_names["TIMESTAMP"].id:
-            # Time to start a new row.
-            if building_row:  # Only add non-empty rows.
-                rows.append(building_row)
-            building_row = {}
-        try:
-            # Use the enum's name (or however you want to map it)
-            key = date_names.get_name(d[0])
-            building_row[key] = d[1]
-        except ValueError:
-            print("Invalid name: ", d[0])
-            # Optionally, break or continue
-
-    # Add the final row if it exists.
-    if building_row:
-        rows.append(building_row)
-
-    expected_columns = date_names.get_name_list()
-    df = pd.DataFrame(rows, columns=expected_columns)
-
+    # 4. Each timestamp that is encountered starts a new row
+    df = decoder.finish()
+    if reached_eof:
+        checkpoint.remove()
+    else:
+        print(f"Dump ended before EOF, pages kept in {checkpoint_path}")
     return df
@@ -1,8 +1,9 @@
 import os
+from typing import Optional
 
-from tqdm import tqdm
-
+from cure_ground.core.functions.plotting import common, stacked_summary_plot
 from cure_ground.core.functions.plotting.stacked_summary_plot import (
+    SUMMARY_FILE_NAME,
     plot_stacked_summary_figure,
 )
 
@@ -15,9 +16,10 @@ from .common import (
     create_slice_for_launch_window,
     get_launch_time,
     load_csv,
-    plot_column_full_and_launch_window,
     shift_timestamp_to_launch,
 )
+from .graph_manifest import GraphManifest, code_version, figure_key
+from .render_pool import render_columns
 
 
 def plot_flight_data(
@@ -26,6 +28,8 @@ def plot_flight_data(
     data_names_version: int,
     states_version: int,
     just_summary: bool = False,
+    workers: Optional[int] = None,
+    force: bool = False,
 ) -> None:
     """
     Orchestrates the plotting of flight data: loads CSV, applies time shift for launch,
@@ -36,6 +40,10 @@ def plot_flight_data(
         save_path: Directory where plots will be saved.
         data_names_version: Version number to pass to load_data_name_enum.
         states_version: Version number to pass to load_states_enum.
+        workers: Processes used to render the column graphs (None = one per
+            CPU core).
+        force: Re-render every graph, even ones the manifest in save_path
+            says are up to date.
     """
     # 1. Load enumerations and CSV
     data_names = load_data_name_enum(data_names_version)
@@ -67,28 +75,86 @@ def plot_flight_data(
     valid_columns = set(d["name"] for d in data_names.data_definitions)
     units = {d["name"]: d["unit"] for d in data_names.data_definitions}
 
+    # Graphs whose data, settings and plotting code are unchanged since they
+    # were last rendered are skipped
+    manifest = GraphManifest(save_path)
+
     # 8. Plot each valid column (full data + launch window)
     if not just_summary:
-        iterator = tqdm(df.columns, desc="Plotting columns", unit="column")
-        for column in iterator:
-            iterator.set_postfix(column=column)
-            if column not in valid_columns or column == data_names["TIMESTAMP"].name:
-                continue
-            plot_column_full_and_launch_window(df, launch_df, column, units, save_path)
+        columns = [
+            column
+            for column in df.columns
+            if column in valid_columns and column != data_names["TIMESTAMP"].name
+        ]
+        column_code = code_version(common)
+        figure_keys = {}
+        for column in columns:
+            params = {"column": column, "unit": units.get(column, "")}
+            figure_keys[f"{column}_full.png"] = figure_key(
+                column_code, dict(params, view="full"), df[column]
+            )
+            figure_keys[f"{column}_launch.png"] = figure_key(
+                column_code, dict(params, view="launch"), launch_df[column]
+            )
+
+        stale_columns = [
+            column
+            for column in columns
+            if force
+            or not manifest.is_current(
+                f"{column}_full.png", figure_keys[f"{column}_full.png"]
+            )
+            or not manifest.is_current(
+                f"{column}_launch.png", figure_keys[f"{column}_launch.png"]
+            )
+        ]
+        if len(stale_columns) < len(columns):
+            print(
+                f"Skipping {len(columns) - len(stale_columns)} unchanged columns "
+                "(use --force to re-render them)"
+            )
+
+        render_times = render_columns(
+            df, launch_df, stale_columns, units, save_path, workers
+        )
+        for file_name in render_times:
+            manifest.record(file_name, figure_keys[file_name])
+        manifest.save()
 
     # 9. Plot the summary figure (altitude, total accel, state changes)
-    print("Plotting summary figure...")
+    key_state_event_labels = {
+        states["STATE_ASCENT"].id: "Launch Detect",
+        states["STATE_DESCENT"].id: "Apogee Detect",
+    }
+    # Hashed before plotting, which adds columns to launch_df
+    summary_key = figure_key(
+        code_version(stacked_summary_plot),
+        {
+            "units": units,
+            "states": [(state.name, state.id) for state in states.items()],
+            "key_state_event_labels": key_state_event_labels,
+            "data_names": data_names.data_definitions,
+        },
+        launch_df,
+    )
+    # An unchanged summary is still shown, just not exported again
+    write_summary = force or not manifest.is_current(SUMMARY_FILE_NAME, summary_key)
+    if write_summary:
+        print("Plotting summary figure...")
+    else:
+        print("Summary figure unchanged, showing it without re-saving")
     plot_stacked_summary_figure(
         launch_df,
         states,
         units,
         save_path,
-        key_state_event_labels={
-            states["STATE_ASCENT"].id: "Launch Detect",
-            states["STATE_DESCENT"].id: "Apogee Detect",
-        },
+        key_state_event_labels=key_state_event_labels,
         data_names=data_names,
+        write_png=write_summary,
     )
+    if write_summary:
+        manifest.record(SUMMARY_FILE_NAME, summary_key)
+        manifest.save()
 
 
 # Example usage
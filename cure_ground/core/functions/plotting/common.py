@@ -1,4 +1,5 @@
 import os
+import time
 
 import pandas as pd
 import plotly.graph_objects as go
@@ -131,7 +132,7 @@ def create_slice_for_launch_window(
 
 def plot_column_full_and_launch_window(
     df: pd.DataFrame, launch_df: pd.DataFrame, column: str, units: dict, save_path: str
-) -> None:
+) -> dict:
     """
     Plots two time-series charts for a given column:
      1) The full dataset.
@@ -145,7 +146,11 @@ def plot_column_full_and_launch_window(
         column: The column name in df to plot.
         units: A dict mapping column names to their respective units (e.g. {"altitude": "m"}).
         save_path: The directory path to save the PNG files.
+
+    Returns:
+        Seconds spent exporting each PNG, keyed by file name.
     """
+    render_times = {}
     full_tick_step = _compute_time_tick_step(df.index, target_ticks=36)
     launch_tick_step = _compute_time_tick_step(launch_df.index, target_ticks=48)
     launch_window_label = _format_launch_window_label(launch_df.index)
@@ -177,9 +182,11 @@ def plot_column_full_and_launch_window(
         ticks="outside",
     )
     fig_full.update_yaxes(showgrid=True, ticks="outside", nticks=16)
+    start = time.perf_counter()
     fig_full.write_image(
         os.path.join(save_path, f"{column}_full.png"), scale=PLOT_SCALE
     )
+    render_times[f"{column}_full.png"] = time.perf_counter() - start
 
     # -- Launch-Window Plot --
     fig_launch = go.Figure()
@@ -209,9 +216,12 @@ def plot_column_full_and_launch_window(
     )
     fig_launch.update_yaxes(showgrid=True, ticks="outside", nticks=18)
     print("Saved a graph to ", os.path.join(save_path, f"{column}_launch.png"))
+    start = time.perf_counter()
     fig_launch.write_image(
         os.path.join(save_path, f"{column}_launch.png"), scale=PLOT_SCALE
     )
+    render_times[f"{column}_launch.png"] = time.perf_counter() - start
+    return render_times
 
 
 def plot_summary_figure(
@@ -0,0 +1,88 @@
+"""
+Manifest of the graphs in a graphs folder, used to skip unchanged figures.
+
+For each PNG the manifest records a hash of everything that went into it:
+the plotted data, the figure's parameters and the source of the plotting
+module that drew it. A figure is only re-rendered when that hash changes or
+its file is missing.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from types import ModuleType
+from typing import Dict, Union
+
+import pandas as pd
+import plotly
+
+MANIFEST_NAME = "graph_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _module_source_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def code_version(module: ModuleType) -> str:
+    """Version of a plotting module: its source plus the plotly version"""
+    return f"{_module_source_hash(module.__file__)};plotly={plotly.__version__}"
+
+
+def figure_key(
+    code: str, params: dict, data: Union[pd.Series, pd.DataFrame, None] = None
+) -> str:
+    """
+    Hash of one figure's inputs.
+
+    Args:
+        code: code_version() of the module drawing the figure
+        params: JSON-serializable settings the figure depends on
+        data: Plotted data; its index (the time axis) is included
+    """
+    digest = hashlib.sha1()
+    digest.update(json.dumps([code, params], sort_keys=True, default=str).encode())
+    if data is not None:
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        if isinstance(data, pd.DataFrame):
+            digest.update(json.dumps(list(map(str, data.columns))).encode())
+    return digest.hexdigest()
+
+
+class GraphManifest:
+    """Figure keys of the PNGs in one graphs folder"""
+
+    def __init__(self, save_path: str):
+        self.save_path = save_path
+        self.path = os.path.join(save_path, MANIFEST_NAME)
+        self._figures: Dict[str, str] = {}
+
+        try:
+            with open(self.path, "r") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return
+        if manifest.get("version") == MANIFEST_VERSION:
+            self._figures = dict(manifest.get("figures", {}))
+
+    def is_current(self, file_name: str, key: str) -> bool:
+        """True if the PNG exists and was rendered from the same inputs"""
+        return self._figures.get(file_name) == key and os.path.exists(
+            os.path.join(self.save_path, file_name)
+        )
+
+    def record(self, file_name: str, key: str):
+        self._figures[file_name] = key
+
+    def save(self):
+        manifest = {"version": MANIFEST_VERSION, "figures": self._figures}
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(manifest, file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"GraphManifest: Failed to write {self.path}: {e}")
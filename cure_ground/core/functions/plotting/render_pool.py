@@ -0,0 +1,167 @@
+"""
+Renders the per-column flight graphs across a pool of worker processes.
+
+Every worker receives the flight data once, when it starts, and then exports
+whole columns. Each worker pays the renderer start-up once: kaleido 0.2 keeps
+its renderer process alive between exports by itself, while kaleido 1.x
+starts Chromium per export unless a sync server is running, so the worker
+initializer starts one. The initializer also renders a throwaway figure so
+start-up doesn't show up in the first figure's timing.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional
+
+import kaleido
+import pandas as pd
+import plotly.graph_objects as go
+from tqdm import tqdm
+
+from .common import plot_column_full_and_launch_window
+
+# Flight data and output settings of this worker process
+_worker_state: dict = {}
+
+
+def _start_renderer() -> bool:
+    """
+    Keep one renderer alive for the exports that follow.
+
+    Returns:
+        True if a kaleido sync server was started; stop it with
+        _stop_renderer().
+    """
+    started = False
+    if hasattr(kaleido, "start_sync_server"):
+        try:
+            kaleido.start_sync_server(silence_warnings=True)
+            started = True
+        except Exception as e:
+            print(f"Failed to start the kaleido renderer: {e}")
+    try:
+        go.Figure().to_image(format="png", width=10, height=10)
+    except Exception:
+        # Let the real exports report the problem
+        pass
+    return started
+
+
+def _stop_renderer():
+    try:
+        kaleido.stop_sync_server(silence_warnings=True)
+    except Exception as e:
+        print(f"Failed to stop the kaleido renderer: {e}")
+
+
+def _init_render_worker(
+    df: pd.DataFrame, launch_df: pd.DataFrame, units: dict, save_path: str
+):
+    _worker_state.update(df=df, launch_df=launch_df, units=units, save_path=save_path)
+    if _start_renderer():
+        # Pool workers skip atexit handlers, but run multiprocessing
+        # finalizers on the way out
+        Finalize(None, _stop_renderer, exitpriority=10)
+
+
+def _render_column(column: str) -> Dict[str, float]:
+    return plot_column_full_and_launch_window(
+        _worker_state["df"],
+        _worker_state["launch_df"],
+        column,
+        _worker_state["units"],
+        _worker_state["save_path"],
+    )
+
+
+def _report_figure_times(progress: tqdm, render_times: Dict[str, float]):
+    for file_name, seconds in render_times.items():
+        progress.write(f"  {file_name}: {seconds:.1f} s")
+
+
+def render_columns(
+    df: pd.DataFrame,
+    launch_df: pd.DataFrame,
+    columns: List[str],
+    units: dict,
+    save_path: str,
+    workers: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Plot each column's full and launch-window graphs, in parallel.
+
+    Args:
+        df: The full DataFrame (indexed by time).
+        launch_df: The launch-window subset of df.
+        columns: Columns to plot.
+        units: A dict mapping column names to their units.
+        save_path: Directory the PNGs are written to.
+        workers: Worker processes to use (None = one per CPU core). With one
+            worker the graphs are rendered in this process.
+
+    Returns:
+        Seconds spent exporting each PNG, keyed by file name.
+    """
+    if not columns:
+        # Nothing to render, so don't pay for starting a renderer
+        return {}
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(columns)))
+
+    render_times: Dict[str, float] = {}
+    start = time.perf_counter()
+    progress = tqdm(total=len(columns), desc="Plotting columns", unit="column")
+
+    if workers == 1:
+        renderer_started = _start_renderer()
+        try:
+            for column in columns:
+                progress.set_postfix(column=column)
+                try:
+                    column_times = plot_column_full_and_launch_window(
+                        df, launch_df, column, units, save_path
+                    )
+                except Exception as e:
+                    progress.write(f"Failed to plot {column}: {e}")
+                else:
+                    _report_figure_times(progress, column_times)
+                    render_times.update(column_times)
+                progress.update()
+        finally:
+            if renderer_started:
+                _stop_renderer()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(df, launch_df, units, save_path),
+        ) as pool:
+            futures = {
+                pool.submit(_render_column, column): column for column in columns
+            }
+            for future in as_completed(futures):
+                column = futures[future]
+                progress.set_postfix(column=column)
+                try:
+                    column_times = future.result()
+                except Exception as e:
+                    progress.write(f"Failed to plot {column}: {e}")
+                else:
+                    _report_figure_times(progress, column_times)
+                    render_times.update(column_times)
+                progress.update()
+    progress.close()
+
+    elapsed = time.perf_counter() - start
+    if render_times:
+        slowest = max(render_times, key=render_times.get)
+        print(
+            f"Rendered {len(render_times)} graphs in {elapsed:.1f} s with "
+            f"{workers} worker(s), slowest {slowest} "
+            f"({render_times[slowest]:.1f} s)"
+        )
+    return render_times
@@ -9,6 +9,7 @@ from cure_ground.core.protocols.data_names.data_name_loader import DataNames
 from cure_ground.core.protocols.states.states_loader import States
 
 FT_PER_M = 3.28084  # handy constant
+SUMMARY_FILE_NAME = "launch_summary_stacked.png"
 
 
 def _get_time_tick_step(time_span: float) -> float:
@@ -31,6 +32,7 @@ def plot_stacked_summary_figure(
     save_path: str,
     key_state_event_labels: dict,
     data_names: DataNames,
+    write_png: bool = True,
 ) -> None:
     # ── 1. Pre-compute total acceleration ───────────────────────────────────
     accel_cols = {
@@ -267,7 +269,9 @@ def plot_stacked_summary_figure(
     # ───────────────────────────────────────────────────────────────────────
 
     # ── 5. Save & display ───────────────────────────────────────────────────
-    out_path = os.path.join(save_path, "launch_summary_stacked.png")
-    fig.write_image(out_path, scale=2)
-    print(f"Saved stacked-axis summary to {out_path}")
+    # write_png=False only displays it (the saved PNG is already current)
+    if write_png:
+        out_path = os.path.join(save_path, SUMMARY_FILE_NAME)
+        fig.write_image(out_path, scale=2)
+        print(f"Saved stacked-axis summary to {out_path}")
     fig.show()
@@ -0,0 +1,83 @@
+"""
+Buffered search for a sync marker in a serial stream.
+
+Bytes are read in bulk and searched with ``bytes.find`` instead of one read
+per byte. The last ``len(sync) - 1`` bytes of a miss are kept, so a marker
+split across two reads is still found.
+"""
+
+import time
+from typing import Optional, Tuple, Union
+
+BufferLike = Union[bytes, bytearray]
+
+
+def find_sync(
+    buffer: BufferLike, sync: bytes, start: int = 0, end: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Find the first ``sync`` in ``buffer[start:end]``.
+
+    Returns:
+        (index, discard) where ``index`` is the marker's position in
+        ``buffer`` (-1 if absent) and ``discard`` is the number of bytes after
+        ``start`` that cannot be part of a marker: everything before it, or
+        all but a possible partial marker at the end when there is none.
+    """
+    end = len(buffer) if end is None else end
+    index = buffer.find(sync, start, end)
+    if index != -1:
+        return index, index - start
+    return -1, max(0, end - start - (len(sync) - 1))
+
+
+class SyncScanner:
+    """Skips a serial stream up to and including a sync marker."""
+
+    def __init__(self, sync: bytes, timeout: Optional[float] = 10.0):
+        """
+        Args:
+            sync: Marker to align on
+            timeout: Seconds to wait for the marker (None = forever)
+        """
+        if not sync:
+            raise ValueError("sync must not be empty")
+        self.sync = sync
+        self.timeout = timeout
+        # Bytes before the marker in the last scan
+        self.skipped_bytes = 0
+
+    def scan(self, ser) -> Optional[bytes]:
+        """
+        Read from ``ser`` until the marker has been consumed.
+
+        Returns:
+            Bytes read after the marker, which belong to whatever follows it,
+            or None if the timeout expired first.
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        buffer = bytearray()
+        self.skipped_bytes = 0
+
+        # Short reads so the deadline is checked even when nothing arrives
+        previous_timeout = ser.timeout
+        ser.timeout = 0.1
+        try:
+            while True:
+                waiting = ser.in_waiting
+                data = ser.read(waiting if waiting else 1)
+                if data:
+                    # Only a partial marker is left over from earlier reads
+                    buffer.extend(data)
+                    index, discard = find_sync(buffer, self.sync)
+                    if index != -1:
+                        self.skipped_bytes += index
+                        return bytes(buffer[index + len(self.sync) :])
+                    self.skipped_bytes += discard
+                    del buffer[:discard]
+
+                if deadline is not None and time.monotonic() > deadline:
+                    self.skipped_bytes += len(buffer)
+                    return None
+        finally:
+            ser.timeout = previous_timeout
@@ -3,12 +3,27 @@ Flash dump protocol specification based on FlashCommands implementation
 """
 
 import struct
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict
+
+import numpy as np
+
+from cure_ground.core.protocols.data_names.data_name_loader import DataNames
 
 COMMAND_CODE = b"\x03"
 NULL_TERMINATOR = b"\x00"
 
+# 1 byte type + 4 bytes value + 1 byte newline; the value is read as both
+# uint32 (timestamps) and float
+DATA_BLOCK_DTYPE = np.dtype(
+    {
+        "names": ["id", "u4", "f4"],
+        "formats": ["u1", "<u4", "<f4"],
+        "offsets": [0, 1, 1],
+        "itemsize": 6,
+    }
+)
+
 # Response codes from FlashCommands.h
 RESP_OK = 0x00
 RESP_ERROR = 0xFF
@@ -23,6 +38,20 @@ class FlashDumpResponse:
     size: int
 
 
+@dataclass
+class FlashData:
+    """Parsed flash contents, one array per data name"""
+
+    # Timestamps as uint32, other values as float32 with NaN where a record
+    # didn't carry them
+    columns: Dict[str, np.ndarray]
+    # Blocks skipped per unrecognized data type ID
+    unknown_ids: Dict[int, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+
 def create_flash_dump_command():
     """Create a flash dump command packet"""
     return b"<" + COMMAND_CODE + NULL_TERMINATOR + b">"
@@ -59,63 +88,52 @@ def parse_flash_dump_response(response: bytes) -> FlashDumpResponse:
     return FlashDumpResponse(status=status, data=flash_data, size=data_length)
 
 
-def parse_flash_data(data: bytes) -> List[dict]:
+def parse_flash_data(data: bytes, data_names: DataNames) -> FlashData:
     """
-    Parse flash memory contents into structured data
-    Based on DataNames enum from dev_serial_flash_dump
+    Parse flash memory contents into one column per data name
 
     Data format:
     Repeated blocks of:
     - 1 byte: data type ID
     - 4 bytes: value (float or uint32 for timestamp)
     - 1 byte: newline character
-    """
-    DATA_BLOCK_SIZE = 6  # 1 byte type + 4 bytes value + 1 byte newline
-
-    # Data type mapping from DataNames enum
-    DATA_TYPES = {
-        0: ("accelerometer_x", float),
-        1: ("accelerometer_y", float),
-        2: ("accelerometer_z", float),
-        3: ("gyroscope_x", float),
-        4: ("gyroscope_y", float),
-        5: ("gyroscope_z", float),
-        6: ("temperature", float),
-        7: ("pressure", float),
-        8: ("altitude", float),
-        9: ("magnetometer_x", float),
-        10: ("magnetometer_y", float),
-        11: ("magnetometer_z", float),
-        12: ("median_acceleration_squared", float),
-        13: ("average_cycle_rate", float),
-        14: ("timestamp", "uint32"),
-    }
-
-    structured_data = []
-    current_record = {}
-
-    for i in range(0, len(data), DATA_BLOCK_SIZE):
-        block = data[i : i + DATA_BLOCK_SIZE]
-        if len(block) != DATA_BLOCK_SIZE:
-            break
-
-        data_type = block[0]
-        if data_type not in DATA_TYPES:
-            continue
-
-        name, value_type = DATA_TYPES[data_type]
-        value_bytes = block[1:5]
 
-        if value_type is float:
-            value = struct.unpack("<f", value_bytes)[0]
-        else:  # uint32
-            value = struct.unpack("<I", value_bytes)[0]
-
-        current_record[name] = value
-
-        # If this was a timestamp, start a new record
-        if name == "timestamp" and current_record:
-            structured_data.append(current_record.copy())
-            current_record = {}
-
-    return structured_data
+    Values accumulate into a record that each timestamp block closes, so
+    blocks after the last timestamp are dropped. A value repeated within a
+    record keeps the last one. IDs that data_names doesn't define as single
+    values are skipped and counted.
+    """
+    blocks = np.frombuffer(
+        data, dtype=DATA_BLOCK_DTYPE, count=len(data) // DATA_BLOCK_DTYPE.itemsize
+    )
+    ids = blocks["id"]
+
+    timestamp_id = data_names["TIMESTAMP"].id
+    is_timestamp = ids == timestamp_id
+    # Record each block belongs to: the number of timestamps before it
+    records = np.cumsum(is_timestamp) - is_timestamp
+    timestamps = blocks["u4"][is_timestamp]
+
+    names = [
+        item["name"]
+        for item in data_names.data_definitions
+        if item.get("type") != "group" and item["id"] != timestamp_id
+    ]
+    column_lookup = np.full(256, -1, dtype=np.intp)
+    for column, name in enumerate(names):
+        column_lookup[data_names[name].id] = column
+    columns = column_lookup[ids]
+
+    unknown = (columns < 0) & ~is_timestamp
+    unknown_ids, counts = np.unique(ids[unknown], return_counts=True)
+
+    keep = ~unknown & ~is_timestamp & (records < len(timestamps))
+    table = np.full((len(names), len(timestamps)), np.nan, dtype=np.float32)
+    table[columns[keep], records[keep]] = blocks["f4"][keep]
+
+    parsed = {data_names.get_name(timestamp_id): timestamps}
+    parsed.update(zip(names, table))
+    return FlashData(
+        columns=parsed,
+        unknown_ids=dict(zip(unknown_ids.tolist(), counts.tolist())),
+    )
@@ -1,14 +1,19 @@
-import csv
-import time
 import os
+import time
+from dataclasses import asdict
 from typing import Dict, Optional, List, Tuple
+
+import numpy as np
+import pandas as pd
+
 from cure_ground.data_sources.DataSource import DataSource
-from cure_ground.data_sources.LaunchDetector import LaunchDetector
+from cure_ground.data_sources.LaunchDetector import LaunchDetector, LaunchTrimBounds
+from cure_ground.data_sources.RadioPacketDecoder import RadioPacketBatch
+from cure_ground.data_sources.RecordingCache import RecordingCache
 from cure_ground.data_sources.timestamp_utils import (
+    TIMESTAMP_INFERENCE_SAMPLES,
     TIMESTAMP_KEYS,
-    infer_timestamp_multiplier_to_ms,
-    parse_timestamp_value,
-    to_milliseconds,
+    infer_timestamp_multiplier_to_ms_array,
 )
 
 from cure_ground.core.protocols.data_names.data_name_loader import (
@@ -18,17 +23,53 @@ from cure_ground.core.protocols.data_names.data_name_loader import (
 
 
 class CSVDataSource(DataSource):
-    def __init__(self, csv_file_path: str):
+    # Seconds of data kept before a detected launch
+    PRE_LAUNCH_SECONDS = 10
+    # Files at least this big are scanned for launch in blocks first, and
+    # only the rows from the launch window on are loaded
+    STREAMED_LAUNCH_SCAN_BYTES = 64 * 1024 * 1024
+
+    # Playback rate limits; a rate of None plays as fast as possible
+    MIN_PLAYBACK_RATE = 0.1
+    MAX_PLAYBACK_RATE = 100.0
+    # Rows consumed per get_data() call when playing as fast as possible
+    FAST_PLAYBACK_ROWS_PER_CALL = 2000
+
+    def __init__(self, csv_file_path: str, cache: Optional[RecordingCache] = None):
+        """
+        Args:
+            csv_file_path: Recording to play back
+            cache: Parsed-recording cache; defaults to the shared on-disk cache
+        """
         self.csv_file_path = csv_file_path
+        self.cache = cache if cache is not None else RecordingCache()
         self.connected = False
-        self.data_rows = []
-        self.processed_rows = []
+        # Recording in playback order: one typed column per CSV column, with
+        # rows addressed by position rather than copied into dicts.
+        self.table: Optional[pd.DataFrame] = None
+        self.original_timestamps = np.empty(0, dtype=np.int64)
+        self.normalized_timestamps = np.empty(0, dtype=np.int64)
+        self._field_columns: Dict[str, np.ndarray] = {}
+        # Carry-forward lookups built at load: for each field, the row whose
+        # value is current at every row (-1 = none yet); None when the column
+        # has no blanks. Groups without a column of their own may instead be
+        # derived once from their components: (first row, value).
+        self._fill_rows: Dict[str, Optional[np.ndarray]] = {}
+        self._derived_groups: Dict[str, Tuple[int, str]] = {}
+        # Numeric, non-group fields handed to get_batch() as float columns
+        self._batch_columns: List[str] = []
+        self._batch_start = 0
         self.current_index = 0
-        self.playback_start_time = 0
+        # The playhead (ms into the recording) is anchored at a wall-clock
+        # time and moves at playback_rate from there; any seek, pause or rate
+        # change re-anchors it. Playback starts on the first get_data() call.
+        self.playback_rate: Optional[float] = 1.0
+        self.paused = False
+        self._anchor_playhead_ms = 0.0
+        self._anchor_time: Optional[float] = None
         self.data_start_timestamp = 0
         self.timestamp_multiplier_to_ms = 1
-        self.last_valid_values = {}
-        self.trimmed_csv_path = None
+        self.trim_bounds: Optional[LaunchTrimBounds] = None
         self.data_names: DataNames = load_data_name_enum(3)
         self.protocol_field_names: List[str] = []
         self.group_component_mapping: Dict[str, List[str]] = {}
@@ -39,46 +80,45 @@ class CSVDataSource(DataSource):
     def connect(self, port: str = None) -> bool:
         # Connect to CSV data source with launch detection
         try:
-            # Detect launch and create trimmed data
-            detector = LaunchDetector(
-                pre_launch_seconds=10
-            )  # REMOVED post_launch_seconds parameter
-
-            # Create trimmed CSV in temp directory
-            temp_dir = "temp"
-            os.makedirs(temp_dir, exist_ok=True)
-            original_name = os.path.basename(self.csv_file_path)
-            name_without_ext = os.path.splitext(original_name)[0]
-            self.trimmed_csv_path = os.path.join(
-                temp_dir, f"{name_without_ext}_trimmed.csv"
-            )
-
-            success = detector.create_trimmed_csv(
-                self.csv_file_path, self.trimmed_csv_path
-            )
-
-            if success and os.path.exists(self.trimmed_csv_path):
-                print(f"Using trimmed CSV: {self.trimmed_csv_path}")
-                used_csv_path = self.trimmed_csv_path
-            else:
-                print("Using original CSV (launch detection failed or not needed)")
-                used_csv_path = self.csv_file_path
-
-            # Load the CSV data (trimmed or original)
-            with open(used_csv_path, "r", newline="") as csvfile:
-                reader = csv.DictReader(csvfile)
-                self._build_csv_column_mapping(reader.fieldnames or [])
-                self.data_rows = list(reader)
-
-            if not self.data_rows:
-                print("CSV file is empty")
-                return False
+            if not self._load_from_cache():
+                detector = LaunchDetector(pre_launch_seconds=self.PRE_LAUNCH_SECONDS)
+                self.trim_bounds = None
+                streamed = (
+                    os.path.getsize(self.csv_file_path)
+                    >= self.STREAMED_LAUNCH_SCAN_BYTES
+                )
+                if streamed:
+                    # Find launch before loading, so the rows before the
+                    # launch window are never read
+                    try:
+                        self.trim_bounds = detector.scan_csv_for_launch(
+                            self.csv_file_path
+                        )
+                    except Exception as e:
+                        print(f"Launch detection failed, using full dataset: {e}")
+
+                # Load the CSV data in one columnar pass
+                first_row = self.trim_bounds.first_row if self.trim_bounds else 0
+                table = self._load_table(self.csv_file_path, first_row)
+                if table.empty:
+                    print("CSV file is empty")
+                    return False
+
+                self._build_csv_column_mapping(list(table.columns))
+
+                # Detect launch on the loaded table; playback is trimmed to the
+                # returned bounds without writing an intermediate file.
+                if not streamed:
+                    try:
+                        self.trim_bounds = detector.find_trim_bounds(table)
+                    except Exception as e:
+                        print(f"Launch detection failed, using full dataset: {e}")
 
-            # Process the data to extract and normalize timestamps
-            self._process_timestamps()
-            self.current_index = 0
-            self.playback_start_time = 0
+                # Process the data to extract and normalize timestamps
+                self._process_timestamps(table, self.trim_bounds)
+                self._store_in_cache()
 
+            self._reset_playback()
             self.connected = True
 
             return True
@@ -136,75 +176,161 @@ class CSVDataSource(DataSource):
             header for header in headers if header not in mapped_headers
         ]
 
-    def _read_protocol_value(
-        self, row: Dict[str, str], protocol_name: str
-    ) -> Tuple[Optional[str], bool]:
-        column_name = self.csv_column_mapping.get(protocol_name, protocol_name)
-        value = row.get(column_name)
+    @staticmethod
+    def _load_table(csv_path: str, first_row: int = 0) -> pd.DataFrame:
+        # Numeric columns come back as int64/float64 arrays with NaN for blanks;
+        # anything else stays as strings. Rows before first_row are skipped.
+        try:
+            if first_row:
+                header = pd.read_csv(csv_path, nrows=0).columns
+                table = pd.read_csv(
+                    csv_path,
+                    low_memory=False,
+                    header=None,
+                    names=header,
+                    skiprows=first_row + 1,
+                )
+            else:
+                table = pd.read_csv(csv_path, low_memory=False)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+        table.columns = [str(column) for column in table.columns]
+        return table
+
+    # Integral floats in int64 range print like an int64 column would
+    _MAX_INT_FLOAT = float(2**63)
+
+    @classmethod
+    def _format_cell(cls, value) -> Optional[str]:
+        # Turn one typed cell back into the string form get_data() delivers.
+        # Numbers are printed from their parsed value, not the file's text:
+        # integral values as integers whatever the column's dtype ("2.0" ->
+        # "2"), others in shortest round-trip form ("1.50" -> "1.5").
+        if isinstance(value, str):
+            cleaned_value = value.strip()
+            return cleaned_value or None
         if value is None:
-            return None, False
-
-        cleaned_value = str(value).strip()
-        if cleaned_value == "":
-            return None, False
-        return cleaned_value, True
-
-    def _derive_group_value(
-        self, data: Dict[str, str], group_name: str
-    ) -> Optional[str]:
-        component_names = self.group_component_mapping.get(group_name, [])
-        if not component_names:
             return None
-
-        component_values = []
-        for component_name in component_names:
-            component_value = data.get(component_name)
-            if component_value in (None, "", "N/A"):
+        if isinstance(value, (float, np.floating)):
+            if np.isnan(value):
                 return None
-            component_values.append(component_value)
+            value = float(value)
+            if value.is_integer() and abs(value) < cls._MAX_INT_FLOAT:
+                return str(int(value))
+            return repr(value)
+        if isinstance(value, (bool, np.bool_)):
+            return str(bool(value))
+        if isinstance(value, (int, np.integer)):
+            return str(int(value))
+        cleaned_value = str(value).strip()
+        return cleaned_value or None
+
+    @staticmethod
+    def _valid_cells(column: np.ndarray) -> np.ndarray:
+        # Rows where _format_cell() yields a value, computed for the whole column
+        if column.dtype.kind == "f":
+            return ~np.isnan(column)
+        if column.dtype.kind in "biu":
+            return np.ones(len(column), dtype=bool)
+        series = pd.Series(column, copy=False)
+        return (series.notna() & series.astype(str).str.strip().ne("")).to_numpy()
+
+    def _build_carry_forward(self) -> None:
+        # Forward-fill every field once, so delivering a row is a lookup
+        self._fill_rows = {}
+        self._derived_groups = {}
+        first_valid: Dict[str, int] = {}
+        row_numbers = np.arange(len(self.normalized_timestamps))
+
+        for field_name, column in self._field_columns.items():
+            valid = self._valid_cells(column)
+            if valid.all():
+                self._fill_rows[field_name] = None
+                first_valid[field_name] = 0
+                continue
+            fill_rows = np.maximum.accumulate(np.where(valid, row_numbers, -1))
+            self._fill_rows[field_name] = fill_rows
+            if valid.any():
+                first_valid[field_name] = int(np.argmax(valid))
+
+        # A group with no value yet is derived from its components at the
+        # first row where all of them have one, then carried forward until
+        # the group's own column has a value.
+        for group_name, component_names in self.group_component_mapping.items():
+            if not component_names or not all(
+                name in first_valid for name in component_names
+            ):
+                continue
+            derive_row = max(first_valid[name] for name in component_names)
+            if first_valid.get(group_name, len(row_numbers)) <= derive_row:
+                continue
+            component_values = [
+                self._field_value(name, derive_row) for name in component_names
+            ]
+            if "N/A" in component_values:
+                continue
+            self._derived_groups[group_name] = (
+                derive_row,
+                f"[{', '.join(component_values)}]",
+            )
+
+    def _field_value(self, field_name: str, row_index: int) -> str:
+        # Value of a field as of a row, carrying the last valid value forward
+        column = self._field_columns.get(field_name)
+        if column is not None:
+            fill_rows = self._fill_rows.get(field_name)
+            source_row = row_index if fill_rows is None else int(fill_rows[row_index])
+            if source_row >= 0:
+                return self._format_cell(column[source_row])
 
-        return f"[{', '.join(component_values)}]"
+        derived = self._derived_groups.get(field_name)
+        if derived is not None and row_index >= derived[0]:
+            return derived[1]
+        return "N/A"
 
     def disconnect(self) -> None:
         # Disconnect from CSV data source
         print("Disconnecting from CSV data source")
         self.connected = False
-        self.data_rows = []
-        self.processed_rows = []
-        self.current_index = 0
-        self.playback_start_time = 0
+        self.table = None
+        self.original_timestamps = np.empty(0, dtype=np.int64)
+        self.normalized_timestamps = np.empty(0, dtype=np.int64)
+        self._field_columns = {}
+        self._fill_rows = {}
+        self._derived_groups = {}
+        self._batch_columns = []
+        self._reset_playback()
         self.data_start_timestamp = 0
         self.timestamp_multiplier_to_ms = 1
-        self.last_valid_values = {}
-
-        # Clean up trimmed CSV file if it exists
-        if self.trimmed_csv_path and os.path.exists(self.trimmed_csv_path):
-            try:
-                os.remove(self.trimmed_csv_path)
-                print(f"Cleaned up temporary file: {self.trimmed_csv_path}")
-            except Exception as e:
-                print(f"Error cleaning up temporary file: {e}")
-
-    def _process_timestamps(self):
-        # Process CSV data to extract and normalize timestamps
-        self.processed_rows = []
-
-        if not self.data_rows:
-            return
-
-        # Extract all valid timestamps
-        valid_rows = []
-        for row in self.data_rows:
-            timestamp = self._extract_timestamp(row)
-            if timestamp is not None:
-                valid_rows.append((timestamp, row))
-
-        if not valid_rows:
+        self.trim_bounds = None
+
+    def _process_timestamps(
+        self, table: pd.DataFrame, trim_bounds: Optional[LaunchTrimBounds] = None
+    ):
+        # Extract and normalize timestamps, then put rows in playback order
+        self.table = None
+        self._field_columns = {}
+        self.original_timestamps = np.empty(0, dtype=np.int64)
+        self.normalized_timestamps = np.empty(0, dtype=np.int64)
+
+        timestamps = self._extract_timestamps(table)
+        valid = np.isfinite(timestamps)
+        if trim_bounds is not None and not trim_bounds.is_time_based:
+            # Row-range bounds apply in file order; the table starts at the
+            # bounds' first_row
+            start_index = trim_bounds.start_index - trim_bounds.first_row
+            end_index = trim_bounds.end_index
+            if end_index is not None:
+                end_index -= trim_bounds.first_row
+            in_range = np.zeros(len(table), dtype=bool)
+            in_range[max(0, start_index) : end_index] = True
+            valid &= in_range
+        if not valid.any():
             print("No valid timestamps found in CSV")
             return
 
-        self.timestamp_multiplier_to_ms = infer_timestamp_multiplier_to_ms(
-            timestamp for timestamp, _ in valid_rows
+        self.timestamp_multiplier_to_ms = infer_timestamp_multiplier_to_ms_array(
+            timestamps[valid], max_samples=TIMESTAMP_INFERENCE_SAMPLES
         )
         if self.timestamp_multiplier_to_ms != 1:
             print(
@@ -213,113 +339,313 @@ class CSVDataSource(DataSource):
         else:
             print("CSVDataSource: Detected millisecond-based timestamps")
 
-        timestamp_ms_rows = [
-            (
-                to_milliseconds(timestamp, self.timestamp_multiplier_to_ms),
-                row,
+        timestamp_ms = np.rint(
+            timestamps[valid] * self.timestamp_multiplier_to_ms
+        ).astype(np.int64)
+
+        # Sort by timestamp to ensure chronological order (stable, so rows
+        # sharing a timestamp keep their file order)
+        order = np.argsort(timestamp_ms, kind="stable")
+        row_positions = np.flatnonzero(valid)[order]
+
+        sorted_timestamps = timestamp_ms[order]
+
+        # Time-based bounds are a contiguous slice of the sorted rows
+        start, end = 0, len(sorted_timestamps)
+        if trim_bounds is not None and trim_bounds.is_time_based:
+            start = int(
+                np.searchsorted(sorted_timestamps, trim_bounds.start_timestamp, "left")
             )
-            for timestamp, row in valid_rows
-        ]
+            if trim_bounds.end_timestamp is not None:
+                end = int(
+                    np.searchsorted(
+                        sorted_timestamps, trim_bounds.end_timestamp, "right"
+                    )
+                )
+            print(
+                f"CSVDataSource: Launch detected, playing {end - start} of "
+                f"{len(sorted_timestamps)} rows"
+            )
+            if start >= end:
+                print("CSVDataSource: Launch window is empty, using full dataset")
+                start, end = 0, len(sorted_timestamps)
 
-        # Sort by timestamp to ensure chronological order
-        timestamp_ms_rows.sort(key=lambda x: x[0])
+        self._set_playback_table(
+            table.iloc[row_positions[start:end]].reset_index(drop=True),
+            sorted_timestamps[start:end],
+        )
+
+    def _set_playback_table(
+        self, table: pd.DataFrame, original_timestamps: np.ndarray
+    ) -> None:
+        # Install rows already sorted and trimmed for playback
+        self.table = table
+        self.original_timestamps = original_timestamps
 
         # Find the minimum timestamp to use as baseline
-        self.data_start_timestamp = timestamp_ms_rows[0][0]
-
-        # Create processed rows with normalized timestamps
-        for timestamp_ms, row in timestamp_ms_rows:
-            processed_row = row.copy()
-            processed_row["original_timestamp"] = timestamp_ms
-            processed_row["normalized_timestamp"] = (
-                timestamp_ms - self.data_start_timestamp
+        self.data_start_timestamp = int(self.original_timestamps[0])
+        self.normalized_timestamps = (
+            self.original_timestamps - self.data_start_timestamp
+        )
+
+        # Column arrays for every field delivered by get_data()
+        self._field_columns = {}
+        for protocol_name in self.protocol_field_names:
+            column_name = self.csv_column_mapping.get(protocol_name)
+            if column_name is not None:
+                self._field_columns[protocol_name] = self.table[column_name].to_numpy()
+        for extra_column in self.extra_csv_columns:
+            self._field_columns[extra_column] = self.table[extra_column].to_numpy()
+
+        # Numeric protocol fields, then numeric extra columns so graphs can
+        # still pick up CSV-specific names for their channels
+        self._batch_columns = [
+            protocol_name
+            for protocol_name in self.protocol_field_names
+            if protocol_name not in self.group_component_mapping
+            and protocol_name in self._field_columns
+            and self._field_columns[protocol_name].dtype.kind in "biuf"
+        ] + [
+            extra_column
+            for extra_column in self.extra_csv_columns
+            if self._field_columns[extra_column].dtype.kind in "biuf"
+        ]
+        self._build_carry_forward()
+
+    def _cache_variant(self) -> str:
+        # Settings that change the parsed result are part of the cache key
+        # (the data names decide which columns map to protocol fields).
+        names = ",".join(self.protocol_field_names)
+        return f"csv;pre_launch={self.PRE_LAUNCH_SECONDS};names={names}"
+
+    def _store_in_cache(self) -> None:
+        if self.cache is None or self.table is None or not len(self.table):
+            return
+
+        columns = {"timestamps": self.original_timestamps}
+        for idx, column_name in enumerate(self.table.columns):
+            series = self.table[column_name]
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(
+                series
+            ):
+                columns[f"column{idx}"] = series.to_numpy()
+            else:
+                # Fixed-width strings; blanks read back as "" and format to None
+                columns[f"column{idx}"] = series.fillna("").astype(str).to_numpy(str)
+
+        trim_bounds = self.trim_bounds
+        metadata = {
+            "table_columns": list(self.table.columns),
+            "timestamp_multiplier_to_ms": self.timestamp_multiplier_to_ms,
+            "csv_column_mapping": self.csv_column_mapping,
+            "extra_csv_columns": self.extra_csv_columns,
+            "trim_bounds": asdict(trim_bounds) if trim_bounds is not None else None,
+        }
+        self.cache.store(
+            self.csv_file_path, columns, metadata, variant=self._cache_variant()
+        )
+
+    def _load_from_cache(self) -> bool:
+        if self.cache is None:
+            return False
+        cached = self.cache.load(self.csv_file_path, variant=self._cache_variant())
+        if cached is None:
+            return False
+
+        columns, metadata = cached
+        try:
+            table = pd.DataFrame(
+                {
+                    column_name: columns[f"column{idx}"]
+                    for idx, column_name in enumerate(metadata["table_columns"])
+                },
+                copy=False,
             )
-            self.processed_rows.append(processed_row)
+            trim_bounds = metadata["trim_bounds"]
+            self.trim_bounds = (
+                LaunchTrimBounds(**trim_bounds) if trim_bounds is not None else None
+            )
+            self.timestamp_multiplier_to_ms = metadata["timestamp_multiplier_to_ms"]
+            self.csv_column_mapping = metadata["csv_column_mapping"]
+            self.extra_csv_columns = metadata["extra_csv_columns"]
+            self._set_playback_table(table, columns["timestamps"])
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"CSVDataSource: Ignoring bad cache entry: {e}")
+            return False
 
-    def _extract_timestamp(self, row: Dict[str, str]) -> Optional[float]:
-        # Extract timestamp from row
+        print(
+            f"CSVDataSource: Loaded {len(table)} rows of {self.csv_file_path} from cache"
+        )
+        return True
+
+    @staticmethod
+    def _extract_timestamps(table: pd.DataFrame) -> np.ndarray:
+        # Per row, the first timestamp column holding a finite number
+        timestamps = np.full(len(table), np.nan)
         for key in TIMESTAMP_KEYS:
-            if key in row:
-                timestamp = parse_timestamp_value(row[key])
-                if timestamp is not None:
-                    return timestamp
-        return None
+            if key not in table.columns:
+                continue
+            values = pd.to_numeric(table[key], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            values = np.where(np.isfinite(values), values, np.nan)
+            missing = np.isnan(timestamps)
+            timestamps[missing] = values[missing]
+        return timestamps
+
+    # ===== PLAYBACK CONTROL =====
+    def _reset_playback(self) -> None:
+        self.current_index = 0
+        self._batch_start = 0
+        self.paused = False
+        self._anchor_playhead_ms = 0.0
+        self._anchor_time = None
+
+    def get_duration_ms(self) -> int:
+        # Length of the recording from its first to last row
+        if not len(self.normalized_timestamps):
+            return 0
+        return int(self.normalized_timestamps[-1])
+
+    def get_playhead_ms(self) -> float:
+        # Current playback position, in ms from the start of the recording
+        return self._playhead_at(time.time())
+
+    def _playhead_at(self, now: float) -> float:
+        if self._anchor_time is None or self.paused or self.playback_rate is None:
+            return self._anchor_playhead_ms
+        elapsed_ms = (now - self._anchor_time) * 1000
+        return self._anchor_playhead_ms + elapsed_ms * self.playback_rate
+
+    def _reanchor(self) -> None:
+        # Freeze the current position before changing how it moves
+        now = time.time()
+        self._anchor_playhead_ms = min(self._playhead_at(now), self.get_duration_ms())
+        if self._anchor_time is not None:
+            self._anchor_time = now
+
+    def seek(self, position_ms: float) -> None:
+        """
+        Jump to a position in the recording (ms from its start).
+
+        Rows before the position are skipped; the next get_data() call
+        delivers the rows at the position with values carried forward.
+        """
+        self._reanchor()
+        position_ms = min(max(float(position_ms), 0.0), self.get_duration_ms())
+        self._anchor_playhead_ms = position_ms
+        self.current_index = int(
+            np.searchsorted(self.normalized_timestamps, position_ms, side="left")
+        )
+        self._batch_start = self.current_index
+
+    def pause(self) -> None:
+        if not self.paused:
+            self._reanchor()
+            self.paused = True
+
+    def resume(self) -> None:
+        if self.paused:
+            self._reanchor()
+            self.paused = False
+
+    def set_playback_rate(self, rate: Optional[float]) -> None:
+        """Playback speed relative to real time; None plays as fast as possible"""
+        if rate is not None and not (
+            self.MIN_PLAYBACK_RATE <= rate <= self.MAX_PLAYBACK_RATE
+        ):
+            raise ValueError(
+                f"Playback rate must be between {self.MIN_PLAYBACK_RATE} and "
+                f"{self.MAX_PLAYBACK_RATE}, or None"
+            )
+        self._reanchor()
+        self.playback_rate = rate
 
+    def is_finished(self) -> bool:
+        return self.current_index >= len(self.normalized_timestamps)
+
+    # ===== DELIVERY =====
     def get_data(self) -> Optional[Dict[str, str]]:
-        if not self.connected or not self.processed_rows:
+        # Newest value of every field as a string; numeric cells come back in
+        # the canonical form described in _format_cell()
+        current_row = self._advance_playback()
+        if current_row is None:
+            return None
+
+        # Canonical DataNames keys, then any non-protocol CSV columns so
+        # existing custom fields still flow through.
+        cleaned_data = {
+            field_name: self._field_value(field_name, current_row)
+            for field_name in self.protocol_field_names
+        }
+        for extra_column in self.extra_csv_columns:
+            cleaned_data[extra_column] = self._field_value(extra_column, current_row)
+
+        # Include the original timestamp in the returned data
+        cleaned_data["TIMESTAMP"] = str(int(self.original_timestamps[current_row]))
+        return cleaned_data
+
+    def _advance_playback(self) -> Optional[int]:
+        # Consume every row due at the playhead; returns the newest of them,
+        # or None if no new row is due
+        if not self.connected or not len(self.normalized_timestamps):
             return None
 
         current_time = time.time()
 
         # If we haven't started playback yet, start now
-        if self.playback_start_time == 0:
-            self.playback_start_time = current_time
-            self.current_index = 0
-            # Initialize cache for carrying forward values
-            self.last_valid_values = {}
+        if self._anchor_time is None:
+            self._anchor_time = current_time
 
         # If we've reached the end of the data
-        if self.current_index >= len(self.processed_rows):
+        row_count = len(self.normalized_timestamps)
+        if self.current_index >= row_count:
             return None
 
-        # Calculate the elapsed time since playback started
-        elapsed_time = (
-            current_time - self.playback_start_time
-        ) * 1000  # Convert to milliseconds
+        if self.playback_rate is None and not self.paused:
+            # As fast as possible: a bounded block of rows per call
+            last_row = min(
+                self.current_index + self.FAST_PLAYBACK_ROWS_PER_CALL, row_count
+            )
+            self._anchor_playhead_ms = float(self.normalized_timestamps[last_row - 1])
+        playhead_ms = self._playhead_at(current_time)
 
-        cleaned_data = {}
-        data_available = False
+        # Every row due by now is consumed; with values carried forward, the
+        # newest of them holds the current value of every field.
+        due_rows = int(
+            np.searchsorted(self.normalized_timestamps, playhead_ms, side="right")
+        )
+        if due_rows <= self.current_index:
+            return None
+        self.current_index = due_rows
+        return due_rows - 1
+
+    def get_batch(self) -> Optional[RadioPacketBatch]:
+        # Every row due since the last call (including rows already consumed
+        # by get_data()), as float columns with NaN for blank cells
+        self._advance_playback()
+        start, end = self._batch_start, self.current_index
+        self._batch_start = end
+        if not self.connected:
+            return None
 
-        # Process all rows that should have been delivered by now based on their timestamps
-        while (
-            self.current_index < len(self.processed_rows)
-            and elapsed_time
-            >= self.processed_rows[self.current_index]["normalized_timestamp"]
-        ):
-            current_row = self.processed_rows[self.current_index]
-
-            # Populate protocol fields using canonical DataNames keys.
-            for protocol_name in self.protocol_field_names:
-                value, has_value = self._read_protocol_value(current_row, protocol_name)
-                if has_value:
-                    cleaned_data[protocol_name] = value
-                    self.last_valid_values[protocol_name] = value
-                elif protocol_name in self.last_valid_values:
-                    cleaned_data[protocol_name] = self.last_valid_values[protocol_name]
-                else:
-                    cleaned_data[protocol_name] = "N/A"
-
-            # Backfill group values from component values if group columns are blank.
-            for group_name in self.group_component_mapping:
-                if cleaned_data.get(group_name) in (None, "", "N/A"):
-                    derived_group = self._derive_group_value(cleaned_data, group_name)
-                    if derived_group is not None:
-                        cleaned_data[group_name] = derived_group
-                        self.last_valid_values[group_name] = derived_group
-
-            # Preserve any non-protocol CSV columns so existing custom fields still flow through.
-            for extra_column in self.extra_csv_columns:
-                value = current_row.get(extra_column)
-                if value is not None and str(value).strip() != "":
-                    cleaned_value = str(value).strip()
-                    cleaned_data[extra_column] = cleaned_value
-                    self.last_valid_values[extra_column] = cleaned_value
-                elif extra_column in self.last_valid_values:
-                    cleaned_data[extra_column] = self.last_valid_values[extra_column]
-                else:
-                    cleaned_data[extra_column] = "N/A"
-
-            # Include the original timestamp in the returned data
-            cleaned_data["TIMESTAMP"] = str(int(current_row["original_timestamp"]))
-
-            self.current_index += 1
-            data_available = True
-
-            # Break if we've processed all available rows for current time
-            if self.current_index >= len(self.processed_rows):
-                break
-
-        return cleaned_data if data_available else None
+        timestamps = self.original_timestamps[start:end]
+        values = np.full((len(timestamps), len(self._batch_columns)), np.nan)
+        for col_idx, protocol_name in enumerate(self._batch_columns):
+            values[:, col_idx] = self._field_columns[protocol_name][start:end]
+
+        packet_numbers = np.zeros(len(timestamps), dtype=np.int64)
+        if "NUM_PACKETS_SENT" in self._batch_columns:
+            packet_column = values[:, self._batch_columns.index("NUM_PACKETS_SENT")]
+            finite = np.isfinite(packet_column)
+            packet_numbers[finite] = packet_column[finite]
+
+        return RadioPacketBatch(
+            timestamps=timestamps,
+            packet_numbers=packet_numbers,
+            columns=list(self._batch_columns),
+            values=values,
+        )
 
     def is_connected(self) -> bool:
         return self.connected
@@ -25,6 +25,11 @@ class DataSource(ABC):
         # Check if connected to data source
         pass
 
+    def get_batch(self):
+        # Get every sample since the last call as a columnar batch, or None
+        # if the source only supports get_data()
+        return None
+
     def send_command(self, command: str) -> None:
         # Send a command to the data source
         raise NotImplementedError("send_command not implemented for this data source")
@@ -5,6 +5,7 @@ from .DataSource import DataSource
 from .SerialDataSource import SerialDataSource
 from .CSVDataSource import CSVDataSource
 from .RadioDataSource import RadioDataSource
+from .ReplayRadioDataSource import ReplayRadioDataSource
 
 
 class DataSourceFactory:
@@ -15,6 +16,7 @@ class DataSourceFactory:
         "serial": SerialDataSource,
         "csv": CSVDataSource,
         "radio": RadioDataSource,
+        "replay": ReplayRadioDataSource,
     }
 
     @classmethod
@@ -1,11 +1,361 @@
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from dataclasses import dataclass
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Optional
 from cure_ground.data_sources.timestamp_utils import (
     TIMESTAMP_KEYS,
-    infer_timestamp_multiplier_to_ms,
+    TIMESTAMP_INFERENCE_SAMPLES,
+    infer_timestamp_multiplier_to_ms_array,
 )
 
+# Accelerometer columns tried for launch detection, in order of preference
+ACCEL_COLUMNS = (
+    "ACCELEROMETER_Z",
+    "ACCELEROMETER_X",
+    "ACCELEROMETER_Y",
+    "ACCLZ",
+    "ACCLX",
+    "ACCLY",
+)
+
+# Rows per block when streaming a CSV for launch detection
+DEFAULT_SCAN_CHUNK_ROWS = 100_000
+
+
+@dataclass
+class LaunchTrimBounds:
+    """
+    Portion of a recording to keep around launch.
+
+    Time-based bounds are in milliseconds and inclusive; an end_timestamp
+    of None keeps everything after the start. When the recording has no
+    usable timestamps, start_index/end_index give a row range instead.
+    wrap_index is the first row where the timestamps jump backwards
+    (circular-buffer wrap), if one was seen. Every row before first_row is
+    outside the bounds, so a reader may skip them; row numbers are always
+    counted from the start of the recording.
+    """
+
+    launch_index: int = -1
+    launch_timestamp: Optional[int] = None
+    start_timestamp: Optional[float] = None
+    end_timestamp: Optional[float] = None
+    start_index: int = 0
+    end_index: Optional[int] = None
+    wrap_index: Optional[int] = None
+    first_row: int = 0
+
+    @property
+    def launch_detected(self) -> bool:
+        return self.launch_index != -1
+
+    @property
+    def is_time_based(self) -> bool:
+        return self.start_timestamp is not None
+
+
+@dataclass
+class LaunchCandidate:
+    """
+    One run of consecutive rows whose smoothed acceleration is above the
+    launch threshold.
+
+    confidence is in [0, 1]: the run's length relative to the minimum
+    sustain, times how far its mean acceleration clears the threshold
+    (full marks at twice the threshold).
+    """
+
+    start_index: int
+    end_index: int  # Exclusive
+    start_timestamp: Optional[int]
+    duration_ms: Optional[float]
+    mean_g: float
+    peak_g: float
+    sustained: bool
+    confidence: float
+
+
+class _LaunchScan:
+    """
+    Launch search over consecutive blocks of rows.
+
+    Each block is smoothed with a centred moving average and split into runs
+    of above-threshold rows; the rolling-mean context, the run still open at
+    the end of the block and the last timestamp are carried to the next
+    block, so feeding a recording in blocks finds the same launch as feeding
+    it whole. The scan is done once a sustained launch is confirmed or the
+    circular-buffer wrap point has been reached, since only launches before
+    the wrap count.
+    """
+
+    WRAP_JUMP_MS = -1000  # Backwards jump marking the circular-buffer wrap
+
+    def __init__(
+        self,
+        threshold_g: float,
+        window_size: int,
+        min_sustain_samples: int = 3,
+        min_sustain_ms: Optional[float] = None,
+    ):
+        self.threshold_g = threshold_g
+        self.window_size = window_size
+        self.min_sustain_samples = min_sustain_samples
+        self.min_sustain_ms = min_sustain_ms
+        # Centred window: rows before and after each smoothed row
+        self._before = window_size // 2
+        self._after = (window_size - 1) // 2
+
+        # Trailing rows kept between blocks, starting at global row _base
+        self._g = np.empty(0)
+        self._timestamps = np.empty(0)
+        self._base = 0
+        self._next_row = 0  # First row not yet smoothed
+        self._last_timestamp = np.nan
+
+        # Run still open at the end of the last block:
+        # [start, start timestamp, sum of g, peak g, first/last finite timestamp]
+        self._open_run: Optional[list] = None
+        # Finished runs, one array per block: start, end, sum, peak,
+        # first and last finite timestamp, start timestamp
+        self._runs: list = []
+
+        self.rows_seen = 0
+        self.wrap_index: Optional[int] = None
+        self.first_above_index = -1
+        self.first_above_timestamp = np.nan
+        self.sustained_index = -1
+        self.sustained_timestamp = np.nan
+        self.done = False
+
+    @property
+    def launch_index(self) -> int:
+        # First sustained launch, else the first row above threshold
+        if self.sustained_index != -1:
+            return self.sustained_index
+        return self.first_above_index
+
+    @property
+    def launch_timestamp(self) -> float:
+        if self.sustained_index != -1:
+            return self.sustained_timestamp
+        return self.first_above_timestamp
+
+    def feed(self, accel: np.ndarray, timestamps_ms: np.ndarray, final: bool = False):
+        """
+        Scan the next block of rows.
+
+        Args:
+            accel: Acceleration in m/s² (NaN = missing, read as 0)
+            timestamps_ms: Row timestamps in ms (NaN = missing)
+            final: True for the last block of the recording
+        """
+        if self.done:
+            return
+
+        if len(timestamps_ms) and self.wrap_index is None:
+            jumps = np.flatnonzero(
+                np.diff(timestamps_ms, prepend=self._last_timestamp) < self.WRAP_JUMP_MS
+            )
+            if len(jumps):
+                self.wrap_index = self.rows_seen + int(jumps[0])
+            self._last_timestamp = timestamps_ms[-1]
+
+        g_force = np.where(np.isnan(accel), 0.0, accel) / 9.8
+        self._g = np.concatenate([self._g, g_force])
+        self._timestamps = np.concatenate([self._timestamps, timestamps_ms])
+        self.rows_seen += len(accel)
+
+        # Rows whose whole window has been read, stopping at the wrap point
+        end_row = self.rows_seen if final else self.rows_seen - self._after
+        if self.wrap_index is not None:
+            end_row = min(end_row, self.wrap_index)
+        if end_row > self._next_row:
+            self._scan_rows(self._next_row, end_row)
+            self._next_row = end_row
+
+        if (
+            final
+            or self.sustained_index != -1
+            or (self.wrap_index is not None and self._next_row >= self.wrap_index)
+        ):
+            self._close_open_run()
+            self.done = True
+            return
+
+        # Keep just enough history for the next block's windows
+        keep_from = max(self._next_row - self._before, self._base)
+        self._g = self._g[keep_from - self._base :]
+        self._timestamps = self._timestamps[keep_from - self._base :]
+        self._base = keep_from
+
+    def finish(self):
+        """Mark the end of the recording, scanning any rows held back."""
+        self.feed(np.empty(0), np.empty(0), final=True)
+
+    def _smooth(self, start: int, end: int) -> np.ndarray:
+        # Centred moving average; rows whose window runs off either end of
+        # the recording keep their raw value.
+        smooth = self._g[start - self._base : end - self._base].copy()
+        first_full = max(start, self._before)
+        last_full = min(end, self.rows_seen - self._after)
+        if last_full > first_full:
+            window_values = self._g[
+                first_full - self._before - self._base : last_full
+                + self._after
+                - self._base
+            ]
+            smooth[first_full - start : last_full - start] = sliding_window_view(
+                window_values, self.window_size
+            ).mean(axis=1)
+        return smooth
+
+    def _is_sustained(self, lengths: np.ndarray, durations: np.ndarray) -> np.ndarray:
+        if self.min_sustain_ms is not None:
+            return durations >= self.min_sustain_ms
+        return lengths >= self.min_sustain_samples
+
+    def _scan_rows(self, start: int, end: int):
+        smooth = self._smooth(start, end)
+        above = smooth > self.threshold_g
+        timestamps = self._timestamps[start - self._base : end - self._base]
+        carried = self._open_run is not None
+
+        # Run boundaries from the edges of the mask; a run carried in from
+        # the previous block starts at position 0 of this one.
+        edges = np.diff(np.concatenate(([carried], above, [False])).astype(np.int8))
+        run_starts = np.flatnonzero(edges == 1)
+        if carried:
+            run_starts = np.concatenate(([0], run_starts))
+        run_ends = np.flatnonzero(edges == -1)
+        if not len(run_starts):
+            return
+
+        # Per-run sums, peaks and first/last finite timestamps in one pass
+        positions = np.arange(len(above))
+        timed = above & ~np.isnan(timestamps)
+        sums = np.add.reduceat(np.where(above, smooth, 0.0), run_starts)
+        peaks = np.maximum.reduceat(np.where(above, smooth, -np.inf), run_starts)
+        first_timed = np.minimum.reduceat(
+            np.where(timed, positions, len(above)), run_starts
+        )
+        last_timed = np.maximum.reduceat(np.where(timed, positions, -1), run_starts)
+        padded_timestamps = np.concatenate((timestamps, [np.nan]))
+        first_ts = padded_timestamps[first_timed]
+        last_ts = padded_timestamps[last_timed]
+        last_ts[last_timed < 0] = np.nan
+        start_ts = timestamps[run_starts]
+        run_starts = run_starts + start
+        run_ends = run_ends + start
+
+        if carried:
+            # Merge the first run into the run left open by the last block
+            run_start, run_start_ts, run_sum, run_peak, run_first, run_last = (
+                self._open_run
+            )
+            run_starts[0] = run_start
+            start_ts[0] = run_start_ts
+            sums[0] += run_sum
+            peaks[0] = max(peaks[0], run_peak)
+            if not np.isnan(run_first):
+                first_ts[0] = run_first
+            if np.isnan(last_ts[0]):
+                last_ts[0] = run_last
+            self._open_run = None
+
+        if self.first_above_index == -1:
+            self.first_above_index = int(run_starts[0])
+            self.first_above_timestamp = start_ts[0]
+
+        if self.sustained_index == -1:
+            sustained = self._is_sustained(run_ends - run_starts, last_ts - first_ts)
+            if sustained.any():
+                first = int(np.argmax(sustained))
+                self.sustained_index = int(run_starts[first])
+                self.sustained_timestamp = start_ts[first]
+
+        runs = np.column_stack(
+            (run_starts, run_ends, sums, peaks, first_ts, last_ts, start_ts)
+        )
+        if run_ends[-1] == end:
+            # The last run reaches the end of the block and may continue
+            self._open_run = [
+                int(run_starts[-1]),
+                start_ts[-1],
+                sums[-1],
+                peaks[-1],
+                first_ts[-1],
+                last_ts[-1],
+            ]
+            runs = runs[:-1]
+        if len(runs):
+            self._runs.append(runs)
+
+    def _close_open_run(self):
+        if self._open_run is None:
+            return
+        run_start, run_start_ts, run_sum, run_peak, run_first, run_last = self._open_run
+        self._runs.append(
+            np.array(
+                [
+                    [
+                        run_start,
+                        self._next_row,
+                        run_sum,
+                        run_peak,
+                        run_first,
+                        run_last,
+                        run_start_ts,
+                    ]
+                ]
+            )
+        )
+        self._open_run = None
+
+    def candidates(self, max_candidates: Optional[int] = None) -> List[LaunchCandidate]:
+        """Above-threshold runs scanned so far, most confident first"""
+        if not self._runs:
+            return []
+        runs = np.concatenate(self._runs)
+        starts, ends, sums, peaks, first_ts, last_ts, start_ts = runs.T
+        lengths = ends - starts
+        durations = last_ts - first_ts
+        means = sums / lengths
+
+        if self.min_sustain_ms:
+            sustain_score = durations / self.min_sustain_ms
+        elif self.min_sustain_ms is not None:
+            sustain_score = np.where(np.isnan(durations), 0.0, 1.0)
+        else:
+            sustain_score = lengths / self.min_sustain_samples
+        sustain_score = np.clip(np.nan_to_num(sustain_score), 0.0, 1.0)
+        margin_score = np.clip(
+            (means - self.threshold_g) / abs(self.threshold_g or 1.0), 0.0, 1.0
+        )
+        confidence = sustain_score * margin_score
+        sustained = self._is_sustained(lengths, durations)
+
+        # Stable sort, so equally confident runs stay in row order
+        order = np.argsort(-confidence, kind="stable")[:max_candidates]
+
+        return [
+            LaunchCandidate(
+                start_index=int(starts[idx]),
+                end_index=int(ends[idx]),
+                start_timestamp=(
+                    None if np.isnan(start_ts[idx]) else int(start_ts[idx])
+                ),
+                duration_ms=(
+                    None if np.isnan(durations[idx]) else float(durations[idx])
+                ),
+                mean_g=float(means[idx]),
+                peak_g=float(peaks[idx]),
+                sustained=bool(sustained[idx]),
+                confidence=float(confidence[idx]),
+            )
+            for idx in order.tolist()
+        ]
+
 
 class LaunchDetector:
     def __init__(
@@ -14,6 +364,8 @@ class LaunchDetector:
         window_size: int = 5,
         pre_launch_seconds: int = 10,
         use_all_post_launch: bool = True,
+        min_sustain_samples: int = 3,
+        min_sustain_ms: Optional[float] = None,
     ):
         self.threshold_g = (
             threshold_g  # Acceleration threshold for launch detection (in G)
@@ -23,232 +375,238 @@ class LaunchDetector:
         self.use_all_post_launch = (
             use_all_post_launch  # If True, uses all data after launch
         )
+        # A launch must stay above threshold for this many samples, or for
+        # this many milliseconds when min_sustain_ms is set
+        if min_sustain_samples < 1:
+            raise ValueError("min_sustain_samples must be at least 1")
+        self.min_sustain_samples = min_sustain_samples
+        self.min_sustain_ms = min_sustain_ms
+
+    def _new_scan(self) -> _LaunchScan:
+        return _LaunchScan(
+            self.threshold_g,
+            self.window_size,
+            self.min_sustain_samples,
+            self.min_sustain_ms,
+        )
 
-    def detect_launch_from_csv(
-        self, csv_file_path: str
-    ) -> Tuple[pd.DataFrame, int, int]:
+    def find_trim_bounds(self, df: pd.DataFrame) -> LaunchTrimBounds:
         """
-        Detect launch in CSV file and return trimmed DataFrame with launch info
-        Returns: (trimmed_df, launch_index, launch_timestamp)
+        Detect launch in an already-loaded table and return the bounds to keep,
+        without copying or writing the table.
         """
-        try:
-            # Read CSV file
-            df = pd.read_csv(csv_file_path)
-            df = self._normalize_timestamps_to_milliseconds(df)
-
-            # Find launch index
-            launch_index = self._find_launch_index(df)
-
-            if launch_index == -1:
-                print("No launch detected in CSV, using full dataset")
-                return df, 0, 0
-
-            # Get timestamps and trim around launch
-            trimmed_df = self._trim_around_launch(df, launch_index)
-
-            launch_timestamp = self._get_launch_timestamp(df, launch_index)
-
-            return trimmed_df, launch_index, launch_timestamp
-
-        except Exception as e:
-            print(f"Error processing CSV for launch detection: {e}")
-            import traceback
-
-            traceback.print_exc()
-            # Fallback: return original dataframe
-            df = pd.read_csv(csv_file_path)
-            df = self._normalize_timestamps_to_milliseconds(df)
-            return df, 0, 0
-
-    def _find_launch_index(self, df: pd.DataFrame) -> int:
-        """Find the index where launch occurs based on acceleration data"""
-        # Try different accelerometer column names
-        accel_columns = [
-            "ACCELEROMETER_Z",
-            "ACCELEROMETER_X",
-            "ACCELEROMETER_Y",
-            "ACCLZ",
-            "ACCLX",
-            "ACCLY",
-        ]
+        timestamp_data = self._timestamp_series_ms(df)
+        scan = self._scan_table(df, timestamp_data)
+        launch_index = scan.launch_index if scan is not None else -1
+        wrap_index = scan.wrap_index if scan is not None else None
+        if launch_index == -1:
+            print("No launch detected in CSV, using full dataset")
+            return LaunchTrimBounds(end_index=len(df), wrap_index=wrap_index)
+
+        if timestamp_data is not None:
+            launch_timestamp = timestamp_data.iloc[launch_index]
+            if not pd.isna(launch_timestamp):
+                return LaunchTrimBounds(
+                    launch_index=launch_index,
+                    launch_timestamp=int(launch_timestamp),
+                    start_timestamp=float(
+                        launch_timestamp - self.pre_launch_seconds * 1000
+                    ),
+                    # All data after launch is kept
+                    end_timestamp=float(timestamp_data.max()),
+                    wrap_index=wrap_index,
+                )
+
+        # Fallback: use index-based trimming
+        pre_launch_rows = min(
+            launch_index, self.pre_launch_seconds * 10
+        )  # Estimate 10 Hz data
+        return LaunchTrimBounds(
+            launch_index=launch_index,
+            start_index=max(0, launch_index - pre_launch_rows),
+            end_index=len(df),
+            wrap_index=wrap_index,
+        )
+
+    def _timestamp_series_ms(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        """First usable timestamp column, converted to milliseconds"""
+        for col in TIMESTAMP_KEYS:
+            if col not in df.columns or df[col].isna().all():
+                continue
+            timestamp_data = pd.to_numeric(df[col], errors="coerce")
+            if not timestamp_data.notna().any():
+                continue
+            multiplier_to_ms = infer_timestamp_multiplier_to_ms_array(
+                timestamp_data, max_samples=TIMESTAMP_INFERENCE_SAMPLES
+            )
+            return (timestamp_data * multiplier_to_ms).round()
+        return None
 
+    def _scan_table(
+        self, df: pd.DataFrame, timestamp_data: Optional[pd.Series] = None
+    ) -> Optional[_LaunchScan]:
+        """Run the launch scan over a whole table as a single block"""
         accel_data = None
-        for col in accel_columns:
+        for col in ACCEL_COLUMNS:
             if col in df.columns and not df[col].isna().all():
-                accel_data = pd.to_numeric(df[col], errors="coerce").fillna(0)
+                accel_data = pd.to_numeric(df[col], errors="coerce")
                 break
 
         if accel_data is None:
             print("No accelerometer data found for launch detection")
-            return -1
-
-        # Convert to G-force (assuming data is in m/s², 1G = 9.8 m/s²)
-        g_force = accel_data / 9.8
-
-        # Apply moving average to smooth data
-        g_force_smooth = (
-            g_force.rolling(window=self.window_size, center=True).mean().fillna(g_force)
-        )
-
-        # Find where acceleration exceeds threshold (indicating launch)
-        launch_mask = g_force_smooth > self.threshold_g
-
-        # Find the first sustained launch event (at least 3 consecutive points above threshold)
-        launch_indices = launch_mask[launch_mask].index.tolist()
-        if len(launch_indices) == 0:
-            print("No acceleration above threshold found")
-            return -1
+            return None
 
         # CRITICAL: Handle circular buffer wrap-around
         # Find timestamp discontinuities that indicate buffer wrap
-        timestamp_data = None
-
-        for col in TIMESTAMP_KEYS:
-            if col in df.columns and not df[col].isna().all():
-                timestamp_data = pd.to_numeric(df[col], errors="coerce")
-                if timestamp_data.notna().any():
-                    break
-
-        if timestamp_data is not None:
-            # Find where timestamps jump backwards (circular buffer wrap point)
-            time_diff = timestamp_data.diff()
-            # A large negative jump indicates wrap-around
-            wrap_points = time_diff[
-                time_diff < -1000
-            ].index.tolist()  # More than 1 second backwards
-
-            if wrap_points:
-                wrap_index = wrap_points[0]
-                # Only look for launch BEFORE the wrap point (in recent data)
-                launch_indices = [idx for idx in launch_indices if idx < wrap_index]
-
-                if not launch_indices:
-                    print("No launch found before circular buffer wrap point")
-                    return -1
-
-        # Find the first launch index with sustained acceleration
-        for i in range(len(launch_indices) - 2):
-            if (
-                launch_indices[i + 1] - launch_indices[i] == 1
-                and launch_indices[i + 2] - launch_indices[i + 1] == 1
-            ):
-                launch_index = launch_indices[i]
-                return launch_index
-
-        # Fallback: use the first launch detection
-        if launch_indices:
-            launch_index = launch_indices[0]
-            return launch_index
-
-        print("No sustained launch acceleration found")
-        return -1
-
-    def _get_launch_timestamp(self, df: pd.DataFrame, launch_index: int) -> int:
-        """Get the timestamp of launch"""
-        for col in TIMESTAMP_KEYS:
-            if col in df.columns and not df[col].isna().all():
-                try:
-                    timestamp = pd.to_numeric(
-                        df[col].iloc[launch_index], errors="coerce"
-                    )
-                    if not np.isnan(timestamp):
-                        return int(round(float(timestamp)))
-                except (ValueError, IndexError):
-                    continue
-
-        # If no timestamp found, return the index as fallback
-        return int(launch_index)
-
-    def _trim_around_launch(self, df: pd.DataFrame, launch_index: int) -> pd.DataFrame:
-        """Trim dataframe to show data around launch - includes all post-launch data"""
-        # Try to use timestamps for accurate trimming
-        timestamp_data = None
-        timestamp_col = None
-
-        for col in TIMESTAMP_KEYS:
-            if col in df.columns and not df[col].isna().all():
-                try:
+        if timestamp_data is None:
+            for col in TIMESTAMP_KEYS:
+                if col in df.columns and not df[col].isna().all():
                     timestamp_data = pd.to_numeric(df[col], errors="coerce")
                     if timestamp_data.notna().any():
-                        timestamp_col = col
                         break
-                except (ValueError, IndexError):
-                    continue
-
-        if timestamp_data is not None and timestamp_col:
-            # Use timestamps for accurate time-based trimming
-            launch_timestamp = timestamp_data.iloc[launch_index]
-
-            # Calculate pre-launch bound
-            pre_launch_bound = launch_timestamp - (self.pre_launch_seconds * 1000)
-
-            # Use all data after launch if flag is set
-            if self.use_all_post_launch:
-                post_launch_bound = timestamp_data.max()
-            else:
-                post_launch_bound = timestamp_data.max()
 
-            # Filter dataframe based on timestamps
-            mask = (timestamp_data >= pre_launch_bound) & (
-                timestamp_data <= post_launch_bound
-            )
-            trimmed_df = df[mask].copy()
+        if timestamp_data is not None:
+            timestamps = timestamp_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            timestamps = np.full(len(df), np.nan)
 
-            (launch_timestamp - timestamp_data[mask].min()) / 1000.0
-            (timestamp_data[mask].max() - launch_timestamp) / 1000.0
+        scan = self._new_scan()
+        scan.feed(
+            accel_data.to_numpy(dtype=np.float64, na_value=np.nan),
+            timestamps,
+            final=True,
+        )
+        self._report_scan(scan)
+        return scan
 
+    def find_launch_candidates(
+        self, df: pd.DataFrame, max_candidates: Optional[int] = None
+    ) -> List[LaunchCandidate]:
+        """
+        Every above-threshold run before the circular-buffer wrap point,
+        most confident first.
+        """
+        scan = self._scan_table(df, self._timestamp_series_ms(df))
+        if scan is None:
+            return []
+        return scan.candidates(max_candidates)
+
+    @staticmethod
+    def _report_scan(scan: _LaunchScan):
+        if scan.launch_index != -1:
+            return
+        if scan.wrap_index is not None:
+            print("No launch found before circular buffer wrap point")
         else:
-            # Fallback: use index-based trimming
-            total_rows = len(df)
-            pre_launch_rows = min(
-                launch_index, self.pre_launch_seconds * 10
-            )  # Estimate 10 Hz data
-
-            start_index = max(0, launch_index - pre_launch_rows)
-
-            # Use all data to end of file if flag is set
-            if self.use_all_post_launch:
-                end_index = total_rows
-                print(
-                    f"Using all data from index {start_index} to end of file (row {total_rows})"
-                )
-            else:
-                end_index = total_rows
-
-            trimmed_df = df.iloc[start_index:end_index].copy()
+            print("No acceleration above threshold found")
 
-        # Reset index for clean data
-        trimmed_df = trimmed_df.reset_index(drop=True)
-        return trimmed_df
+    def scan_csv_for_launch(
+        self, csv_file_path: str, chunk_rows: int = DEFAULT_SCAN_CHUNK_ROWS
+    ) -> LaunchTrimBounds:
+        """
+        Detect launch by streaming a CSV in blocks of ``chunk_rows`` rows.
+
+        Only the accelerometer and timestamp columns are read, and reading
+        stops once a sustained launch is confirmed or the circular-buffer
+        wrap point is passed, so memory is bounded by the block size and the
+        time taken grows with how far into the file launch is. Because the
+        end of the file is never read, time-based bounds are open-ended.
+
+        Unlike find_trim_bounds(), the accelerometer and timestamp columns
+        are picked from the first block that has values in them, and the
+        timestamp unit is inferred from that block alone. first_row is set to
+        the first block that may hold rows inside the bounds.
+        """
+        header = list(pd.read_csv(csv_file_path, nrows=0).columns)
+        accel_candidates = [col for col in ACCEL_COLUMNS if col in header]
+        timestamp_candidates = [col for col in TIMESTAMP_KEYS if col in header]
+        if not accel_candidates:
+            print("No accelerometer data found for launch detection")
+            return LaunchTrimBounds()
 
-    def _normalize_timestamps_to_milliseconds(self, df: pd.DataFrame) -> pd.DataFrame:
-        normalized_df = df.copy()
+        scan = self._new_scan()
+        accel_col = None
+        timestamp_col = None
+        multiplier_to_ms = None
+        # First row and latest timestamp of each block read (inf when a
+        # timestamp is missing), to find the blocks before the bounds
+        block_rows = []
+        block_latest = []
+
+        with pd.read_csv(
+            csv_file_path,
+            usecols=accel_candidates + timestamp_candidates,
+            chunksize=chunk_rows,
+            low_memory=False,
+        ) as reader:
+            for chunk in reader:
+                if accel_col is None:
+                    accel_col = next(
+                        (col for col in accel_candidates if chunk[col].notna().any()),
+                        None,
+                    )
+                accel = np.full(len(chunk), np.nan)
+                if accel_col is not None:
+                    accel = pd.to_numeric(chunk[accel_col], errors="coerce").to_numpy(
+                        dtype=np.float64, na_value=np.nan
+                    )
 
-        for col in TIMESTAMP_KEYS:
-            if col not in normalized_df.columns:
-                continue
+                timestamps = np.full(len(chunk), np.nan)
+                for col in [timestamp_col] if timestamp_col else timestamp_candidates:
+                    values = pd.to_numeric(chunk[col], errors="coerce").to_numpy(
+                        dtype=np.float64, na_value=np.nan
+                    )
+                    if timestamp_col is None and np.isnan(values).all():
+                        continue
+                    timestamp_col = col
+                    if multiplier_to_ms is None:
+                        multiplier_to_ms = infer_timestamp_multiplier_to_ms_array(
+                            values, max_samples=TIMESTAMP_INFERENCE_SAMPLES
+                        )
+                    timestamps = np.round(values * multiplier_to_ms)
+                    break
 
-            timestamp_data = pd.to_numeric(normalized_df[col], errors="coerce")
-            if not timestamp_data.notna().any():
-                continue
+                block_rows.append(scan.rows_seen)
+                block_latest.append(
+                    np.inf if np.isnan(timestamps).any() else timestamps.max()
+                )
+                scan.feed(accel, timestamps)
+                if scan.done:
+                    break
+            else:
+                scan.finish()
 
-            multiplier_to_ms = infer_timestamp_multiplier_to_ms(timestamp_data.tolist())
-            converted_timestamps = (timestamp_data * multiplier_to_ms).round()
-            normalized_df[col] = converted_timestamps.astype("Int64")
+        if accel_col is None:
+            print("No accelerometer data found for launch detection")
+            return LaunchTrimBounds()
 
-        return normalized_df
+        self._report_scan(scan)
+        if scan.launch_index == -1:
+            return LaunchTrimBounds(wrap_index=scan.wrap_index)
 
-    def create_trimmed_csv(self, original_csv_path: str, output_csv_path: str) -> bool:
-        """Create a trimmed CSV file around launch"""
-        try:
-            trimmed_df, launch_index, launch_timestamp = self.detect_launch_from_csv(
-                original_csv_path
+        print(
+            f"Launch detected at row {scan.launch_index} "
+            f"after reading {scan.rows_seen} rows"
+        )
+        launch_timestamp = scan.launch_timestamp
+        if not np.isnan(launch_timestamp):
+            start_timestamp = float(launch_timestamp - self.pre_launch_seconds * 1000)
+            # Blocks are skippable up to the first one reaching the window
+            reaches_window = np.asarray(block_latest) >= start_timestamp
+            first_block = int(np.argmax(reaches_window)) if reaches_window.any() else 0
+            return LaunchTrimBounds(
+                launch_index=scan.launch_index,
+                launch_timestamp=int(launch_timestamp),
+                start_timestamp=start_timestamp,
+                wrap_index=scan.wrap_index,
+                first_row=block_rows[first_block],
             )
 
-            # Save trimmed CSV
-            trimmed_df.to_csv(output_csv_path, index=False)
-            return True
-
-        except Exception as e:
-            print(f"Error creating trimmed CSV: {e}")
-            return False
+        pre_launch_rows = min(scan.launch_index, self.pre_launch_seconds * 10)
+        start_index = max(0, scan.launch_index - pre_launch_rows)
+        return LaunchTrimBounds(
+            launch_index=scan.launch_index,
+            start_index=start_index,
+            wrap_index=scan.wrap_index,
+            first_row=start_index,
+        )
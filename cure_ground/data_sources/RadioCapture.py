@@ -0,0 +1,147 @@
+"""
+Raw radio byte capture files.
+
+A capture stores every chunk read from the radio serial port, unmodified,
+together with the time it was received, so a session can be fed back through
+the packet decoder byte for byte.
+
+Each capture session writes its own file, named after the requested path
+plus the session's start time, so reconnecting never overwrites an earlier
+session.
+
+File layout (little-endian):
+    magic b"CURERAW1" (8) | capture start unix time f64 (8)
+    repeated records: receive offset f64 seconds (8) | length u32 (4) | bytes
+"""
+
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, List, Optional
+
+import numpy as np
+
+CAPTURE_MAGIC = b"CURERAW1"
+FILE_HEADER = struct.Struct("<8sd")
+RECORD_HEADER = struct.Struct("<dI")
+
+
+def session_capture_path(path: str, start_time: Optional[float] = None) -> str:
+    """
+    File name for a capture session started at ``start_time`` (default now):
+    ``path`` with the local start time before the extension, plus a counter
+    if that file already exists.
+    """
+    stem, extension = os.path.splitext(path)
+    stamp = time.strftime("%m-%d-%y_%H-%M-%S", time.localtime(start_time))
+    candidate = f"{stem}_{stamp}{extension}"
+    counter = 1
+    while os.path.exists(candidate):
+        candidate = f"{stem}_{stamp}_{counter}{extension}"
+        counter += 1
+    return candidate
+
+
+class RadioCaptureWriter:
+    """Appends raw serial reads to a new capture file."""
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            FileExistsError: If ``path`` already exists; captures are never
+                overwritten.
+        """
+        self.path = path
+        self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
+        self._file: Optional[BinaryIO] = open(path, "xb")
+        self._file.write(FILE_HEADER.pack(CAPTURE_MAGIC, self.start_time))
+
+        # --- Counters ---
+        self.bytes_captured = 0
+        self.records_written = 0
+
+    def write(self, data: bytes, receive_monotonic: Optional[float] = None):
+        """Record one chunk of received bytes."""
+        if self._file is None or not data:
+            return
+        if receive_monotonic is None:
+            receive_monotonic = time.monotonic()
+
+        offset = receive_monotonic - self._start_monotonic
+        self._file.write(RECORD_HEADER.pack(offset, len(data)))
+        self._file.write(data)
+        self.bytes_captured += len(data)
+        self.records_written += 1
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+
+@dataclass
+class RadioCapture:
+    """A capture file loaded into memory."""
+
+    start_time: float
+    # Seconds since the capture started, one per chunk
+    offsets: np.ndarray
+    chunks: List[bytes] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @property
+    def duration(self) -> float:
+        return float(self.offsets[-1]) if len(self.offsets) else 0.0
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+def read_radio_capture(path: str) -> RadioCapture:
+    """
+    Load a capture file.
+
+    A record cut short by an interrupted session is ignored.
+
+    Raises:
+        ValueError: If the file is not a radio capture.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < FILE_HEADER.size:
+        raise ValueError(f"{path} is too short to be a radio capture")
+    magic, start_time = FILE_HEADER.unpack_from(data, 0)
+    if magic != CAPTURE_MAGIC:
+        raise ValueError(f"{path} is not a radio capture file")
+
+    offsets: List[float] = []
+    chunks: List[bytes] = []
+    pos = FILE_HEADER.size
+    while pos + RECORD_HEADER.size <= len(data):
+        offset, length = RECORD_HEADER.unpack_from(data, pos)
+        pos += RECORD_HEADER.size
+        if pos + length > len(data):
+            break
+        offsets.append(offset)
+        chunks.append(data[pos : pos + length])
+        pos += length
+
+    return RadioCapture(
+        start_time=start_time,
+        offsets=np.asarray(offsets, dtype=np.float64),
+        chunks=chunks,
+    )
@@ -5,7 +5,7 @@ Parses radio telemetry data and provides it in a format compatible with StatusMo
 Location: cure_ground/data_sources/radio_data_source.py
 """
 
-import struct
+import threading
 import time
 from typing import Dict, List, Optional, Any
 import serial
@@ -17,16 +17,29 @@ from cure_ground.core.protocols.data_names.data_name_loader import (
 )
 from cure_ground.core.protocols.states.states_loader import load_states, States
 from cure_ground.data_sources import DataSource
+from cure_ground.data_sources.RadioCapture import (
+    RadioCaptureWriter,
+    session_capture_path,
+)
+from cure_ground.data_sources.RadioPacketDecoder import (
+    RadioPacketBatch,
+    RadioPacketDecoder,
+)
+from cure_ground.data_sources.RxRingBuffer import RxRingBuffer
 
 
 class RadioDataSource(DataSource):
     """Handles radio telemetry data reception and parsing."""
 
-    START_SEQUENCE = b"\x00\x00\x00\x33"
-    END_SEQUENCE = b"\x00\x00\x00\x34"
+    START_SEQUENCE = RadioPacketDecoder.START_SEQUENCE
+    END_SEQUENCE = RadioPacketDecoder.END_SEQUENCE
     MAX_RX_BUFFER_BYTES = 65536
     RECONNECT_INTERVAL_SECONDS = 1.0
     STALE_LINK_TIMEOUT_SECONDS = 5.0
+    # Decoded batches held for get_data() in threaded mode; oldest are dropped.
+    READER_QUEUE_MAX_BATCHES = 1024
+    # Decoded batches kept for get_batch(); oldest are dropped if nobody reads.
+    PENDING_MAX_BATCHES = 1024
 
     def __init__(
         self,
@@ -35,6 +48,8 @@ class RadioDataSource(DataSource):
         timeout: int = 1,
         protocol_version: int = 3,
         states_version: int = 1,
+        threaded: bool = False,
+        capture_path: Optional[str] = None,
     ):
         """
         Initialize the radio data source.
@@ -45,6 +60,11 @@ class RadioDataSource(DataSource):
             timeout: Serial read timeout in seconds
             protocol_version: Data names YAML version to load
             states_version: States YAML version to load
+            threaded: Read and decode packets on a background thread so
+                ingest does not depend on how often get_data() is called
+            capture_path: Tee every raw byte read from the port to a capture
+                file (see RadioCapture) while connected; each session writes
+                this path with its start time added to the name
         """
         self.port = port
         self.baudrate = baudrate
@@ -60,29 +80,42 @@ class RadioDataSource(DataSource):
         self.data_names: DataNames = load_data_name_enum(protocol_version)
         self.states: States = load_states(states_version)
 
-        # Identify group IDs (multi-value packets) from data_names
-        self.group_ids = set()
-        self.group_component_mapping = {}  # Maps group ID to component IDs
-
-        for item in self.data_names.data_definitions:
-            if item.get("type") == "group":
-                group_id = item["id"]
-                self.group_ids.add(group_id)
-                # Store the component IDs for this group
-                if "data" in item:
-                    self.group_component_mapping[group_id] = item["data"]
+        # Precompiled per-ID layout table used to decode packet bursts
+        self.decoder = RadioPacketDecoder(self.data_names)
 
         # Store latest packet data for get_data()
         self.latest_data: Dict[str, str] = {}
         self.last_packet_time = 0
 
+        # Every decoded packet since the last get_batch() call
+        self._pending_batches: deque = deque(maxlen=self.PENDING_MAX_BATCHES)
+
         # --- Rolling 100-packet retention tracking ---
         self._last_packet_number: Optional[int] = None
         self._packet_window = deque(maxlen=100)  # last 100 packet results
         self._packet_retention_ratio = 1.0
 
         # Rolling serial RX buffer for chunked / delayed packet arrival.
-        self._rx_buffer = bytearray()
+        self._rx_buffer = RxRingBuffer(
+            self.MAX_RX_BUFFER_BYTES, sync_sequence=self.START_SEQUENCE
+        )
+        # Guards the RX buffer and port open/close against the reader thread.
+        self._io_lock = threading.RLock()
+
+        # --- Threaded ingest ---
+        self.threaded = threaded
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
+        # deque append/popleft are atomic, so the reader and GUI threads can
+        # share it without a lock.
+        self._batch_queue: deque = deque(maxlen=self.READER_QUEUE_MAX_BATCHES)
+        self._dropped_batches = 0
+
+        # --- Raw byte capture ---
+        self.capture_path = capture_path
+        # File written by the current or most recent capture session
+        self.capture_file: Optional[str] = None
+        self._capture: Optional[RadioCaptureWriter] = None
 
     def connect(self, port: Optional[str] = None) -> bool:
         """
@@ -96,44 +129,100 @@ class RadioDataSource(DataSource):
 
         self._desired_connection = True
         self._last_connect_attempt_monotonic = time.monotonic()
-        return self._open_serial_port()
+        connected = self._open_serial_port()
+        if self.capture_path and self._capture is None:
+            self.start_capture(self.capture_path)
+        if self.threaded:
+            # The reader idles while the port is closed, so it can outlive a
+            # failed first attempt and pick up after a reconnect.
+            self._start_reader_thread()
+        return connected
 
     def _open_serial_port(self) -> bool:
-        self._close_serial_port()
+        with self._io_lock:
+            self._close_serial_port()
 
-        try:
-            self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
-            self.ser.flush()
-            self.ser.reset_input_buffer()
-            self._reset_runtime_state()
-            self._rx_buffer.clear()
-            self._connected = True
-            print(f"RadioDataSource: Connected to {self.port} at {self.baudrate} baud")
-            return True
-        except (serial.SerialException, OSError) as exc:
-            self._connected = False
-            self.ser = None
-            print(f"RadioDataSource: Failed to connect to {self.port}: {exc}")
-            return False
+            try:
+                self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+                self.ser.flush()
+                self.ser.reset_input_buffer()
+                self._reset_runtime_state()
+                self._rx_buffer.clear()
+                self._connected = True
+                print(
+                    f"RadioDataSource: Connected to {self.port} at {self.baudrate} baud"
+                )
+                return True
+            except (serial.SerialException, OSError) as exc:
+                self._connected = False
+                self.ser = None
+                print(f"RadioDataSource: Failed to connect to {self.port}: {exc}")
+                return False
 
     def disconnect(self):
         """Close serial connection."""
         self._desired_connection = False
         self._close_serial_port()
+        self._stop_reader_thread()
+        self.stop_capture()
         self._reset_runtime_state()
+        self._batch_queue.clear()
+        self._pending_batches.clear()
         self.latest_data = {}
         self.last_packet_time = 0
         print("RadioDataSource: Disconnected from serial port")
 
     def _close_serial_port(self):
-        if self.ser and self.ser.is_open:
-            try:
-                self.ser.close()
-            except (serial.SerialException, OSError):
-                pass
-        self.ser = None
-        self._rx_buffer.clear()
-        self._connected = False
+        with self._io_lock:
+            if self.ser and self.ser.is_open:
+                try:
+                    self.ser.close()
+                except (serial.SerialException, OSError):
+                    pass
+            self.ser = None
+            self._rx_buffer.clear()
+            self._connected = False
+
+    def _start_reader_thread(self):
+        if self._reader_thread is not None and self._reader_thread.is_alive():
+            return
+
+        self._reader_stop.clear()
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop, name="RadioDataSourceReader", daemon=True
+        )
+        self._reader_thread.start()
+
+    def _stop_reader_thread(self):
+        self._reader_stop.set()
+        thread = self._reader_thread
+        if thread is not None and thread is not threading.current_thread():
+            # Closing the port unblocks a pending read; the timeout bounds the wait.
+            thread.join(timeout=max(float(self.timeout), 0.1) + 1.0)
+        self._reader_thread = None
+
+    def _reader_loop(self):
+        """
+        Background ingest: block on the port, frame packets and queue batches.
+
+        Reconnects are still driven by is_connected() on the caller's thread;
+        while the port is closed the reader just idles.
+        """
+        while not self._reader_stop.is_set():
+            if self.ser is None or not self.ser.is_open:
+                self._reader_stop.wait(0.05)
+                continue
+
+            if not self._ingest_available_bytes(block=True):
+                continue
+
+            batch = self._decode_buffered_packets()
+            if not len(batch):
+                continue
+
+            if len(self._batch_queue) == self._batch_queue.maxlen:
+                self._dropped_batches += 1
+            self._batch_queue.append(batch)
 
     def _reset_runtime_state(self):
         self._last_packet_number = None
@@ -142,10 +231,22 @@ class RadioDataSource(DataSource):
         self._last_radio_activity_monotonic = time.monotonic()
         self._received_data_since_connect = False
 
-    def _mark_connection_lost(self, reason: str):
-        if self._connected:
-            print(f"RadioDataSource: Connection lost ({reason}); will retry")
-        self._close_serial_port()
+    def _mark_connection_lost(self, reason: str, ser: Optional[serial.Serial] = None):
+        """
+        Close the port after a failure.
+
+        Args:
+            reason: Printed with the connection-lost message
+            ser: Port the failure happened on; ignored if it has already been
+                replaced, so a reader still holding an old port cannot close
+                the one opened by a reconnect
+        """
+        with self._io_lock:
+            if ser is not None and self.ser is not ser:
+                return
+            if self._connected:
+                print(f"RadioDataSource: Connection lost ({reason}); will retry")
+            self._close_serial_port()
 
     def _maybe_reconnect(self) -> bool:
         if not self._desired_connection:
@@ -191,230 +292,172 @@ class RadioDataSource(DataSource):
         if not self.is_connected():
             return None
 
-        self._ingest_available_bytes()
-
-        # Process all complete packets currently in the buffer.
-        while True:
-            packet = self._read_packet()
-            if not packet:
-                break
-            self._update_latest_data(packet)
+        self._poll_packets()
 
         # Return the latest data we have (even if packet read failed)
         return self.latest_data if self.latest_data else None
 
-    def _update_latest_data(self, packet: Dict):
+    def get_batch(self) -> Optional[RadioPacketBatch]:
         """
-        Convert raw packet data to StatusModel format.
-        Updates self.latest_data with new values.
+        Get every packet decoded since the previous call.
 
-        Args:
-            packet: Raw packet from _read_packet()
+        Unlike get_data(), which only exposes the newest value of each field,
+        this keeps one row per packet so full-rate data can be recorded and
+        plotted.
+
+        Returns:
+            Columnar batch (possibly empty), or None if not connected
         """
-        timestamp_ms = packet["timestamp"]
-        self.latest_data["TIMESTAMP"] = f"{timestamp_ms}"
-        self.latest_data["NUM_PACKETS_SENT"] = str(int(packet["packet_number"]))
-        self.last_packet_time = int(time.time() * 1000)
+        if not self.is_connected():
+            return None
 
-        # Process each data entry in the packet
-        for entry in packet["data"]:
-            data_id = entry["id"]
+        self._poll_packets()
 
-            try:
-                info = self.data_names.get_info_by_id(data_id)
-                name = info["name"]
-
-                if data_id in self.group_ids:
-                    # Group type - unpack into individual components
-                    component_ids = self.group_component_mapping.get(data_id, [])
-                    values = entry["values"]
-
-                    for i, (comp_id, value) in enumerate(zip(component_ids, values)):
-                        try:
-                            comp_info = self.data_names.get_info_by_id(comp_id)
-                            comp_name = comp_info["name"]
-                            self.latest_data[comp_name] = value
-                        except (KeyError, IndexError):
-                            pass
-                else:
-                    self.latest_data[name] = entry["float_value"]
-
-            except KeyError:
-                # Unknown ID - skip it
-                pass
-
-    def _ingest_available_bytes(self):
-        """
-        Pull all currently available serial bytes into the RX buffer.
-        """
-        assert self.ser is not None, "Serial connection not established"
+        batches = list(self._pending_batches)
+        self._pending_batches.clear()
+        if not batches:
+            return self.decoder.empty_batch()
+        return RadioPacketBatch.concat(batches)
 
-        try:
-            available = self.ser.in_waiting
-        except (serial.SerialException, OSError) as exc:
-            self._mark_connection_lost(f"failed to check bytes waiting: {exc}")
-            return
+    def _poll_packets(self):
+        """Pull newly decoded packets into latest_data and the pending batches."""
+        if self.threaded:
+            # The reader thread owns the port; just drain what it decoded.
+            while self._batch_queue:
+                self._apply_packet_batch(self._batch_queue.popleft())
+        else:
+            self._ingest_available_bytes()
 
-        if available <= 0:
-            return
+            # Decode all complete packets currently in the buffer in one pass.
+            batch = self._decode_buffered_packets()
+            if len(batch):
+                self._apply_packet_batch(batch)
 
-        try:
-            new_bytes = self.ser.read(available)
-        except (serial.SerialException, OSError) as exc:
-            self._mark_connection_lost(f"failed while reading serial bytes: {exc}")
-            return
+    def _apply_packet_batch(self, batch: RadioPacketBatch):
+        """
+        Fold a decoded packet batch into self.latest_data and link statistics.
 
-        if not new_bytes:
-            return
+        Args:
+            batch: Packets decoded from the RX buffer, oldest first
+        """
+        for packet_number in batch.packet_numbers.tolist():
+            self._update_packet_retention(packet_number)
+
+        self._pending_batches.append(batch)
 
-        self._rx_buffer.extend(new_bytes)
+        self.latest_data.update(batch.latest_status())
+        self.last_packet_time = int(time.time() * 1000)
         self._last_radio_activity_monotonic = time.monotonic()
         self._received_data_since_connect = True
 
-        # Guard against unbounded growth while preserving best-effort sync data.
-        if len(self._rx_buffer) > self.MAX_RX_BUFFER_BYTES:
-            start_idx = self._rx_buffer.rfind(self.START_SEQUENCE)
-            if start_idx > 0:
-                del self._rx_buffer[:start_idx]
-
-            if len(self._rx_buffer) > self.MAX_RX_BUFFER_BYTES:
-                del self._rx_buffer[: -self.MAX_RX_BUFFER_BYTES]
-
-    def _align_buffer_to_start_sequence(self) -> bool:
+    def _ingest_available_bytes(self, block: bool = False) -> bool:
         """
-        Align buffer start to the start sequence.
+        Pull all currently available serial bytes into the RX buffer.
+
+        Args:
+            block: Wait up to the serial timeout for at least one byte
 
         Returns:
-            True if start sequence is present at buffer index 0.
+            True if any new bytes were added to the buffer.
         """
-        start_idx = self._rx_buffer.find(self.START_SEQUENCE)
-        if start_idx == -1:
-            # Keep only a short suffix so split start markers can still match later.
-            keep_tail = len(self.START_SEQUENCE) - 1
-            if len(self._rx_buffer) > keep_tail:
-                del self._rx_buffer[:-keep_tail]
+        ser = self.ser
+        if ser is None:
+            # Closed by another thread since the caller checked
+            return False
+
+        try:
+            available = ser.in_waiting
+        except (serial.SerialException, OSError, TypeError) as exc:
+            self._mark_connection_lost(f"failed to check bytes waiting: {exc}", ser)
+            return False
+
+        if available <= 0 and not block:
+            return False
+
+        try:
+            new_bytes = ser.read(max(available, 1))
+        except (serial.SerialException, OSError, TypeError) as exc:
+            self._mark_connection_lost(f"failed while reading serial bytes: {exc}", ser)
             return False
 
-        if start_idx > 0:
-            del self._rx_buffer[:start_idx]
+        if not new_bytes:
+            return False
+
+        receive_monotonic = time.monotonic()
+        with self._io_lock:
+            # Bytes read from a port closed by a reconnect are stale; the RX
+            # buffer now belongs to the new port.
+            if self.ser is not ser:
+                return False
+
+            if self._capture is not None:
+                try:
+                    self._capture.write(new_bytes, receive_monotonic)
+                except OSError as exc:
+                    print(f"RadioDataSource: Error writing capture, stopping: {exc}")
+                    self._capture.close()
+                    self._capture = None
+
+            # The ring buffer trims to MAX_RX_BUFFER_BYTES on overflow while
+            # preserving best-effort sync data.
+            self._rx_buffer.extend(new_bytes)
+            self._last_radio_activity_monotonic = receive_monotonic
+            self._received_data_since_connect = True
 
         return True
 
-    def _parse_data_entry(self, data_id: int, data_bytes: bytes) -> Dict:
+    def start_capture(self, path: str) -> bool:
         """
-        Parse a single data entry.
+        Start teeing raw serial bytes to a new capture file.
 
         Args:
-            data_id: The sensor/data ID
-            data_bytes: Raw data bytes
+            path: Capture path; the file written is this path with the
+                session start time added (see session_capture_path)
 
         Returns:
-            Dictionary with parsed data
+            True if the capture file was opened
         """
-        result = {"id": data_id}
-
-        if data_id in self.group_ids:
-            # Group type: 12 bytes = 3 floats (little-endian)
-            float_values = []
-            for i in range(3):
-                byte_data = bytes(
-                    [
-                        data_bytes[i * 4 + 3],
-                        data_bytes[i * 4 + 2],
-                        data_bytes[i * 4 + 1],
-                        data_bytes[i * 4],
-                    ]
+        with self._io_lock:
+            self.stop_capture()
+            capture_file = session_capture_path(path)
+            try:
+                self._capture = RadioCaptureWriter(capture_file)
+            except OSError as exc:
+                print(
+                    "RadioDataSource: Failed to open capture file "
+                    f"{capture_file}: {exc}"
                 )
-                float_value = struct.unpack("<f", byte_data)[0]
-                float_values.append(float_value)
-            result["values"] = float_values
-        else:
-            # Single value: 4 bytes (big-endian)
-            float_value = struct.unpack(">f", data_bytes)[0]
-            result["float_value"] = float_value
+                return False
+            self.capture_path = path
+            self.capture_file = capture_file
+            print(f"RadioDataSource: Capturing raw bytes to {capture_file}")
+            return True
 
-        return result
+    def stop_capture(self):
+        """Close the capture file, if one is open."""
+        with self._io_lock:
+            if self._capture is not None:
+                self._capture.close()
+                self._capture = None
 
-    def _extract_next_packet_from_buffer(self) -> Optional[Dict]:
+    def _decode_buffered_packets(self) -> RadioPacketBatch:
         """
-        Parse one complete packet from RX buffer if available.
+        Decode every complete packet in the RX buffer and drop the consumed bytes.
 
         Returns:
-            Parsed packet dict when complete packet is present, else None.
+            Batch of decoded packets (empty when no complete packet is buffered).
         """
-        if not self._align_buffer_to_start_sequence():
-            return None
-
-        # start(4) + timestamp(4) + packet_number(4)
-        if len(self._rx_buffer) < 12:
-            return None
-
-        try:
-            timestamp = struct.unpack(">I", bytes(self._rx_buffer[4:8]))[0]
-            packet_number = struct.unpack(">I", bytes(self._rx_buffer[8:12]))[0]
-        except struct.error as e:
-            print(f"RadioDataSource: Error parsing packet header: {e}")
-            del self._rx_buffer[:1]
-            return None
-
-        cursor = 12
-        packet_data: List[Dict] = []
-
-        while True:
-            remaining = len(self._rx_buffer) - cursor
-            if remaining < 4:
-                return None
-
-            if bytes(self._rx_buffer[cursor : cursor + 4]) == self.END_SEQUENCE:
-                packet_end = cursor + 4
-                del self._rx_buffer[:packet_end]
-                self._update_packet_retention(packet_number)
-                self._last_radio_activity_monotonic = time.monotonic()
-                self._received_data_since_connect = True
-                return {
-                    "timestamp": timestamp,
-                    "packet_number": packet_number,
-                    "data": packet_data,
-                    "receive_time": int(time.time() * 1000),
-                }
-
-            data_id = self._rx_buffer[cursor]
-            expected_length = 12 if data_id in self.group_ids else 4
-            entry_total = 1 + expected_length
-
-            if remaining < entry_total:
-                return None
-
-            data_bytes = bytes(
-                self._rx_buffer[cursor + 1 : cursor + 1 + expected_length]
-            )
-
+        with self._io_lock:
             try:
-                parsed_data = self._parse_data_entry(data_id, data_bytes)
-                packet_data.append(parsed_data)
+                batch, consumed = self.decoder.decode(*self._rx_buffer.region())
             except Exception as e:
-                print(f"RadioDataSource: Error parsing data ID {data_id}: {e}")
-                # Drop one byte and resync on next iteration.
-                del self._rx_buffer[:1]
-                return None
+                print(f"RadioDataSource: Error decoding packets: {e}")
+                # Drop one byte and resync on the next call.
+                self._rx_buffer.consume(1)
+                return self.decoder.empty_batch()
 
-            cursor += entry_total
-
-    def _read_packet(self) -> Optional[Dict]:
-        """
-        Read a complete radio packet.
-
-        Returns:
-            Dictionary containing timestamp and parsed data, or None if no packet
-        """
-        if not self.is_connected():
-            return None
-
-        try:
-            return self._extract_next_packet_from_buffer()
-        except Exception as e:
-            print(f"RadioDataSource: Error reading packet: {e}")
-            return None
+            self._rx_buffer.consume(consumed)
+            return batch
 
     def send_command(self, command: str, add_newline: bool = True) -> bool:
         if not self.is_connected() or self.ser is None:
@@ -447,8 +490,9 @@ class RadioDataSource(DataSource):
         diff = packet_number - self._last_packet_number
 
         if diff > 1:
-            # Missed packets → add zeros
-            for _ in range(diff - 1):
+            # Missed packets → add zeros. The window only keeps maxlen
+            # entries, so a corrupt packet number cannot stall this loop.
+            for _ in range(min(diff - 1, self._packet_window.maxlen)):
                 self._packet_window.append(0)
 
         # Current packet received
@@ -468,6 +512,14 @@ class RadioDataSource(DataSource):
     def get_packet_retention_ratio(self) -> float:
         return self._packet_retention_ratio
 
+    def get_reader_stats(self) -> Dict[str, int]:
+        """Reader queue depth, overflow count and raw bytes captured."""
+        return {
+            "queued_batches": len(self._batch_queue),
+            "dropped_batches": self._dropped_batches,
+            "captured_bytes": self._capture.bytes_captured if self._capture else 0,
+        }
+
     def get_available_ports(self) -> List[str]:
         """
         Get list of available serial ports.
@@ -0,0 +1,282 @@
+"""
+Batch decoder for radio telemetry packets.
+
+Frames every complete packet currently held in a receive buffer and decodes
+the whole burst at once with NumPy, returning columnar arrays instead of one
+dict per packet.
+
+Packet layout (all multi-byte values big-endian):
+    start sequence (4) | timestamp u32 (4) | packet number u32 (4)
+    repeated entries: id u8 (1) + float32 per value (4 single / 12 group)
+    end sequence (4)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from cure_ground.core.functions.sync_scanner import find_sync
+from cure_ground.core.protocols.data_names.data_name_loader import DataNames
+
+BufferLike = Union[bytes, bytearray]
+
+# start(4) + timestamp(4) + packet_number(4)
+HEADER_DTYPE = np.dtype(
+    [("start", ">u4"), ("timestamp", ">u4"), ("packet_number", ">u4")]
+)
+VALUE_DTYPE = np.dtype(">f4")
+
+
+@dataclass
+class RadioPacketBatch:
+    """
+    Columnar view of a burst of decoded packets.
+
+    ``values`` has one row per packet and one column per entry in ``columns``.
+    Cells for values that were not present in a packet are NaN.
+    """
+
+    timestamps: np.ndarray
+    packet_numbers: np.ndarray
+    columns: List[str]
+    values: np.ndarray
+
+    @classmethod
+    def empty(cls, columns: List[str]) -> "RadioPacketBatch":
+        return cls(
+            timestamps=np.empty(0, dtype=np.uint32),
+            packet_numbers=np.empty(0, dtype=np.uint32),
+            columns=list(columns),
+            values=np.empty((0, len(columns)), dtype=np.float32),
+        )
+
+    @classmethod
+    def concat(cls, batches: List["RadioPacketBatch"]) -> "RadioPacketBatch":
+        """Stack batches that share the same columns, oldest first."""
+        if len(batches) == 1:
+            return batches[0]
+        return cls(
+            timestamps=np.concatenate([batch.timestamps for batch in batches]),
+            packet_numbers=np.concatenate([batch.packet_numbers for batch in batches]),
+            columns=list(batches[0].columns),
+            values=np.concatenate([batch.values for batch in batches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of a single data name, one per packet (NaN when absent)."""
+        return self.values[:, self.columns.index(name)]
+
+    def latest_values(self) -> Dict[str, float]:
+        """Newest non-NaN value of every column that appeared in the batch."""
+        present = ~np.isnan(self.values)
+        has_value = present.any(axis=0)
+        # Row index of the last present value per column.
+        last_rows = len(self) - 1 - np.argmax(present[::-1], axis=0)
+
+        latest = {}
+        for col_idx in np.flatnonzero(has_value):
+            latest[self.columns[col_idx]] = float(
+                self.values[last_rows[col_idx], col_idx]
+            )
+        return latest
+
+    def latest_status(self) -> Dict[str, Union[float, str]]:
+        """
+        latest_values() plus the newest packet's TIMESTAMP and
+        NUM_PACKETS_SENT, unless that packet also carried them as data.
+        """
+        latest: Dict[str, Union[float, str]] = dict(self.latest_values())
+        if not len(self):
+            return latest
+
+        header_values = {
+            "TIMESTAMP": f"{int(self.timestamps[-1])}",
+            "NUM_PACKETS_SENT": str(int(self.packet_numbers[-1])),
+        }
+        for name, header_value in header_values.items():
+            if name not in self.columns or np.isnan(self.column(name)[-1]):
+                latest[name] = header_value
+        return latest
+
+
+class RadioPacketDecoder:
+    """Decodes radio packets using a per-ID layout table built from DataNames."""
+
+    START_SEQUENCE = b"\x00\x00\x00\x33"
+    END_SEQUENCE = b"\x00\x00\x00\x34"
+    HEADER_BYTES = HEADER_DTYPE.itemsize
+
+    def __init__(self, data_names: DataNames):
+        self.data_names = data_names
+
+        # Output columns are the non-group data names; groups are expanded into
+        # their components.
+        self.columns: List[str] = []
+        column_index: Dict[int, int] = {}
+        for item in data_names.data_definitions:
+            if item.get("type") != "group":
+                column_index[item["id"]] = len(self.columns)
+                self.columns.append(item["name"])
+
+        # Layout table indexed by the raw ID byte:
+        #   _entry_sizes[id]   -> total entry size in bytes including the ID byte
+        #   _value_counts[id]  -> number of float32 values carried by the entry
+        #   _value_columns[id] -> output column for each value (-1 = skipped)
+        # IDs unknown to DataNames keep the single-value size so framing stays
+        # in step, but their values are dropped.
+        group_sizes = {
+            item["id"]: len(item.get("data", []))
+            for item in data_names.data_definitions
+            if item.get("type") == "group"
+        }
+        max_values = max([1, *group_sizes.values()])
+
+        self._entry_sizes: List[int] = [1 + VALUE_DTYPE.itemsize] * 256
+        self._value_counts = np.ones(256, dtype=np.intp)
+        self._value_columns = np.full((256, max_values), -1, dtype=np.intp)
+
+        for data_id, col_idx in column_index.items():
+            self._value_columns[data_id, 0] = col_idx
+
+        for item in data_names.data_definitions:
+            if item.get("type") != "group":
+                continue
+            group_id = item["id"]
+            component_ids = item.get("data", [])
+            self._entry_sizes[group_id] = 1 + VALUE_DTYPE.itemsize * len(component_ids)
+            self._value_counts[group_id] = len(component_ids)
+            for slot, component_id in enumerate(component_ids):
+                self._value_columns[group_id, slot] = column_index.get(component_id, -1)
+
+    def empty_batch(self) -> RadioPacketBatch:
+        return RadioPacketBatch.empty(self.columns)
+
+    def frame(
+        self, buffer: BufferLike, start: int = 0, end: Optional[int] = None
+    ) -> Tuple[List[int], List[int], List[int], int]:
+        """
+        Locate every complete packet in ``buffer[start:end]`` without copying it.
+
+        Returns:
+            (packet_starts, entry_offsets, entry_packet_indices, consumed)
+            where packet and entry offsets are indices into ``buffer`` and
+            ``consumed`` is the number of bytes after ``start`` that can be
+            discarded. Bytes after that belong to a partial packet or may hold
+            the beginning of a split start sequence.
+        """
+        start_seq = self.START_SEQUENCE
+        end_seq = self.END_SEQUENCE
+        entry_sizes = self._entry_sizes
+        header_bytes = self.HEADER_BYTES
+        end_len = len(end_seq)
+        buffer_len = len(buffer) if end is None else end
+
+        packet_starts: List[int] = []
+        entry_offsets: List[int] = []
+        entry_packet_indices: List[int] = []
+
+        pos = start
+        while True:
+            packet_start, skipped = find_sync(buffer, start_seq, pos, buffer_len)
+            if packet_start == -1:
+                # Keep only a short suffix so split start markers can still match.
+                consumed = pos + skipped - start
+                break
+
+            cursor = packet_start + header_bytes
+            packet_idx = len(packet_starts)
+            entries_before = len(entry_offsets)
+            complete = False
+
+            while buffer_len - cursor >= end_len:
+                if buffer.startswith(end_seq, cursor, buffer_len):
+                    complete = True
+                    break
+
+                entry_size = entry_sizes[buffer[cursor]]
+                if buffer_len - cursor < entry_size:
+                    break
+
+                entry_offsets.append(cursor)
+                cursor += entry_size
+
+            if not complete:
+                # Partial packet: drop its entries and wait for more bytes.
+                del entry_offsets[entries_before:]
+                consumed = packet_start - start
+                break
+
+            packet_starts.append(packet_start)
+            entry_packet_indices.extend(
+                [packet_idx] * (len(entry_offsets) - entries_before)
+            )
+            pos = cursor + end_len
+
+        return packet_starts, entry_offsets, entry_packet_indices, consumed
+
+    def decode(
+        self, buffer: BufferLike, start: int = 0, end: Optional[int] = None
+    ) -> Tuple[RadioPacketBatch, int]:
+        """
+        Decode every complete packet in ``buffer[start:end]``.
+
+        Returns:
+            (batch, consumed) where ``consumed`` is the number of bytes after
+            ``start`` the caller should drop from its receive buffer.
+        """
+        packet_starts, entry_offsets, entry_packet_indices, consumed = self.frame(
+            buffer, start, end
+        )
+        if not packet_starts:
+            return self.empty_batch(), consumed
+
+        # Zero-copy view of just the consumed region.
+        raw = np.frombuffer(memoryview(buffer)[start : start + consumed], np.uint8)
+
+        # --- Headers ---
+        starts = np.asarray(packet_starts, dtype=np.intp) - start
+        header_bytes = raw[starts[:, None] + np.arange(self.HEADER_BYTES)]
+        headers = header_bytes.view(HEADER_DTYPE).reshape(-1)
+        timestamps = headers["timestamp"].astype(np.uint32)
+        packet_numbers = headers["packet_number"].astype(np.uint32)
+
+        values = np.full((len(starts), len(self.columns)), np.nan, dtype=np.float32)
+        if not entry_offsets:
+            return RadioPacketBatch(
+                timestamps, packet_numbers, list(self.columns), values
+            ), consumed
+
+        # --- Entries: expand each entry into one slot per float value ---
+        offsets = np.asarray(entry_offsets, dtype=np.intp) - start
+        owners = np.asarray(entry_packet_indices, dtype=np.intp)
+        ids = raw[offsets]
+        counts = self._value_counts[ids]
+
+        slot_offsets = np.repeat(offsets, counts)
+        slot_owners = np.repeat(owners, counts)
+        slot_ids = np.repeat(ids, counts)
+        # Position of each slot inside its entry (0 for singles, 0..n-1 for groups)
+        slot_positions = np.arange(len(slot_offsets)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        slot_columns = self._value_columns[slot_ids, slot_positions]
+
+        value_starts = 1 + slot_offsets + VALUE_DTYPE.itemsize * slot_positions
+        value_bytes = raw[value_starts[:, None] + np.arange(VALUE_DTYPE.itemsize)]
+        slot_values = value_bytes.view(VALUE_DTYPE).reshape(-1)
+
+        # When a packet carries the same value twice (e.g. a group and one of
+        # its components) the later entry wins, as with sequential parsing.
+        known = slot_columns >= 0
+        flat_targets = (slot_owners * len(self.columns) + slot_columns)[known]
+        _, last_from_end = np.unique(flat_targets[::-1], return_index=True)
+        keep = len(flat_targets) - 1 - last_from_end
+        values.reshape(-1)[flat_targets[keep]] = slot_values[known][keep]
+
+        return RadioPacketBatch(
+            timestamps, packet_numbers, list(self.columns), values
+        ), consumed
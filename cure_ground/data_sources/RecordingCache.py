@@ -0,0 +1,167 @@
+"""
+On-disk cache of parsed flight recordings.
+
+Each entry is an uncompressed .npz holding the recording's columns as plain
+NumPy arrays plus a JSON metadata blob, so reopening a recording is a few
+array reads instead of a CSV parse. Entries are keyed by the source file's
+absolute path, size and modification time, so editing or replacing a
+recording invalidates its entry. The cache directory is kept under a total
+size budget by evicting the least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+CACHE_FORMAT_VERSION = 1
+META_KEY = "__meta__"
+
+
+class RecordingCache:
+    def __init__(
+        self,
+        cache_dir: str = os.path.join("temp", "recording_cache"),
+        max_bytes: int = 2 * 1024**3,
+    ):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Total size budget; least recently used entries are
+                deleted once it is exceeded
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, source_path: str, variant: str) -> Optional[str]:
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        key = json.dumps(
+            [
+                CACHE_FORMAT_VERSION,
+                os.path.abspath(source_path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                variant,
+            ]
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npz")
+
+    def load(
+        self, source_path: str, variant: str = ""
+    ) -> Optional[Tuple[Dict[str, np.ndarray], dict]]:
+        """
+        Fetch the cached columns and metadata for a recording.
+
+        Args:
+            source_path: Recording the entry was built from
+            variant: Extra key for settings that change the parsed result
+
+        Returns:
+            (columns, metadata), or None on a miss or unreadable entry
+        """
+        entry_path = self._entry_path(source_path, variant)
+        if entry_path is None or not os.path.exists(entry_path):
+            return None
+
+        try:
+            with np.load(entry_path, allow_pickle=False) as entry:
+                metadata = json.loads(str(entry[META_KEY]))
+                columns = {
+                    name: entry[f"c{idx}"]
+                    for idx, name in enumerate(metadata["column_names"])
+                }
+        except (OSError, ValueError, KeyError) as e:
+            print(f"RecordingCache: Discarding unreadable entry {entry_path}: {e}")
+            self._remove(entry_path)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return columns, metadata
+
+    def store(
+        self,
+        source_path: str,
+        columns: Dict[str, np.ndarray],
+        metadata: dict,
+        variant: str = "",
+    ) -> bool:
+        """
+        Write a cache entry for a recording, then enforce the size budget.
+
+        Columns must be numeric or fixed-width string arrays (no objects).
+        """
+        entry_path = self._entry_path(source_path, variant)
+        if entry_path is None:
+            return False
+
+        metadata = dict(metadata, column_names=list(columns))
+        arrays = {f"c{idx}": values for idx, values in enumerate(columns.values())}
+        arrays[META_KEY] = np.array(json.dumps(metadata))
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write under a temporary name so readers never see a partial entry
+        temp_path = f"{entry_path[:-4]}.tmp.npz"
+        try:
+            np.savez(temp_path, **arrays)
+            os.replace(temp_path, entry_path)
+        except (OSError, ValueError) as e:
+            print(f"RecordingCache: Failed to write {entry_path}: {e}")
+            self._remove(temp_path)
+            return False
+
+        self.evict(keep=entry_path)
+        return True
+
+    def evict(self, keep: Optional[str] = None):
+        """Delete least recently used entries until the cache fits its budget"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        entries = []
+        for name in names:
+            if not name.endswith(".npz") or name.endswith(".tmp.npz"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self._remove(path):
+                total -= size
+
+    def clear(self):
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".npz"):
+                self._remove(os.path.join(self.cache_dir, name))
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
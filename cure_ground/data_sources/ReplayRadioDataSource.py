@@ -0,0 +1,147 @@
+"""
+Replay Data Source for CURE Ground Station
+Feeds a raw radio capture back through RadioDataSource's RX buffer and packet
+decoder, so framing and decoding run exactly as they would on live bytes.
+
+Location: cure_ground/data_sources/ReplayRadioDataSource.py
+"""
+
+import time
+from typing import List, Optional
+
+from cure_ground.data_sources.RadioCapture import RadioCapture, read_radio_capture
+from cure_ground.data_sources.RadioDataSource import RadioDataSource
+
+
+class ReplayRadioDataSource(RadioDataSource):
+    """Replays a capture written by RadioDataSource(capture_path=...)."""
+
+    # Upper bound on raw bytes fed per poll when replaying as fast as possible,
+    # so one get_batch() call cannot swallow an entire multi-hour capture.
+    FAST_REPLAY_BYTES_PER_POLL = 1 << 20
+
+    def __init__(
+        self,
+        capture_path: str,
+        realtime: bool = True,
+        speed: float = 1.0,
+        protocol_version: int = 3,
+        states_version: int = 1,
+    ):
+        """
+        Initialize the replay data source.
+
+        Args:
+            capture_path: Capture file to replay
+            realtime: Deliver chunks at their recorded pace (scaled by speed);
+                when False every poll feeds as many chunks as possible
+            speed: Playback rate multiplier used when realtime is True
+            protocol_version: Data names YAML version to load
+            states_version: States YAML version to load
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+
+        super().__init__(
+            port=capture_path,
+            protocol_version=protocol_version,
+            states_version=states_version,
+        )
+        self.replay_path = capture_path
+        self.realtime = realtime
+        self.speed = speed
+
+        self._replay: Optional[RadioCapture] = None
+        self._next_chunk = 0
+        self._replay_start_monotonic = 0.0
+
+    def connect(self, port: Optional[str] = None) -> bool:
+        """
+        Load the capture file and start playback.
+
+        Returns:
+            True if the capture was loaded, False otherwise
+        """
+        if port is not None:
+            self.replay_path = port
+
+        try:
+            capture = read_radio_capture(self.replay_path)
+        except (OSError, ValueError) as exc:
+            print(f"ReplayRadioDataSource: Failed to load {self.replay_path}: {exc}")
+            return False
+
+        with self._io_lock:
+            self._replay = capture
+            self._next_chunk = 0
+            self._rx_buffer.clear()
+            self._reset_runtime_state()
+            self._replay_start_monotonic = time.monotonic()
+            self._connected = True
+
+        print(
+            f"ReplayRadioDataSource: Loaded {len(capture)} chunks "
+            f"({capture.total_bytes} bytes, {capture.duration:.1f} s) "
+            f"from {self.replay_path}"
+        )
+        return True
+
+    def disconnect(self):
+        """Stop playback and release the capture."""
+        with self._io_lock:
+            self._replay = None
+            self._next_chunk = 0
+            self._rx_buffer.clear()
+            self._connected = False
+        self._reset_runtime_state()
+        self._pending_batches.clear()
+        self.latest_data = {}
+        self.last_packet_time = 0
+        print("ReplayRadioDataSource: Stopped replay")
+
+    def is_connected(self) -> bool:
+        return self._connected and self._replay is not None
+
+    def is_finished(self) -> bool:
+        """True once every chunk of the capture has been fed to the decoder."""
+        return self._replay is None or self._next_chunk >= len(self._replay)
+
+    def _poll_packets(self):
+        """Feed due chunks into the RX buffer and decode after each one."""
+        capture = self._replay
+        if capture is None:
+            return
+
+        if self.realtime:
+            elapsed = (time.monotonic() - self._replay_start_monotonic) * self.speed
+            byte_budget = None
+        else:
+            elapsed = None
+            byte_budget = self.FAST_REPLAY_BYTES_PER_POLL
+
+        while self._next_chunk < len(capture):
+            if elapsed is not None and capture.offsets[self._next_chunk] > elapsed:
+                break
+
+            chunk = capture.chunks[self._next_chunk]
+            self._next_chunk += 1
+
+            # Same path as a serial read: append, then decode every complete
+            # packet. Decoding per chunk keeps the RX buffer within its limit.
+            with self._io_lock:
+                self._rx_buffer.extend(chunk)
+            batch = self._decode_buffered_packets()
+            if len(batch):
+                self._apply_packet_batch(batch)
+
+            if byte_budget is not None:
+                byte_budget -= len(chunk)
+                if byte_budget <= 0:
+                    break
+
+    def send_command(self, command: str, add_newline: bool = True) -> bool:
+        # A recording cannot be commanded
+        return False
+
+    def get_available_ports(self) -> List[str]:
+        return [self.replay_path] if self.replay_path else []
@@ -0,0 +1,107 @@
+"""
+Fixed-capacity receive buffer with read/write cursors.
+
+Consuming bytes only advances the read cursor, so draining packets from the
+front never memmoves the backlog. Unread bytes are moved back to the start of
+the backing store only when an append would run past its end.
+"""
+
+from typing import Tuple, Union
+
+
+class RxRingBuffer:
+    """Byte buffer that keeps at most ``max_bytes`` unread bytes."""
+
+    def __init__(self, max_bytes: int, sync_sequence: bytes = b""):
+        """
+        Args:
+            max_bytes: Limit on unread bytes kept after an append
+            sync_sequence: Marker preferred as the new start when trimming
+                overflow (e.g. a packet start sequence)
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_bytes = max_bytes
+        self.sync_sequence = sync_sequence
+        # Twice the limit so an append of up to max_bytes always fits after
+        # compaction.
+        self.capacity = 2 * max_bytes
+        self._buffer = bytearray(self.capacity)
+        self._read = 0
+        self._write = 0
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    def clear(self):
+        self._read = 0
+        self._write = 0
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the unread bytes. Invalidated by extend()."""
+        return memoryview(self._buffer)[self._read : self._write]
+
+    def region(self) -> Tuple[bytearray, int, int]:
+        """Backing store and [start, end) bounds of the unread bytes."""
+        return self._buffer, self._read, self._write
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        idx = self._buffer.find(sub, self._read + start, self._write)
+        return idx - self._read if idx != -1 else -1
+
+    def rfind(self, sub: bytes, start: int = 0) -> int:
+        idx = self._buffer.rfind(sub, self._read + start, self._write)
+        return idx - self._read if idx != -1 else -1
+
+    def consume(self, count: int):
+        """Drop ``count`` bytes from the front."""
+        self._read = min(self._read + max(count, 0), self._write)
+        if self._read == self._write:
+            self._read = 0
+            self._write = 0
+
+    def extend(self, data: Union[bytes, bytearray, memoryview]):
+        """
+        Append bytes, then trim to ``max_bytes`` if needed.
+
+        Overflow keeps the data from the last sync sequence onwards when
+        present, and otherwise the newest ``max_bytes`` bytes.
+        """
+        size = len(data)
+        if size == 0:
+            return
+
+        if size > self.max_bytes:
+            # Whatever is already buffered cannot survive the trim, so apply
+            # it to the incoming bytes alone.
+            data = self._trim_overflow(bytes(data))
+            size = len(data)
+            self.clear()
+
+        if self._write + size > self.capacity:
+            self._compact()
+
+        self._buffer[self._write : self._write + size] = data
+        self._write += size
+
+        if len(self) > self.max_bytes:
+            start_idx = self.rfind(self.sync_sequence) if self.sync_sequence else -1
+            if start_idx > 0:
+                self.consume(start_idx)
+            if len(self) > self.max_bytes:
+                self.consume(len(self) - self.max_bytes)
+
+    def _trim_overflow(self, data: bytes) -> bytes:
+        start_idx = data.rfind(self.sync_sequence) if self.sync_sequence else -1
+        if start_idx > 0:
+            data = data[start_idx:]
+        return data[-self.max_bytes :]
+
+    def _compact(self):
+        """Move unread bytes to the front of the backing store."""
+        unread = len(self)
+        if self._read and unread:
+            self._buffer[:unread] = self._buffer[self._read : self._write]
+        self._read = 0
+        self._write = unread
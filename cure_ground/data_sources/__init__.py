@@ -5,6 +5,13 @@ from .DataSource import DataSource
 from .SerialDataSource import SerialDataSource
 from .CSVDataSource import CSVDataSource
 from .RadioDataSource import RadioDataSource
+from .RadioPacketDecoder import RadioPacketBatch, RadioPacketDecoder
+from .RadioCapture import (
+    RadioCaptureWriter,
+    read_radio_capture,
+    session_capture_path,
+)
+from .ReplayRadioDataSource import ReplayRadioDataSource
 from .LaunchDetector import LaunchDetector
 
 __all__ = [
@@ -12,5 +19,11 @@ __all__ = [
     "SerialDataSource",
     "CSVDataSource",
     "RadioDataSource",
+    "RadioPacketBatch",
+    "RadioPacketDecoder",
+    "RadioCaptureWriter",
+    "read_radio_capture",
+    "session_capture_path",
+    "ReplayRadioDataSource",
     "LaunchDetector",
 ]
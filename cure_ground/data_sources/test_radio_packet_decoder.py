@@ -0,0 +1,341 @@
+"""
+Regression tests for RadioPacketDecoder.
+
+The batch decoder replaced RadioDataSource's byte-at-a-time parser, so these
+tests run both over the same synthetic byte streams and require identical
+packets: split frames, garbage between packets, split start sequences and
+buffer overflow trimming included.
+
+Run with: python -m pytest cure_ground/data_sources/test_radio_packet_decoder.py
+"""
+
+import random
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from cure_ground.core.protocols.data_names.data_name_loader import load_data_name_enum
+from cure_ground.data_sources.RadioCapture import RadioCaptureWriter
+from cure_ground.data_sources.RadioPacketDecoder import RadioPacketDecoder
+from cure_ground.data_sources.ReplayRadioDataSource import ReplayRadioDataSource
+
+START_SEQUENCE = RadioPacketDecoder.START_SEQUENCE
+END_SEQUENCE = RadioPacketDecoder.END_SEQUENCE
+UNKNOWN_ID = 250
+
+# (timestamp, packet_number, {data name: value})
+Packet = Tuple[int, int, Dict[str, float]]
+
+
+class OldRadioParser:
+    """
+    The byte-level parser RadioDataSource used before RadioPacketDecoder,
+    reduced to its buffer handling and packet parsing.
+    """
+
+    def __init__(self, data_names, max_buffer_bytes: int = 65536):
+        self.data_names = data_names
+        self.max_buffer_bytes = max_buffer_bytes
+        self.group_ids = set()
+        self.group_component_mapping = {}
+        for item in data_names.data_definitions:
+            if item.get("type") == "group":
+                self.group_ids.add(item["id"])
+                self.group_component_mapping[item["id"]] = item.get("data", [])
+        self._rx_buffer = bytearray()
+
+    def feed(self, new_bytes: bytes) -> List[Packet]:
+        """Ingest one serial read and return every packet it completed."""
+        self._rx_buffer.extend(new_bytes)
+        if len(self._rx_buffer) > self.max_buffer_bytes:
+            start_idx = self._rx_buffer.rfind(START_SEQUENCE)
+            if start_idx > 0:
+                del self._rx_buffer[:start_idx]
+            if len(self._rx_buffer) > self.max_buffer_bytes:
+                del self._rx_buffer[: -self.max_buffer_bytes]
+
+        packets = []
+        while True:
+            packet = self._extract_next_packet()
+            if packet is None:
+                return packets
+            packets.append(self._named_values(packet))
+
+    def _align_buffer_to_start_sequence(self) -> bool:
+        start_idx = self._rx_buffer.find(START_SEQUENCE)
+        if start_idx == -1:
+            keep_tail = len(START_SEQUENCE) - 1
+            if len(self._rx_buffer) > keep_tail:
+                del self._rx_buffer[:-keep_tail]
+            return False
+        if start_idx > 0:
+            del self._rx_buffer[:start_idx]
+        return True
+
+    def _parse_data_entry(self, data_id: int, data_bytes: bytes) -> Dict:
+        result = {"id": data_id}
+        if data_id in self.group_ids:
+            float_values = []
+            for i in range(3):
+                byte_data = bytes(
+                    [
+                        data_bytes[i * 4 + 3],
+                        data_bytes[i * 4 + 2],
+                        data_bytes[i * 4 + 1],
+                        data_bytes[i * 4],
+                    ]
+                )
+                float_values.append(struct.unpack("<f", byte_data)[0])
+            result["values"] = float_values
+        else:
+            result["float_value"] = struct.unpack(">f", data_bytes)[0]
+        return result
+
+    def _extract_next_packet(self) -> Optional[Dict]:
+        if not self._align_buffer_to_start_sequence():
+            return None
+        if len(self._rx_buffer) < 12:
+            return None
+
+        timestamp = struct.unpack(">I", bytes(self._rx_buffer[4:8]))[0]
+        packet_number = struct.unpack(">I", bytes(self._rx_buffer[8:12]))[0]
+
+        cursor = 12
+        packet_data: List[Dict] = []
+        while True:
+            remaining = len(self._rx_buffer) - cursor
+            if remaining < 4:
+                return None
+
+            if bytes(self._rx_buffer[cursor : cursor + 4]) == END_SEQUENCE:
+                del self._rx_buffer[: cursor + 4]
+                return {
+                    "timestamp": timestamp,
+                    "packet_number": packet_number,
+                    "data": packet_data,
+                }
+
+            data_id = self._rx_buffer[cursor]
+            expected_length = 12 if data_id in self.group_ids else 4
+            if remaining < 1 + expected_length:
+                return None
+
+            data_bytes = bytes(
+                self._rx_buffer[cursor + 1 : cursor + 1 + expected_length]
+            )
+            packet_data.append(self._parse_data_entry(data_id, data_bytes))
+            cursor += 1 + expected_length
+
+    def _named_values(self, packet: Dict) -> Packet:
+        """Same name mapping as the old _update_latest_data()."""
+        values: Dict[str, float] = {}
+        for entry in packet["data"]:
+            data_id = entry["id"]
+            try:
+                name = self.data_names.get_info_by_id(data_id)["name"]
+            except KeyError:
+                continue
+            if data_id in self.group_ids:
+                component_ids = self.group_component_mapping.get(data_id, [])
+                for comp_id, value in zip(component_ids, entry["values"]):
+                    try:
+                        values[self.data_names.get_info_by_id(comp_id)["name"]] = value
+                    except (KeyError, IndexError):
+                        pass
+            else:
+                values[name] = entry["float_value"]
+        return packet["timestamp"], packet["packet_number"], values
+
+
+class NewRadioParser:
+    """RadioPacketDecoder over a bytearray trimmed the same way as before."""
+
+    def __init__(self, data_names, max_buffer_bytes: int = 65536):
+        self.decoder = RadioPacketDecoder(data_names)
+        self.max_buffer_bytes = max_buffer_bytes
+        self._rx_buffer = bytearray()
+
+    def feed(self, new_bytes: bytes) -> List[Packet]:
+        self._rx_buffer.extend(new_bytes)
+        if len(self._rx_buffer) > self.max_buffer_bytes:
+            start_idx = self._rx_buffer.rfind(START_SEQUENCE)
+            if start_idx > 0:
+                del self._rx_buffer[:start_idx]
+            if len(self._rx_buffer) > self.max_buffer_bytes:
+                del self._rx_buffer[: -self.max_buffer_bytes]
+
+        batch, consumed = self.decoder.decode(self._rx_buffer)
+        del self._rx_buffer[:consumed]
+        return batch_packets(batch)
+
+
+def batch_packets(batch) -> List[Packet]:
+    packets = []
+    for row in range(len(batch)):
+        present = ~np.isnan(batch.values[row])
+        packets.append(
+            (
+                int(batch.timestamps[row]),
+                int(batch.packet_numbers[row]),
+                {
+                    batch.columns[col]: float(batch.values[row, col])
+                    for col in np.flatnonzero(present)
+                },
+            )
+        )
+    return packets
+
+
+def build_packet(
+    data_names, rng: random.Random, timestamp: int, packet_number: int
+) -> bytes:
+    groups = {
+        item["id"]: len(item.get("data", []))
+        for item in data_names.data_definitions
+        if item.get("type") == "group"
+    }
+    singles = [
+        item["id"]
+        for item in data_names.data_definitions
+        if item.get("type") != "group"
+    ]
+
+    out = bytearray(START_SEQUENCE + struct.pack(">II", timestamp, packet_number))
+    data_ids = rng.sample(singles + list(groups), rng.randint(0, 8))
+    if rng.random() < 0.2:
+        data_ids.append(UNKNOWN_ID)
+    for data_id in data_ids:
+        out.append(data_id)
+        for _ in range(groups.get(data_id, 1)):
+            out += struct.pack(">f", rng.uniform(-1000.0, 1000.0))
+    out += END_SEQUENCE
+    return bytes(out)
+
+
+def build_stream(
+    data_names, packet_count: int, seed: int, garbage: bool = True
+) -> bytes:
+    """Packets with occasional noise, truncated packets and split markers."""
+    rng = random.Random(seed)
+    stream = bytearray()
+    for k in range(packet_count):
+        if garbage and rng.random() < 0.15:
+            noise = rng.choice(
+                [
+                    bytes(rng.randrange(256) for _ in range(rng.randint(1, 9))),
+                    START_SEQUENCE[: rng.randint(1, 3)],
+                    END_SEQUENCE,
+                ]
+            )
+            stream += noise
+        packet = build_packet(data_names, rng, 1000 + 20 * k, k + 1)
+        if garbage and rng.random() < 0.05:
+            # Packet cut off mid-transmission; the next start sequence resyncs.
+            packet = packet[: rng.randint(1, len(packet) - 1)]
+        stream += packet
+    return bytes(stream)
+
+
+def split_chunks(stream: bytes, seed: int, max_chunk: int) -> List[bytes]:
+    rng = random.Random(seed)
+    chunks = []
+    pos = 0
+    while pos < len(stream):
+        size = rng.randint(1, max_chunk)
+        chunks.append(stream[pos : pos + size])
+        pos += size
+    return chunks
+
+
+def run_parser(parser, chunks: List[bytes]) -> List[Packet]:
+    packets = []
+    for chunk in chunks:
+        packets.extend(parser.feed(chunk))
+    return packets
+
+
+def assert_same_packets(expected: List[Packet], actual: List[Packet]):
+    assert len(actual) == len(expected)
+    for old_packet, new_packet in zip(expected, actual):
+        assert new_packet == old_packet
+
+
+@pytest.fixture(scope="module")
+def data_names():
+    return load_data_name_enum(3)
+
+
+@pytest.mark.parametrize("max_chunk", [1, 7, 64, 4096])
+def test_clean_stream_matches_old_parser(data_names, max_chunk):
+    stream = build_stream(data_names, 500, seed=1, garbage=False)
+    chunks = split_chunks(stream, seed=max_chunk, max_chunk=max_chunk)
+
+    expected = run_parser(OldRadioParser(data_names), chunks)
+    assert len(expected) == 500
+    assert_same_packets(expected, run_parser(NewRadioParser(data_names), chunks))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_resync_after_garbage_matches_old_parser(data_names, seed):
+    stream = build_stream(data_names, 400, seed=seed)
+    chunks = split_chunks(stream, seed=seed, max_chunk=200)
+
+    expected = run_parser(OldRadioParser(data_names), chunks)
+    assert_same_packets(expected, run_parser(NewRadioParser(data_names), chunks))
+
+
+def test_partial_frame_waits_for_the_rest(data_names):
+    rng = random.Random(0)
+    packet = build_packet(data_names, rng, 1234, 7)
+    parser = NewRadioParser(data_names)
+
+    for split in range(1, len(packet)):
+        assert parser.feed(packet[:split]) == []
+        packets = parser.feed(packet[split:])
+        assert len(packets) == 1
+        assert packets[0][:2] == (1234, 7)
+        assert parser._rx_buffer == bytearray()
+
+
+def test_overflow_trimming_matches_old_parser(data_names):
+    # Reads far larger than the buffer limit force the trimming path.
+    stream = build_stream(data_names, 600, seed=3)
+    chunks = split_chunks(stream, seed=3, max_chunk=3000)
+
+    expected = run_parser(OldRadioParser(data_names, max_buffer_bytes=512), chunks)
+    actual = run_parser(NewRadioParser(data_names, max_buffer_bytes=512), chunks)
+    assert_same_packets(expected, actual)
+
+
+def test_replay_matches_old_parser(data_names, tmp_path):
+    stream = build_stream(data_names, 800, seed=4)
+    chunks = split_chunks(stream, seed=4, max_chunk=777)
+
+    capture_path = str(tmp_path / "capture.bin")
+    writer = RadioCaptureWriter(capture_path)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.close()
+
+    source = ReplayRadioDataSource(capture_path, realtime=False)
+    assert source.connect()
+    actual = []
+    while not source.is_finished():
+        actual.extend(batch_packets(source.get_batch()))
+    source.disconnect()
+
+    expected = run_parser(OldRadioParser(data_names), chunks)
+    assert_same_packets(expected, actual)
+
+
+def test_corrupt_packet_number_keeps_retention_window_bounded():
+    source = ReplayRadioDataSource("unused.bin", realtime=False)
+    source._update_packet_retention(1)
+    # A header corrupted into a huge packet number must not fill the window
+    # one missed packet at a time.
+    source._update_packet_retention(0xFFFFFFF0)
+
+    assert list(source._packet_window) == [0] * 99 + [1]
+    assert source.get_packet_retention_ratio() == pytest.approx(0.01)
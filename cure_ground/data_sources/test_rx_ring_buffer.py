@@ -0,0 +1,169 @@
+"""
+Regression tests for RxRingBuffer.
+
+RxRingBuffer replaced the bytearray RadioDataSource used as its receive
+buffer, so these tests apply the same appends and consumes to both and require
+identical unread bytes, including overflow trimming and the compaction that
+happens when an append would run past the end of the backing store.
+
+Run with: python -m pytest cure_ground/data_sources/test_rx_ring_buffer.py
+"""
+
+import random
+import struct
+
+import pytest
+
+from cure_ground.core.protocols.data_names.data_name_loader import load_data_name_enum
+from cure_ground.data_sources.RadioPacketDecoder import RadioPacketDecoder
+from cure_ground.data_sources.RxRingBuffer import RxRingBuffer
+
+START_SEQUENCE = RadioPacketDecoder.START_SEQUENCE
+END_SEQUENCE = RadioPacketDecoder.END_SEQUENCE
+
+
+class OldRxBuffer:
+    """The bytearray handling RadioDataSource used before RxRingBuffer."""
+
+    def __init__(self, max_bytes: int, sync_sequence: bytes):
+        self.max_bytes = max_bytes
+        self.sync_sequence = sync_sequence
+        self.data = bytearray()
+
+    def extend(self, new_bytes: bytes):
+        self.data.extend(new_bytes)
+        if len(self.data) > self.max_bytes:
+            start_idx = self.data.rfind(self.sync_sequence)
+            if start_idx > 0:
+                del self.data[:start_idx]
+            if len(self.data) > self.max_bytes:
+                del self.data[: -self.max_bytes]
+
+    def consume(self, count: int):
+        del self.data[:count]
+
+
+def random_bytes(rng: random.Random, size: int) -> bytes:
+    # Mostly zeros so partial and complete sync sequences show up often.
+    return bytes(
+        rng.choice([0, 0, 0, 0x33, 0x34, rng.randrange(256)]) for _ in range(size)
+    )
+
+
+def assert_same_contents(ring: RxRingBuffer, reference: OldRxBuffer):
+    assert len(ring) == len(reference.data)
+    assert bytes(ring.view()) == bytes(reference.data)
+    buffer, start, end = ring.region()
+    assert bytes(buffer[start:end]) == bytes(reference.data)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_appends_and_consumes_match_bytearray(seed):
+    rng = random.Random(seed)
+    max_bytes = rng.choice([16, 64, 300])
+    ring = RxRingBuffer(max_bytes, sync_sequence=START_SEQUENCE)
+    reference = OldRxBuffer(max_bytes, START_SEQUENCE)
+
+    for _ in range(2000):
+        if rng.random() < 0.6:
+            # Occasionally larger than the whole buffer.
+            chunk = random_bytes(rng, rng.randint(0, max_bytes + max_bytes // 2))
+            ring.extend(chunk)
+            reference.extend(chunk)
+        else:
+            count = rng.randint(0, len(reference.data) + 2)
+            ring.consume(count)
+            reference.consume(count)
+
+        assert_same_contents(ring, reference)
+        assert ring.find(START_SEQUENCE) == reference.data.find(START_SEQUENCE)
+        assert ring.rfind(START_SEQUENCE) == reference.data.rfind(START_SEQUENCE)
+
+
+def test_wrap_around_compacts_unread_bytes():
+    ring = RxRingBuffer(8, sync_sequence=START_SEQUENCE)
+    reference = OldRxBuffer(8, START_SEQUENCE)
+
+    # Advance the read cursor so the next appends run past the backing store.
+    for step in range(20):
+        chunk = bytes(range(step * 5, step * 5 + 5))
+        ring.extend(chunk)
+        reference.extend(chunk)
+        ring.consume(3)
+        reference.consume(3)
+        assert_same_contents(ring, reference)
+        assert ring.region()[2] <= ring.capacity
+
+
+def test_overflow_keeps_data_from_last_start_sequence():
+    ring = RxRingBuffer(16, sync_sequence=START_SEQUENCE)
+    ring.extend(b"\x01" * 10 + START_SEQUENCE + b"\x02" * 4)
+    ring.extend(b"\x03" * 6)
+
+    assert bytes(ring.view()) == START_SEQUENCE + b"\x02" * 4 + b"\x03" * 6
+
+
+def test_oversized_append_keeps_newest_bytes():
+    ring = RxRingBuffer(8)
+    ring.extend(b"old")
+    ring.extend(bytes(range(20)))
+
+    assert bytes(ring.view()) == bytes(range(12, 20))
+
+
+@pytest.fixture(scope="module")
+def data_names():
+    return load_data_name_enum(3)
+
+
+def build_stream(data_names, packet_count: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    singles = [
+        item["id"]
+        for item in data_names.data_definitions
+        if item.get("type") != "group"
+    ]
+    stream = bytearray()
+    for k in range(packet_count):
+        if rng.random() < 0.2:
+            # Noise without zero bytes cannot fake a start sequence.
+            stream += bytes(rng.randrange(1, 256) for _ in range(rng.randint(1, 9)))
+        stream += START_SEQUENCE + struct.pack(">II", 1000 + 20 * k, k + 1)
+        for data_id in rng.sample(singles, rng.randint(0, 6)):
+            stream.append(data_id)
+            stream += struct.pack(">f", rng.uniform(-1000.0, 1000.0))
+        stream += END_SEQUENCE
+    return bytes(stream)
+
+
+@pytest.mark.parametrize("max_bytes", [64, 256, 65536])
+def test_decoding_from_ring_matches_bytearray(data_names, max_bytes):
+    """Same packets as decoding the old bytearray buffer, overflow included."""
+    stream = build_stream(data_names, 500, seed=max_bytes)
+    rng = random.Random(max_bytes)
+    decoder = RadioPacketDecoder(data_names)
+    ring = RxRingBuffer(max_bytes, sync_sequence=START_SEQUENCE)
+    reference = OldRxBuffer(max_bytes, START_SEQUENCE)
+
+    ring_packets = []
+    reference_packets = []
+    pos = 0
+    while pos < len(stream):
+        chunk = stream[pos : pos + rng.randint(1, 400)]
+        pos += len(chunk)
+
+        ring.extend(chunk)
+        batch, consumed = decoder.decode(*ring.region())
+        ring.consume(consumed)
+        ring_packets.extend(batch.packet_numbers.tolist())
+
+        reference.extend(chunk)
+        batch, consumed = decoder.decode(reference.data)
+        reference.consume(consumed)
+        reference_packets.extend(batch.packet_numbers.tolist())
+
+        assert_same_contents(ring, reference)
+
+    assert ring_packets == reference_packets
+    if max_bytes == 65536:
+        assert ring_packets == list(range(1, 501))
@@ -1,6 +1,10 @@
 import math
-from statistics import median
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[np.ndarray, pd.Series, pd.Index]
 
 
 TIMESTAMP_KEYS = ("TIMESTAMP", "timestamp", "Timestamp")
@@ -10,6 +14,9 @@ EPOCH_SECONDS_LOWER_BOUND = 1_000_000_000
 EPOCH_MILLISECONDS_LOWER_BOUND = 100_000_000_000
 FRACTIONAL_TOLERANCE = 1e-6
 
+# Timestamps examined when inferring the unit of a long recording
+TIMESTAMP_INFERENCE_SAMPLES = 20_000
+
 
 def parse_timestamp_value(value: object) -> Optional[float]:
     if value in (None, "", "N/A"):
@@ -33,30 +40,81 @@ def infer_timestamp_multiplier_to_ms(values: Iterable[float]) -> int:
         if parsed is not None:
             timestamps.append(parsed)
 
-    if not timestamps:
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    return _multiplier_from_timestamps(timestamps, np.diff(timestamps))
+
+
+def infer_timestamp_multiplier_to_ms_array(
+    values: ArrayLike, max_samples: Optional[int] = None, seed: int = 0
+) -> int:
+    """
+    Array version of infer_timestamp_multiplier_to_ms() for NumPy arrays and
+    pandas columns. Missing, non-numeric and non-finite entries are skipped.
+
+    With max_samples, longer inputs are judged on a bounded sample using the
+    same thresholds: the first max_samples // 2 timestamps plus randomly
+    chosen pairs of consecutive timestamps from the rest, so the step check
+    still compares real neighbours. max_samples must be at least 2.
+    """
+    if max_samples is not None and max_samples < 2:
+        raise ValueError("max_samples must be at least 2")
+
+    timestamps = _finite_timestamps(values)
+
+    if max_samples is not None and len(timestamps) > max_samples:
+        head = timestamps[: max_samples // 2]
+        pair_count = max(0, (max_samples - len(head)) // 2)
+        pair_starts = np.random.default_rng(seed).choice(
+            np.arange(len(head), len(timestamps) - 1),
+            size=min(pair_count, len(timestamps) - 1 - len(head)),
+            replace=False,
+        )
+        firsts = timestamps[pair_starts]
+        seconds = timestamps[pair_starts + 1]
+        return _multiplier_from_timestamps(
+            np.concatenate([head, firsts, seconds]),
+            np.concatenate([np.diff(head), seconds - firsts]),
+        )
+
+    return _multiplier_from_timestamps(timestamps, np.diff(timestamps))
+
+
+def _finite_timestamps(values: ArrayLike) -> np.ndarray:
+    # Finite numeric values in order, as float64
+    if isinstance(values, (pd.Series, pd.Index)):
+        array = values.to_numpy()
+    else:
+        array = np.asarray(values)
+    array = array.ravel()
+
+    if array.dtype.kind in "biuf":
+        array = array.astype(np.float64, copy=False)
+    else:
+        array = pd.to_numeric(pd.Series(array), errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+    return array[np.isfinite(array)]
+
+
+def _multiplier_from_timestamps(timestamps: np.ndarray, deltas: np.ndarray) -> int:
+    if not len(timestamps):
         return 1
 
-    max_abs_timestamp = max(abs(timestamp) for timestamp in timestamps)
+    max_abs_timestamp = np.max(np.abs(timestamps))
     if max_abs_timestamp >= EPOCH_MILLISECONDS_LOWER_BOUND:
         return 1
 
     if max_abs_timestamp >= EPOCH_SECONDS_LOWER_BOUND:
         return 1000
 
-    has_fractional_values = any(
-        abs(timestamp - round(timestamp)) > FRACTIONAL_TOLERANCE
-        for timestamp in timestamps
+    has_fractional_values = np.any(
+        np.abs(timestamps - np.round(timestamps)) > FRACTIONAL_TOLERANCE
     )
     if has_fractional_values:
         return 1000
 
-    positive_deltas = []
-    for previous_timestamp, current_timestamp in zip(timestamps, timestamps[1:]):
-        delta = current_timestamp - previous_timestamp
-        if delta > 0:
-            positive_deltas.append(delta)
-
-    if positive_deltas and median(positive_deltas) < 1.0:
+    positive_deltas = deltas[deltas > 0]
+    if len(positive_deltas) and np.median(positive_deltas) < 1.0:
         return 1000
 
     return 1
@@ -10,6 +10,8 @@ import pandas as pd
 import serial
 from tqdm import tqdm
 
+from cure_ground.core.functions.sync_scanner import SyncScanner
+
 
 class DataNames(Enum):
     ACCELEROMETER_X = 0
@@ -48,7 +50,7 @@ Dump spec WIP
 """
 
 
-def read_all(ser):
+def read_all(ser, leftover=b""):
     print("Reading from serial...")
     pages = []
     i = 0
@@ -56,7 +58,10 @@ def read_all(ser):
     while True:
         i += 1
         # time.sleep(1)
-        chunk = ser.read(255 + 3)
+        chunk = leftover[: 255 + 3]
+        leftover = leftover[255 + 3 :]
+        if len(chunk) < 255 + 3:
+            chunk += ser.read(255 + 3 - len(chunk))
         # print("Chunk: ", chunk)
         if chunk[:3] == b"lsh":
             # print("LSH")
@@ -107,28 +112,17 @@ def main(port, stat_only, all_data):
     else:
         ser.write(b"dump\n")
 
-    # 2.5 Read until we eat a \n, \r, and 's' char for alginment in that order
-    a_queue = ["a", "b", "c", "d", "e", "f"]
-
-    while True:
-        try:
-            data = ser.read(1).decode("utf-8")
-        except UnicodeDecodeError:
-            print("Can't decode: ", data)
-        if data == a_queue[0]:
-            a_queue.pop(0)
-            # print("Popped: ", data)
-        else:
-            a_queue = ["a", "b", "c", "d", "e", "f"]
-            # print("Failed to pop: ", data)
-
-        if not a_queue:
-            break
+    # 2.5 Skip whatever the board prints before the alignment sequence
+    scanner = SyncScanner(b"abcdef")
+    leftover = scanner.scan(ser)
+    if leftover is None:
+        print("No alignment sequence,", scanner.skipped_bytes, "bytes skipped")
+        return
 
-    print("Aligned!!!")
+    print("Aligned!!!", scanner.skipped_bytes, "bytes skipped")
 
     # 3. Receive the data
-    all_pages = read_all(ser)
+    all_pages = read_all(ser, leftover)
 
     # 3.5 Parse the data
     data_stream = []
@@ -14,6 +14,28 @@ from cure_ground.gui.view.TextFormatter import TextFormatter
 from cure_ground.gui.view.CommandTerminalDialog import CommandTerminalDialog
 
 
+# Graph history choices; None keeps the whole flight.
+GRAPH_HISTORY_OPTIONS = {
+    "History: 40 s": 40.0,
+    "History: 2 min": 120.0,
+    "History: 10 min": 600.0,
+    "History: Whole flight": None,
+}
+
+# Recording playback speeds; None plays as fast as possible.
+PLAYBACK_SPEED_OPTIONS = {
+    "Speed: 0.1x": 0.1,
+    "Speed: 0.5x": 0.5,
+    "Speed: 1x": 1.0,
+    "Speed: 2x": 2.0,
+    "Speed: 5x": 5.0,
+    "Speed: 10x": 10.0,
+    "Speed: 100x": 100.0,
+    "Speed: Max": None,
+}
+DEFAULT_PLAYBACK_SPEED = "Speed: 1x"
+
+
 class DashboardController:
     def __init__(self, view):
         self.view: MainWindow = view
@@ -53,6 +75,17 @@ class DashboardController:
         )
         self.timer.timeout.connect(self.update_status)
         sidebar.get_clear_graphs_button().clicked.connect(self.clear_graphs)
+        history_combo = sidebar.get_graph_history_combo()
+        history_combo.addItems(list(GRAPH_HISTORY_OPTIONS))
+        history_combo.currentTextChanged.connect(self.on_graph_history_changed)
+        speed_combo = sidebar.get_playback_speed_combo()
+        speed_combo.addItems(list(PLAYBACK_SPEED_OPTIONS))
+        speed_combo.setCurrentText(DEFAULT_PLAYBACK_SPEED)
+        speed_combo.currentTextChanged.connect(self.on_playback_speed_changed)
+        sidebar.get_playback_pause_button().clicked.connect(self.toggle_playback_pause)
+        playback_slider = sidebar.get_playback_slider()
+        playback_slider.sliderMoved.connect(self.on_playback_slider_moved)
+        playback_slider.sliderReleased.connect(self.on_playback_scrubbed)
 
     # --------------------- CONNECTION HANDLING ---------------------
     def toggle_connection_status(self):
@@ -71,6 +104,10 @@ class DashboardController:
                 sidebar.get_command_mode_button().show()
             else:
                 sidebar.get_command_mode_button().hide()
+            if self._get_playback_source() is not None:
+                self.setup_playback_controls()
+            else:
+                sidebar.hide_playback_controls()
             sidebar.update_connect_button_text("Disconnect")
 
     def disconnect_and_hide(self):
@@ -115,8 +152,13 @@ class DashboardController:
                     )
                     return False
 
+                # Optionally read on a background thread so GUI stalls
+                # cannot back up the serial port.
+                threaded = (
+                    self.view.get_sidebar().get_threaded_reader_checkbox().isChecked()
+                )
                 self.current_data_source = DataSourceFactory.create_data_source(
-                    "radio", port=selected_port
+                    "radio", port=selected_port, threaded=threaded
                 )
 
                 if not self.current_data_source.connect():
@@ -148,6 +190,7 @@ class DashboardController:
             sidebar = self.view.get_sidebar()
             sidebar.get_data_source_combo().setEnabled(False)
             sidebar.get_port_dropdown().setEnabled(False)
+            sidebar.get_threaded_reader_checkbox().setEnabled(False)
             print(f"Connected to {source_type} data source")
             return True
 
@@ -161,6 +204,8 @@ class DashboardController:
     def disconnect(self):
         if self.current_data_source:
             self.current_data_source.disconnect()
+        # Flush and close any live recording
+        self.model.clear_local_save_path()
         if self.streaming:
             self.toggle_streaming()
         if self.merged_graph:
@@ -172,6 +217,7 @@ class DashboardController:
         sidebar = self.view.get_sidebar()
         sidebar.get_data_source_combo().setEnabled(True)
         sidebar.get_port_dropdown().setEnabled(True)
+        sidebar.get_threaded_reader_checkbox().setEnabled(True)
         self.view.get_status_display().hide_all()
 
         self.connected = False
@@ -205,6 +251,85 @@ class DashboardController:
             self.view.toggle_graph_visual_visibility(False)
             self.view.get_sidebar().get_graph_button().setText("Show Graphs")
 
+    def on_graph_history_changed(self, option: str):
+        if option in GRAPH_HISTORY_OPTIONS:
+            self.model.set_graph_window_seconds(GRAPH_HISTORY_OPTIONS[option])
+
+    # --------------------- RECORDING PLAYBACK ---------------------
+    def _get_playback_source(self):
+        # The current data source if it supports seeking, else None
+        source = self.current_data_source
+        if source is not None and callable(getattr(source, "seek", None)):
+            return source
+        return None
+
+    @staticmethod
+    def _format_playback_time(position_ms: float) -> str:
+        total_seconds = int(position_ms // 1000)
+        return f"{total_seconds // 60}:{total_seconds % 60:02d}"
+
+    def setup_playback_controls(self):
+        source = self._get_playback_source()
+        sidebar = self.view.get_sidebar()
+        sidebar.get_playback_slider().setRange(0, source.get_duration_ms())
+        sidebar.get_playback_pause_button().setText("Pause")
+        self.on_playback_speed_changed(sidebar.get_playback_speed_combo().currentText())
+        self.update_playback_position()
+        sidebar.show_playback_controls()
+
+    def update_playback_position(self):
+        source = self._get_playback_source()
+        if source is None:
+            return
+        sidebar = self.view.get_sidebar()
+        slider = sidebar.get_playback_slider()
+        position_ms = min(source.get_playhead_ms(), source.get_duration_ms())
+        # Leave the slider alone while the user is dragging it
+        if not slider.isSliderDown():
+            slider.blockSignals(True)
+            slider.setValue(int(position_ms))
+            slider.blockSignals(False)
+            self._set_playback_label(position_ms)
+
+    def _set_playback_label(self, position_ms: float):
+        source = self._get_playback_source()
+        duration_ms = source.get_duration_ms() if source is not None else 0
+        self.view.get_sidebar().get_playback_label().setText(
+            f"{self._format_playback_time(position_ms)} / "
+            f"{self._format_playback_time(duration_ms)}"
+        )
+
+    def on_playback_slider_moved(self, position_ms: int):
+        self._set_playback_label(position_ms)
+
+    def on_playback_scrubbed(self):
+        source = self._get_playback_source()
+        if source is None:
+            return
+        source.seek(self.view.get_sidebar().get_playback_slider().value())
+        # Graphs restart from the new position rather than mixing in samples
+        # from before the jump.
+        self.clear_graphs()
+        if not self.streaming:
+            self.update_status()
+
+    def toggle_playback_pause(self):
+        source = self._get_playback_source()
+        if source is None:
+            return
+        button = self.view.get_sidebar().get_playback_pause_button()
+        if source.paused:
+            source.resume()
+            button.setText("Pause")
+        else:
+            source.pause()
+            button.setText("Play")
+
+    def on_playback_speed_changed(self, option: str):
+        source = self._get_playback_source()
+        if source is not None and option in PLAYBACK_SPEED_OPTIONS:
+            source.set_playback_rate(PLAYBACK_SPEED_OPTIONS[option])
+
     def ensure_graphs_initialized(self):
         # Orientation
         if self.orientation_visual is None:
@@ -290,6 +415,7 @@ class DashboardController:
             retention_ratio = 1.0  # Default to 100% if not supported
 
         self.view.get_packet_loss_indicator().set_packet_loss(retention_ratio)
+        self.update_playback_position()
 
     # --------------------- HELPERS ---------------------
     def clear_plm(self):
@@ -0,0 +1,200 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class CSVRecorder:
+    """
+    Appends CSV rows to a file from a background writer thread.
+
+    The file stays open for the whole session. Rows are queued by the caller
+    and written by the writer thread, which fsyncs at most once per
+    `fsync_interval_seconds`. A slow disk therefore never blocks the GUI tick.
+    """
+
+    FILE_BUFFER_BYTES = 1 << 16
+    # Longest close() waits for the writer before leaving it to finish alone
+    CLOSE_TIMEOUT_SECONDS = 0.5
+
+    def __init__(
+        self,
+        path: str,
+        headers: List[str],
+        fsync_interval_seconds: float = 1.0,
+        max_queued_chunks: int = 4096,
+    ):
+        if fsync_interval_seconds <= 0:
+            raise ValueError("fsync_interval_seconds must be positive")
+
+        self.path = path
+        self.headers = list(headers)
+        self.fsync_interval_seconds = fsync_interval_seconds
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued_chunks)
+        self._file = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        # Set when the writer stopped on an error; later rows are dropped
+        self._failed = threading.Event()
+
+        # --- Counters ---
+        self.bytes_written = 0
+        self.rows_written = 0
+        self.dropped_rows = 0
+        self.fsync_count = 0
+
+    def start(self):
+        """Create the file, write the header line and start the writer thread."""
+        self._file = open(
+            self.path, "w", buffering=self.FILE_BUFFER_BYTES, encoding="utf-8"
+        )
+        self._write_text(",".join(self.headers) + "\n", row_count=0)
+        self._file.flush()
+
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="CSVRecorderWriter", daemon=True
+        )
+        self._thread.start()
+        # Flush whatever is queued if the app exits without disconnecting.
+        atexit.register(self._close_at_exit)
+
+    def write_rows(self, rows: List[List[str]]) -> bool:
+        """
+        Queue rows for writing without blocking.
+
+        Returns:
+            False if the recorder is closed, its writer has failed or the
+            queue is full (rows dropped and counted).
+        """
+        if not rows:
+            return True
+        if (
+            self._closed.is_set()
+            or self._failed.is_set()
+            or not self._thread
+            or not self._thread.is_alive()
+        ):
+            self.dropped_rows += len(rows)
+            return False
+
+        chunk = "".join(",".join(values) + "\n" for values in rows)
+        try:
+            self._queue.put_nowait((chunk, len(rows)))
+            return True
+        except queue.Full:
+            if self.dropped_rows == 0:
+                print(f"CSVRecorder: Write queue full, dropping rows for {self.path}")
+            self.dropped_rows += len(rows)
+            return False
+
+    def close(self, timeout: Optional[float] = CLOSE_TIMEOUT_SECONDS):
+        """
+        Write out everything queued, fsync and close the file.
+
+        Args:
+            timeout: Seconds to wait for the writer (None = until done). If
+                it is still flushing after that, it finishes in the
+                background and is waited for at exit.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        atexit.unregister(self._close_at_exit)
+
+        thread = self._thread
+        self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            # Wake the writer; with a full queue it is busy and will see
+            # the closed flag after its current chunk.
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+        if thread.is_alive():
+            print(f"CSVRecorder: Still flushing {self.path} in the background")
+            atexit.register(thread.join)
+
+    def _close_at_exit(self):
+        self.close(timeout=None)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "bytes_written": self.bytes_written,
+            "rows_written": self.rows_written,
+            "queue_depth": self._queue.qsize(),
+            "dropped_rows": self.dropped_rows,
+            "fsync_count": self.fsync_count,
+        }
+
+    def _write_text(self, text: str, row_count: int):
+        try:
+            self._file.write(text)
+        except (OSError, ValueError):
+            self.dropped_rows += row_count
+            raise
+        self.bytes_written += len(text.encode("utf-8"))
+        self.rows_written += row_count
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsync_count += 1
+
+    def _writer_loop(self):
+        last_sync = time.monotonic()
+        dirty = False
+        try:
+            while True:
+                timeout = max(
+                    0.0, self.fsync_interval_seconds - (time.monotonic() - last_sync)
+                )
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = ()
+
+                if item is None or self._closed.is_set():
+                    if item:
+                        self._write_text(*item)
+                    break
+                if item:
+                    chunk, row_count = item
+                    self._write_text(chunk, row_count)
+                    dirty = True
+
+                if time.monotonic() - last_sync >= self.fsync_interval_seconds:
+                    if dirty:
+                        self._sync()
+                        dirty = False
+                    last_sync = time.monotonic()
+
+            # Drain anything queued behind the sentinel's arrival.
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item:
+                    self._write_text(*item)
+            self._sync()
+        except (OSError, ValueError) as e:
+            print(f"CSVRecorder: Error writing to {self.path}: {e}")
+            self._failed.set()
+            # Rows still queued will never be written
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item:
+                    self.dropped_rows += item[1]
+        finally:
+            try:
+                self._file.close()
+            except OSError:
+                pass
@@ -0,0 +1,206 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from cure_ground.core.protocols.data_names.data_name_loader import DataNames
+from cure_ground.gui.model.TimeSeriesBuffer import TimeSeriesBuffer
+
+ChannelKey = Union[int, str]
+
+
+class ChannelStore:
+    """
+    Sliding-window store of every telemetry channel defined in DataNames.
+
+    All channels share one timestamp column; each non-group data name gets a
+    value column keyed by its ID, with NaN where a sample did not carry that
+    channel. Any channel can be read back for plotting, optionally over a
+    shorter window of its own.
+
+    Aliases are extra names written into a channel's column, e.g. "alt" for
+    ALTITUDE. A sample's value under the channel's own name wins over one
+    given under an alias.
+    """
+
+    def __init__(
+        self,
+        data_names: DataNames,
+        window_seconds: float = 40.0,
+        max_points: Optional[int] = 5000,
+        aliases: Optional[Dict[str, ChannelKey]] = None,
+    ):
+        self.data_names = data_names
+        self.window_seconds = window_seconds
+
+        self.channel_ids: List[int] = []
+        self._column_by_id: Dict[int, int] = {}
+        self._column_by_name: Dict[str, int] = {}
+        for item in data_names.data_definitions:
+            if item.get("type") == "group":
+                continue
+            self._column_by_id[item["id"]] = len(self.channel_ids)
+            self._column_by_name[item["name"]] = len(self.channel_ids)
+            self.channel_ids.append(item["id"])
+
+        self._column_by_alias: Dict[str, int] = {}
+        for alias, key in (aliases or {}).items():
+            if alias not in self._column_by_name and self.has_channel(key):
+                self._column_by_alias[alias] = self.column_index(key)
+
+        # Optional shorter windows for individual channels, by column.
+        self._channel_windows: Dict[int, float] = {}
+
+        self._buffer = TimeSeriesBuffer(
+            len(self.channel_ids), window_seconds, max_points
+        )
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def clear(self):
+        self._buffer.clear()
+
+    def has_channel(self, key: ChannelKey) -> bool:
+        return (
+            key in self._column_by_id
+            or key in self._column_by_name
+            or key in self._column_by_alias
+        )
+
+    def column_index(self, key: ChannelKey) -> int:
+        """
+        Column of a channel given its DataNames ID, name or an alias.
+        Will raise a KeyError if the channel is unknown
+        """
+        if isinstance(key, str):
+            column = self._column_by_name.get(key)
+            return self._column_by_alias[key] if column is None else column
+        return self._column_by_id[key]
+
+    def set_window(self, window_seconds: float, max_points: Optional[int] = None):
+        """Change how much history the store retains."""
+        self.window_seconds = window_seconds
+        self._buffer.set_window(window_seconds, max_points)
+
+    def set_channel_window(self, key: ChannelKey, window_seconds: Optional[float]):
+        """Limit reads of one channel to a shorter window (None = store window)."""
+        column = self.column_index(key)
+        if window_seconds is None:
+            self._channel_windows.pop(column, None)
+        elif window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        else:
+            self._channel_windows[column] = min(window_seconds, self.window_seconds)
+
+    # ===== WRITING =====
+    def append(self, timestamp: float, values: Dict[ChannelKey, float]) -> bool:
+        """Add one sample; channels missing from ``values`` are stored as NaN."""
+        row = np.full(len(self.channel_ids), np.nan)
+        aliased = []
+        for key, value in values.items():
+            if key in self._column_by_alias:
+                aliased.append((self._column_by_alias[key], value))
+            elif self.has_channel(key):
+                row[self.column_index(key)] = value
+        for column, value in aliased:
+            if np.isnan(row[column]):
+                row[column] = value
+        return self._buffer.append(timestamp, row)
+
+    def extend(
+        self,
+        timestamps: np.ndarray,
+        channels: Sequence[ChannelKey],
+        values: np.ndarray,
+    ) -> int:
+        """
+        Add a block of samples.
+
+        Args:
+            timestamps: Sample times in seconds, shape (k,)
+            channels: DataNames ID or name of each column of ``values``
+            values: Sample values, shape (k, len(channels)); NaN = absent
+
+        Returns:
+            Number of samples kept.
+        """
+        known = [
+            idx
+            for idx, key in enumerate(channels)
+            if self.has_channel(key) and key not in self._column_by_alias
+        ]
+        block = np.full((len(self.channel_ids), len(timestamps)), np.nan)
+        block[[self.column_index(channels[idx]) for idx in known]] = values[:, known].T
+        # Aliases only fill in what the channel's own column left blank
+        for idx, key in enumerate(channels):
+            if key in self._column_by_alias:
+                column = block[self._column_by_alias[key]]
+                missing = np.isnan(column)
+                column[missing] = values[missing, idx]
+        return self._buffer.extend(timestamps, block)
+
+    # ===== READING =====
+    def get_channels(
+        self, *keys: ChannelKey, window_seconds: Optional[float] = None
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Timestamps and values of samples where every requested channel is finite.
+
+        When no sample is missing a channel the arrays are zero-copy views of
+        the store, valid until the next write.
+        """
+        timestamps, series = self._windowed_columns(keys, window_seconds)
+        present = np.ones(len(timestamps), dtype=bool)
+        for values in series:
+            present &= np.isfinite(values)
+        if present.all():
+            return (timestamps, *series)
+        return (timestamps[present], *(values[present] for values in series))
+
+    def get_first_present(
+        self, *keys: ChannelKey, window_seconds: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Timestamps and, per sample, the first finite value among ``keys``,
+        for channels that stand in for one another (e.g. a measured and an
+        estimated altitude). Samples carrying none of them are skipped.
+        """
+        timestamps, series = self._windowed_columns(keys, window_seconds)
+        values = series[0].copy()
+        for fallback in series[1:]:
+            missing = np.isnan(values)
+            values[missing] = fallback[missing]
+        present = np.isfinite(values)
+        return timestamps[present], values[present]
+
+    def _windowed_columns(
+        self, keys: Sequence[ChannelKey], window_seconds: Optional[float]
+    ) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Views of the timestamps and requested columns within the window"""
+        columns = [self.column_index(key) for key in keys]
+        if window_seconds is None:
+            windows = [self._channel_windows.get(column) for column in columns]
+            window_seconds = min(
+                (window for window in windows if window is not None), default=None
+            )
+
+        timestamps = self._buffer.timestamps
+        series = [self._buffer.column(column) for column in columns]
+        if window_seconds is not None and len(timestamps):
+            start = int(
+                np.searchsorted(timestamps, timestamps[-1] - window_seconds, "left")
+            )
+            timestamps = timestamps[start:]
+            series = [values[start:] for values in series]
+        return timestamps, series
+
+    def has_data(self, key: ChannelKey) -> bool:
+        return bool(np.isfinite(self._buffer.column(self.column_index(key))).any())
+
+    def latest(self, key: ChannelKey) -> Optional[float]:
+        """Newest finite value of a channel, or None."""
+        values = self._buffer.column(self.column_index(key))
+        finite = np.flatnonzero(np.isfinite(values))
+        if not len(finite):
+            return None
+        return float(values[finite[-1]])
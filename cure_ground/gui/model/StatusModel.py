@@ -1,37 +1,96 @@
+import math
 import time
 from typing import Dict, Optional, List, Tuple
+from cure_ground.core.protocols.data_names.data_name_loader import (
+    load_data_name_enum,
+    DataNames,
+)
 from cure_ground.data_sources import DataSource
+from cure_ground.gui.model.ChannelStore import ChannelStore
+from cure_ground.gui.model.CSVRecorder import CSVRecorder
 import numpy as np
-from collections import deque
+
+# Channels drawn by the built-in graphs. Altitude falls back to the
+# estimated altitude for samples without a raw altitude.
+ALTITUDE_CHANNELS = ("ALTITUDE", "EST_ALTITUDE")
+ACCEL_CHANNELS = ("ACCELEROMETER_X", "ACCELEROMETER_Y", "ACCELEROMETER_Z")
+EST_APOGEE_CHANNEL = "EST_APOGEE"
+
+# Column names other sources (e.g. older CSVs) use for the graphed channels
+CHANNEL_ALIASES = {
+    "ALT": "ALTITUDE",
+    "altitude": "ALTITUDE",
+    "alt": "ALTITUDE",
+    "AX": "ACCELEROMETER_X",
+    "accel_x": "ACCELEROMETER_X",
+    "accx": "ACCELEROMETER_X",
+    "acc_x": "ACCELEROMETER_X",
+    "AY": "ACCELEROMETER_Y",
+    "accel_y": "ACCELEROMETER_Y",
+    "accy": "ACCELEROMETER_Y",
+    "acc_y": "ACCELEROMETER_Y",
+    "AZ": "ACCELEROMETER_Z",
+    "accel_z": "ACCELEROMETER_Z",
+    "accz": "ACCELEROMETER_Z",
+    "acc_z": "ACCELEROMETER_Z",
+    "EST_APOGEE_ALT": "EST_APOGEE",
+    "est_apogee": "EST_APOGEE",
+}
 
 
 class GraphDataManager:
-    def __init__(self, window_seconds: float = 40.0, safety_max_points: int = 5000):
+    def __init__(
+        self,
+        window_seconds: float = 40.0,
+        safety_max_points: int = 5000,
+        data_names: Optional[DataNames] = None,
+    ):
         if window_seconds <= 0:
             raise ValueError("window_seconds must be positive")
 
         self.window_seconds = window_seconds
         # Backstop cap in case timestamps become unusable (e.g. all repeated/invalid).
         self.safety_max_points = safety_max_points
+        self._base_window_seconds = window_seconds
+
+        # Every channel in the protocol, on one shared time axis
+        self.channels = ChannelStore(
+            data_names or load_data_name_enum(3),
+            window_seconds,
+            safety_max_points,
+            aliases=CHANNEL_ALIASES,
+        )
 
-        # Altitude
-        self.alt_timestamps = deque()
-        self.altitudes = deque()
-
-        # Accelerometer (3-axis)
-        self.acl_timestamps = deque()
-        self.accel_x = deque()
-        self.accel_y = deque()
-        self.accel_z = deque()
+    @property
+    def data_names(self) -> DataNames:
+        return self.channels.data_names
+
+    def set_data_names(self, data_names: DataNames):
+        """Rebuild the channel store for another protocol version (clears data)"""
+        self.channels = ChannelStore(
+            data_names,
+            self.window_seconds,
+            self._max_points(),
+            aliases=CHANNEL_ALIASES,
+        )
 
-        # Estimated apogee
-        self.est_apogee_timestamps = deque()
-        self.est_apogee_values = deque()
+    def set_window_seconds(self, window_seconds: Optional[float]):
+        """
+        Change how much history is kept for graphing.
+        None keeps the whole session (no time window and no point cap).
+        """
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        self.window_seconds = math.inf if window_seconds is None else window_seconds
+        self.channels.set_window(self.window_seconds, self._max_points())
 
-        # Newest timestamp seen per stream, used to anchor time-window pruning.
-        self._latest_alt_timestamp: Optional[float] = None
-        self._latest_acl_timestamp: Optional[float] = None
-        self._latest_est_apogee_timestamp: Optional[float] = None
+    def _max_points(self) -> Optional[int]:
+        # The backstop cap grows with the window so long histories are not
+        # cut short; an unbounded history has no cap.
+        if not self.safety_max_points or math.isinf(self.window_seconds):
+            return None
+        scale = max(1.0, self.window_seconds / self._base_window_seconds)
+        return int(self.safety_max_points * scale)
 
     @staticmethod
     def _to_finite_float(value) -> Optional[float]:
@@ -43,217 +102,67 @@ class GraphDataManager:
             return None
         return value_float
 
-    def _is_stale_timestamp(
-        self, timestamp: float, latest_timestamp: Optional[float]
-    ) -> bool:
-        if latest_timestamp is None:
-            return False
-        return timestamp < (latest_timestamp - self.window_seconds)
-
-    @staticmethod
-    def _update_latest_timestamp(
-        current_latest: Optional[float], candidate: float
-    ) -> float:
-        if current_latest is None:
-            return candidate
-        return max(current_latest, candidate)
-
-    def _maybe_reset_stream_on_timestamp_restart(
-        self,
-        timestamp: float,
-        latest_timestamp: Optional[float],
-        timestamps: deque,
-        *series: deque,
-    ) -> Optional[float]:
-        if latest_timestamp is None:
-            return latest_timestamp
-
-        # Handle telemetry timestamp counters restarting near zero.
-        restart_threshold_seconds = min(2.0, self.window_seconds)
-        if (
-            timestamp < latest_timestamp
-            and timestamp <= restart_threshold_seconds
-            and latest_timestamp >= self.window_seconds
-            and (latest_timestamp - timestamp) > self.window_seconds
-        ):
-            timestamps.clear()
-            for values in series:
-                values.clear()
-            return None
-
-        return latest_timestamp
-
-    def _prune_window(
-        self, timestamps: deque, *series: deque, latest_timestamp: Optional[float]
-    ):
-        if latest_timestamp is None or not timestamps:
-            return
-
-        cutoff = latest_timestamp - self.window_seconds
-        rows = [row for row in zip(timestamps, *series) if row[0] >= cutoff]
-
-        if self.safety_max_points and len(rows) > self.safety_max_points:
-            rows = rows[-self.safety_max_points :]
-
-        timestamps.clear()
-        for values in series:
-            values.clear()
-
-        for row in rows:
-            timestamps.append(row[0])
-            for idx, values in enumerate(series, start=1):
-                values.append(row[idx])
-
-    # ===== ALTITUDE =====
-    def add_data_point(self, altitude_value: float, timestamp: float):
-        """Add a new altitude data point with timestamp in seconds"""
-        alt_float = self._to_finite_float(altitude_value)
+    # ===== ADDING DATA =====
+    def add_sample(self, data: Dict[str, str], timestamp: float):
+        """Add one sample of named values with timestamp in seconds"""
         timestamp_float = self._to_finite_float(timestamp)
-        if alt_float is None or timestamp_float is None:
-            return
-        self._latest_alt_timestamp = self._maybe_reset_stream_on_timestamp_restart(
-            timestamp_float,
-            self._latest_alt_timestamp,
-            self.alt_timestamps,
-            self.altitudes,
-        )
-        if self._is_stale_timestamp(timestamp_float, self._latest_alt_timestamp):
+        if timestamp_float is None:
             return
 
-        self._latest_alt_timestamp = self._update_latest_timestamp(
-            self._latest_alt_timestamp, timestamp_float
-        )
-        self.altitudes.append(alt_float)
-        self.alt_timestamps.append(timestamp_float)
-        self._prune_window(
-            self.alt_timestamps,
-            self.altitudes,
-            latest_timestamp=self._latest_alt_timestamp,
-        )
+        values = {}
+        for name, value in data.items():
+            value_float = self._to_finite_float(value)
+            if value_float is not None and self.channels.has_channel(name):
+                values[name] = value_float
+        if values:
+            self.channels.append(timestamp_float, values)
 
-    # ===== ESTIMATED APOGEE =====
-    def add_est_apogee_point(self, est_apogee: float, timestamp: float):
-        est_apogee_float = self._to_finite_float(est_apogee)
-        timestamp_float = self._to_finite_float(timestamp)
-        if est_apogee_float is None or timestamp_float is None:
-            return
-        self._latest_est_apogee_timestamp = (
-            self._maybe_reset_stream_on_timestamp_restart(
-                timestamp_float,
-                self._latest_est_apogee_timestamp,
-                self.est_apogee_timestamps,
-                self.est_apogee_values,
-            )
-        )
-        if self._is_stale_timestamp(timestamp_float, self._latest_est_apogee_timestamp):
-            return
+    def add_batch(self, timestamps: np.ndarray, names: List[str], values: np.ndarray):
+        """Add a block of samples; values has one column per name, NaN if absent"""
+        self.channels.extend(timestamps, names, values)
 
-        self._latest_est_apogee_timestamp = self._update_latest_timestamp(
-            self._latest_est_apogee_timestamp, timestamp_float
-        )
-        self.est_apogee_timestamps.append(timestamp_float)
-        self.est_apogee_values.append(est_apogee_float)
-        self._prune_window(
-            self.est_apogee_timestamps,
-            self.est_apogee_values,
-            latest_timestamp=self._latest_est_apogee_timestamp,
-        )
-
-    # ===== ACCELEROMETER =====
-    def add_accel_data_point(self, ax: float, ay: float, az: float, timestamp: float):
-        """Add a new accelerometer data point (X, Y, Z)"""
-        ax_float = self._to_finite_float(ax)
-        ay_float = self._to_finite_float(ay)
-        az_float = self._to_finite_float(az)
-        timestamp_float = self._to_finite_float(timestamp)
-        if any(v is None for v in (ax_float, ay_float, az_float, timestamp_float)):
-            return
-        self._latest_acl_timestamp = self._maybe_reset_stream_on_timestamp_restart(
-            timestamp_float,
-            self._latest_acl_timestamp,
-            self.acl_timestamps,
-            self.accel_x,
-            self.accel_y,
-            self.accel_z,
-        )
-        if self._is_stale_timestamp(timestamp_float, self._latest_acl_timestamp):
-            return
+    # ===== GRAPH RETRIEVAL =====
+    def get_channel_plot_data(self, *channels) -> Tuple[np.ndarray, ...]:
+        """
+        Timestamps and values of any channels, by DataNames ID or name.
 
-        self._latest_acl_timestamp = self._update_latest_timestamp(
-            self._latest_acl_timestamp, timestamp_float
-        )
-        self.acl_timestamps.append(timestamp_float)
-        self.accel_x.append(ax_float)
-        self.accel_y.append(ay_float)
-        self.accel_z.append(az_float)
-        self._prune_window(
-            self.acl_timestamps,
-            self.accel_x,
-            self.accel_y,
-            self.accel_z,
-            latest_timestamp=self._latest_acl_timestamp,
-        )
+        Arrays may be views into the store and stay valid until the next
+        added sample, which is enough for one graph refresh.
+        """
+        return self.channels.get_channels(*channels)
 
-    # ===== GRAPH RETRIEVAL =====
-    def get_plot_data(self) -> Tuple[List[float], List[float]]:
+    def get_plot_data(self) -> Tuple[np.ndarray, np.ndarray]:
         """Altitude data formatted for plotting"""
-        rows = sorted(zip(self.alt_timestamps, self.altitudes), key=lambda row: row[0])
-        if not rows:
-            return [], []
-        times, altitudes = zip(*rows)
-        return list(times), list(altitudes)
+        return self.channels.get_first_present(*ALTITUDE_CHANNELS)
 
     def get_accel_plot_data(
         self,
-    ) -> Tuple[List[float], List[float], List[float], List[float]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Accelerometer data formatted for plotting"""
-        rows = sorted(
-            zip(self.acl_timestamps, self.accel_x, self.accel_y, self.accel_z),
-            key=lambda row: row[0],
-        )
-        if not rows:
-            return [], [], [], []
-        times, accel_x, accel_y, accel_z = zip(*rows)
-        return list(times), list(accel_x), list(accel_y), list(accel_z)
+        return self.get_channel_plot_data(*ACCEL_CHANNELS)
 
     # ===== STATS =====
     def get_current_altitude(self) -> Optional[float]:
-        return self.altitudes[-1] if self.altitudes else None
+        _, altitudes = self.get_plot_data()
+        return float(altitudes[-1]) if len(altitudes) else None
 
-    def get_est_apogee_plot_data(self):
-        rows = sorted(
-            zip(self.est_apogee_timestamps, self.est_apogee_values),
-            key=lambda row: row[0],
-        )
-        if not rows:
-            return [], []
-        times, est_apogee = zip(*rows)
-        return list(times), list(est_apogee)
+    def get_est_apogee_plot_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.get_channel_plot_data(EST_APOGEE_CHANNEL)
 
     def clear_data(self):
         """Clear all stored data"""
-        self.acl_timestamps.clear()
-        self.alt_timestamps.clear()
-        self.altitudes.clear()
-        self.accel_x.clear()
-        self.accel_y.clear()
-        self.accel_z.clear()
-        self.est_apogee_timestamps.clear()
-        self.est_apogee_values.clear()
-        self._latest_alt_timestamp = None
-        self._latest_acl_timestamp = None
-        self._latest_est_apogee_timestamp = None
+        self.channels.clear()
 
     def get_stats(self) -> Dict[str, float]:
         """Get basic statistics about the altitude data"""
-        if not self.altitudes:
+        _, altitudes = self.get_plot_data()
+        if not len(altitudes):
             return {}
-        alt_list = list(self.altitudes)
         return {
-            "current": alt_list[-1],
-            "min": min(alt_list),
-            "max": max(alt_list),
-            "average": np.mean(alt_list),
+            "current": float(altitudes[-1]),
+            "min": float(altitudes.min()),
+            "max": float(altitudes.max()),
+            "average": np.mean(altitudes),
         }
 
 
@@ -265,13 +174,22 @@ class StatusModel:
         self.last_update_time = 0
         self.data_source = data_source
         self.save_path = save_path
-        self.graph_manager = GraphDataManager()
+        self.graph_manager = GraphDataManager(
+            data_names=getattr(data_source, "data_names", None)
+        )
         self.save_headers = []
+        self.recorder: Optional[CSVRecorder] = None
 
     def set_data_source(self, data_source: DataSource):
         self.data_source = data_source
+        self.status_data = {}
+        # Graph channels follow the source's protocol definitions
+        data_names = getattr(data_source, "data_names", None)
+        if data_names is not None and data_names is not self.graph_manager.data_names:
+            self.graph_manager.set_data_names(data_names)
 
-    def set_local_save_path(self, save_path: str):
+    def set_local_save_path(self, save_path: str, fsync_interval_seconds: float = 1.0):
+        self.clear_local_save_path()
         self.save_path = save_path
         # Write a CSV header
         assert hasattr(
@@ -285,119 +203,128 @@ class StatusModel:
             )
             self.save_headers = []
         try:
-            with open(self.save_path, "w") as f:
-                f.write(",".join(self.save_headers) + "\n")
+            self.recorder = CSVRecorder(
+                self.save_path,
+                self.save_headers,
+                fsync_interval_seconds=fsync_interval_seconds,
+            )
+            self.recorder.start()
         except Exception as e:
             print(f"Error writing CSV header to {self.save_path}: {e}")
+            self.recorder = None
 
     def clear_local_save_path(self):
+        # Flush and close the recording before forgetting it
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
         self.save_path = None
         self.save_headers = []
 
+    def get_recorder_stats(self) -> Dict[str, int]:
+        return self.recorder.get_stats() if self.recorder is not None else {}
+
     def update_from_data_source(self) -> bool:
         if not self.data_source or not self.data_source.is_connected():
             return False
 
-        data = self.data_source.get_data()
-
-        if not data:
-            # No new data available
-            return False
+        # Sources that batch samples hand over every packet since the last
+        # tick in one poll; the rest only expose their newest values.
+        batch = self.data_source.get_batch()
+        if batch is not None:
+            if not len(batch):
+                # No new data available
+                return False
+            # Fields missing from this batch keep their last shown value
+            self.status_data = {**self.status_data, **batch.latest_status()}
+            self._update_graph_data_from_batch(batch)
+            rows = self._batch_to_csv_rows(batch)
+        else:
+            data = self.data_source.get_data()
+            if not data:
+                # No new data available
+                return False
+            self.status_data = data
+            self._update_graph_data(data)
+            rows = [[str(data.get(h, "")) for h in self.save_headers]]
 
-        self.status_data = data
         self.last_update_time = time.time()
-        self._update_graph_data(data)
 
-        if self.save_path:
-            # Save the dictionary as the next line in a CSV file
-            # The first line in the CSV already has the keys as headers, so we just need to write the values in the correct order
-            try:
-                with open(self.save_path, "a") as f:
-                    headers = self.save_headers
-                    values = [str(data.get(h, "")) for h in headers]
-                    f.write(",".join(values) + "\n")
-            except Exception as e:
-                print(f"Error saving data to {self.save_path}: {e}")
+        if self.recorder is not None and rows:
+            # Queue each sample as the next line in the CSV file; the recorder
+            # thread does the disk I/O. The header row is already written, so
+            # values just need to follow the header order.
+            self.recorder.write_rows(rows)
         return True
 
-    def _update_graph_data(self, data: Dict[str, str]):
-        """Extract altitude and accelerometer data and update graph manager"""
-        # --- ALTITUDE ---
-        altitude_keys = ["ALTITUDE", "EST_ALTITUDE", "ALT", "altitude", "alt"]
-        altitude = None
-        for key in altitude_keys:
-            if key in data and data[key] not in ["N/A", "", None]:
-                try:
-                    altitude = float(data[key])
-                    break
-                except (ValueError, TypeError):
-                    continue
-
-        # --- ACCELEROMETER ---
-        accel_keys = {
-            "x": ["ACCELEROMETER_X", "AX", "accel_x", "accx", "acc_x"],
-            "y": ["ACCELEROMETER_Y", "AY", "accel_y", "accy", "acc_y"],
-            "z": ["ACCELEROMETER_Z", "AZ", "accel_z", "accz", "acc_z"],
+    def _batch_to_csv_rows(self, batch) -> List[List[str]]:
+        """One CSV row per packet; fields absent from a packet are left blank."""
+        if self.recorder is None or not len(batch):
+            return []
+
+        column_index = {name: idx for idx, name in enumerate(batch.columns)}
+        header_fields = {
+            "TIMESTAMP": batch.timestamps.tolist(),
+            "NUM_PACKETS_SENT": batch.packet_numbers.tolist(),
         }
-        ax = ay = az = None
-        for axis, keys in accel_keys.items():
-            for key in keys:
-                if key in data and data[key] not in ["N/A", "", None]:
-                    try:
-                        if axis == "x":
-                            ax = float(data[key])
-                        elif axis == "y":
-                            ay = float(data[key])
-                        elif axis == "z":
-                            az = float(data[key])
-                        break
-                    except (ValueError, TypeError):
-                        continue
-
-        # --- EST_APOGEE ---
-        est_apogee_keys = ["EST_APOGEE", "EST_APOGEE_ALT", "est_apogee"]
-        est_apogee = None
-        for key in est_apogee_keys:
-            if key in data and data[key] not in ["N/A", "", None]:
-                try:
-                    est_apogee = float(data[key])
-                    break
-                except (ValueError, TypeError):
-                    continue
+        values = batch.values.tolist()
+
+        rows = []
+        for row_idx, row_values in enumerate(values):
+            row = []
+            for header in self.save_headers:
+                col_idx = column_index.get(header)
+                value = row_values[col_idx] if col_idx is not None else None
+                if value is not None and not math.isnan(value):
+                    row.append(str(value))
+                elif header in header_fields:
+                    row.append(str(header_fields[header][row_idx]))
+                else:
+                    row.append("")
+            rows.append(row)
+        return rows
+
+    def _update_graph_data_from_batch(self, batch):
+        """Add every packet in a batch to the graph channels"""
+        if not len(batch):
+            return
 
         # --- TIMESTAMP (convert ms → s) ---
-        timestamp = None
+        timestamps = batch.timestamps / 1000.0
+        self.graph_manager.add_batch(timestamps, batch.columns, batch.values)
+
+    def _update_graph_data(self, data: Dict[str, str]):
+        """Add the named values of one sample to the graph channels"""
+        # --- TIMESTAMP (convert ms → s) ---
         if "TIMESTAMP" in data and data["TIMESTAMP"] not in ["N/A", "", None]:
             try:
                 timestamp = float(data["TIMESTAMP"]) / 1000.0
             except (ValueError, TypeError):
-                pass
-
-        # --- Add to buffers ---
-        if timestamp is not None:
-            if altitude is not None:
-                self.graph_manager.add_data_point(altitude, timestamp)
-
-            if est_apogee is not None:
-                self.graph_manager.add_est_apogee_point(est_apogee, timestamp)
-
-            if all(v is not None for v in (ax, ay, az)):
-                self.graph_manager.add_accel_data_point(ax, ay, az, timestamp)
+                return
+            self.graph_manager.add_sample(data, timestamp)
 
     # ===== Graph Accessors =====
-    def get_graph_data(self) -> Tuple[List[float], List[float]]:
+    def get_graph_data(self) -> Tuple[np.ndarray, np.ndarray]:
         """Altitude graph data"""
         return self.graph_manager.get_plot_data()
 
     def get_accel_graph_data(
         self,
-    ) -> Tuple[List[float], List[float], List[float], List[float]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Accelerometer graph data"""
         return self.graph_manager.get_accel_plot_data()
 
     def get_est_apogee_graph_data(self):
         return self.graph_manager.get_est_apogee_plot_data()
 
+    def get_channel_graph_data(self, *channels) -> Tuple[np.ndarray, ...]:
+        """Graph data for any channels, by DataNames ID or name"""
+        return self.graph_manager.get_channel_plot_data(*channels)
+
+    def set_graph_window_seconds(self, window_seconds: Optional[float]):
+        """Graph history length in seconds; None keeps the whole session"""
+        self.graph_manager.set_window_seconds(window_seconds)
+
     def get_graph_stats(self) -> Dict[str, float]:
         return self.graph_manager.get_stats()
 
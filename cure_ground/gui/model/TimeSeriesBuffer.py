@@ -0,0 +1,221 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class TimeSeriesBuffer:
+    """
+    Sliding time window of samples held in preallocated NumPy arrays.
+
+    Each sample is a timestamp (seconds) plus ``n_columns`` values, kept
+    sorted by timestamp so readers get plot-ready views without sorting. Samples
+    older than ``window_seconds`` before the newest timestamp are evicted by
+    advancing a head cursor, and the live region is only moved back to the
+    start of the arrays when an append would run past their end, so appends
+    are amortized O(1) regardless of window size.
+    """
+
+    def __init__(
+        self,
+        n_columns: int,
+        window_seconds: float,
+        max_points: Optional[int] = None,
+        initial_capacity: int = 1024,
+    ):
+        """
+        Args:
+            n_columns: Number of values stored per sample
+            window_seconds: Span of time kept behind the newest timestamp
+            max_points: Backstop cap on stored samples (None/0 = no cap)
+            initial_capacity: Starting array size; grows when needed
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+
+        self.n_columns = n_columns
+        self.window_seconds = window_seconds
+        self.max_points = max_points or None
+
+        # Twice the cap so compaction always frees at least half the arrays.
+        capacity = 2 * self.max_points if self.max_points else initial_capacity
+        self._times = np.empty(max(capacity, 1), dtype=np.float64)
+        self._values = np.empty((n_columns, len(self._times)), dtype=np.float64)
+        self._head = 0
+        self._tail = 0
+
+        # Newest timestamp seen, used to anchor time-window eviction.
+        self.latest_timestamp: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def clear(self):
+        self._head = 0
+        self._tail = 0
+        self.latest_timestamp = None
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Zero-copy view of the timestamps, oldest first. Invalidated by append()."""
+        return self._times[self._head : self._tail]
+
+    def column(self, index: int) -> np.ndarray:
+        """Zero-copy view of one value column. Invalidated by append()."""
+        return self._values[index, self._head : self._tail]
+
+    def set_window(self, window_seconds: float, max_points: Optional[int] = None):
+        """
+        Change the retained span. A longer window only keeps new samples
+        longer; a shorter one evicts on the next append.
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        self.window_seconds = window_seconds
+        self.max_points = max_points or None
+
+    def last_value(self, index: int) -> Optional[float]:
+        if not len(self):
+            return None
+        return float(self._values[index, self._tail - 1])
+
+    def append(self, timestamp: float, values: Sequence[float]) -> bool:
+        """
+        Add one sample and evict whatever fell out of the window.
+
+        Returns:
+            False if the sample was dropped as older than the window.
+        """
+        self._maybe_reset_on_timestamp_restart(timestamp)
+        if self._is_stale_timestamp(timestamp):
+            return False
+
+        self._make_room()
+
+        if self.latest_timestamp is None or timestamp >= self.latest_timestamp:
+            self.latest_timestamp = timestamp
+            self._times[self._tail] = timestamp
+            self._values[:, self._tail] = values
+            self._tail += 1
+        else:
+            self._insert_out_of_order(timestamp, values)
+
+        self._evict()
+        return True
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray) -> int:
+        """
+        Add a block of samples.
+
+        Args:
+            timestamps: Sample times in seconds, shape (k,)
+            values: Sample values, shape (n_columns, k)
+
+        Returns:
+            Number of samples kept.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(timestamps):
+            return 0
+
+        in_order = (
+            self.latest_timestamp is None or timestamps[0] >= self.latest_timestamp
+        ) and bool(np.all(timestamps[1:] >= timestamps[:-1]))
+        if not in_order:
+            # Late samples or a counter restart: take the careful path.
+            return sum(
+                self.append(timestamp, values[:, idx])
+                for idx, timestamp in enumerate(timestamps.tolist())
+            )
+
+        # Only the tail of the block can survive the window and the cap.
+        first = int(
+            np.searchsorted(timestamps, timestamps[-1] - self.window_seconds, "left")
+        )
+        if self.max_points:
+            first = max(first, len(timestamps) - self.max_points)
+        timestamps = timestamps[first:]
+        values = values[:, first:]
+        count = len(timestamps)
+
+        self._make_room(count)
+        self._times[self._tail : self._tail + count] = timestamps
+        self._values[:, self._tail : self._tail + count] = values
+        self._tail += count
+        self.latest_timestamp = float(timestamps[-1])
+
+        self._evict()
+        return count
+
+    def _insert_out_of_order(self, timestamp: float, values: Sequence[float]):
+        """Slot a late sample into place, after any equal timestamps."""
+        head, tail = self._head, self._tail
+        index = head + int(
+            np.searchsorted(self._times[head:tail], timestamp, side="right")
+        )
+        # Shift the newer samples up by one; slice assignment handles overlap.
+        self._times[index + 1 : tail + 1] = self._times[index:tail]
+        self._values[:, index + 1 : tail + 1] = self._values[:, index:tail]
+        self._times[index] = timestamp
+        self._values[:, index] = values
+        self._tail += 1
+
+    def _is_stale_timestamp(self, timestamp: float) -> bool:
+        if self.latest_timestamp is None:
+            return False
+        return timestamp < (self.latest_timestamp - self.window_seconds)
+
+    def _maybe_reset_on_timestamp_restart(self, timestamp: float):
+        latest_timestamp = self.latest_timestamp
+        if latest_timestamp is None:
+            return
+
+        # Handle telemetry timestamp counters restarting near zero.
+        restart_threshold_seconds = min(2.0, self.window_seconds)
+        if (
+            timestamp < latest_timestamp
+            and timestamp <= restart_threshold_seconds
+            and latest_timestamp >= self.window_seconds
+            and (latest_timestamp - timestamp) > self.window_seconds
+        ):
+            self.clear()
+
+    def _evict(self):
+        """Advance the head past samples outside the window or over the cap."""
+        cutoff = self.latest_timestamp - self.window_seconds
+        head = self._head
+        tail = self._tail
+        if head < tail and self._times[head] < cutoff:
+            head += int(np.searchsorted(self._times[head:tail], cutoff, "left"))
+
+        if self.max_points and tail - head > self.max_points:
+            head = tail - self.max_points
+
+        if head == tail:
+            head = tail = 0
+        self._head = head
+        self._tail = tail
+
+    def _make_room(self, count: int = 1):
+        """Ensure ``count`` free slots after the tail, compacting or growing."""
+        if self._tail + count <= len(self._times):
+            return
+
+        size = len(self)
+        capacity = len(self._times)
+        while size + count > capacity or size * 2 > capacity:
+            capacity *= 2
+        if capacity != len(self._times):
+            times = np.empty(capacity, dtype=np.float64)
+            values = np.empty((self.n_columns, capacity), dtype=np.float64)
+        else:
+            times = self._times
+            values = self._values
+
+        # Slice assignment copies via a temporary, so overlap is safe.
+        times[:size] = self._times[self._head : self._tail]
+        values[:, :size] = self._values[:, self._head : self._tail]
+        self._times = times
+        self._values = values
+        self._head = 0
+        self._tail = size
@@ -0,0 +1,89 @@
+"""
+Level-of-detail reduction for plotted time series.
+
+Both reducers keep the first and last samples and return points in their
+original order, so a trace decimated to roughly the pixel width of its plot
+looks the same as the full trace while costing a fixed amount to draw.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def minmax_downsample(
+    x: np.ndarray, y: np.ndarray, n_buckets: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keep the minimum and maximum sample of each of ``n_buckets`` equal-count
+    buckets, so every peak and trough survives.
+
+    Returns at most ``2 * n_buckets`` points; inputs already that small are
+    returned unchanged.
+    """
+    n = len(y)
+    if n_buckets <= 0 or n <= 2 * n_buckets:
+        return x, y
+
+    bucket_size = -(-n // n_buckets)
+    n_full = n // bucket_size
+    full = y[: n_full * bucket_size].reshape(n_full, bucket_size)
+    offsets = np.arange(n_full) * bucket_size
+    picks = [
+        offsets + np.argmin(full, axis=1),
+        offsets + np.argmax(full, axis=1),
+    ]
+
+    remainder = y[n_full * bucket_size :]
+    if len(remainder):
+        start = n_full * bucket_size
+        picks.append(np.array([start + np.argmin(remainder)]))
+        picks.append(np.array([start + np.argmax(remainder)]))
+
+    picks.append(np.array([0, n - 1]))
+    indices = np.unique(np.concatenate(picks))
+    return x[indices], y[indices]
+
+
+def lttb_downsample(
+    x: np.ndarray, y: np.ndarray, n_out: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets reduction to ``n_out`` points.
+
+    Picks, per bucket, the sample forming the largest triangle with the
+    previously kept point and the next bucket's average, which keeps the
+    visual shape of the trace with fewer points than min-max.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket boundaries for the n - 2 interior samples
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    prev = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Twice the triangle area; the constant factor does not change argmax.
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        indices[bucket + 1] = prev
+
+    return x[indices], y[indices]
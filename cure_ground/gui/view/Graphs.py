@@ -3,6 +3,8 @@ from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QFont
 import pyqtgraph as pg
 
+from cure_ground.gui.model.downsample_utils import lttb_downsample, minmax_downsample
+
 
 class BaseGraph(QWidget):
     def __init__(self, title: str, y_label: str):
@@ -53,8 +55,21 @@ class BaseGraph(QWidget):
 
 
 class MergedGraph(BaseGraph):
-    def __init__(self):
+    # Traces are reduced to about this many points per horizontal pixel
+    # before drawing, so render cost stays flat however long the history is.
+    POINTS_PER_PIXEL = 2
+    FALLBACK_PLOT_WIDTH_PX = 1000
+
+    def __init__(self, downsample_method: str = "minmax"):
+        """
+        Args:
+            downsample_method: "minmax" (keeps every peak) or "lttb"
+                (fewer points, same visual shape)
+        """
         super().__init__("Flight Data", "Value")
+        if downsample_method not in ("minmax", "lttb"):
+            raise ValueError(f"Unknown downsample method: {downsample_method}")
+        self.downsample_method = downsample_method
 
         # Replace the single-plot widget from BaseGraph with a split graph layout.
         self.layout().removeWidget(self.plot_widget)
@@ -123,6 +138,25 @@ class MergedGraph(BaseGraph):
         self.altitude_plot.getAxis("left").setWidth(width_px)
         self.accel_plot.getAxis("left").setWidth(width_px)
 
+    def _max_points(self, plot) -> int:
+        width = int(plot.getViewBox().width()) or self.FALLBACK_PLOT_WIDTH_PX
+        return width * self.POINTS_PER_PIXEL
+
+    def _set_decimated(self, line, times, values, max_points: int):
+        """Reduce a trace to the plot's pixel budget, then draw it"""
+        if self.downsample_method == "lttb":
+            plot_times, plot_values = lttb_downsample(times, values, max_points)
+        else:
+            # Min-max emits two points per bucket
+            plot_times, plot_values = minmax_downsample(times, values, max_points // 2)
+        # Short traces come back as the model's buffer views, which later
+        # appends can rewrite before pyqtgraph paints them
+        if plot_times is times:
+            plot_times = times.copy()
+        if plot_values is values:
+            plot_values = values.copy()
+        line.setData(plot_times, plot_values)
+
     def _update_plot_data(self):
         # Get data from model
         times, altitude = self.model.get_graph_data()
@@ -130,13 +164,16 @@ class MergedGraph(BaseGraph):
 
         t3, est_apogee = self.model.get_est_apogee_graph_data()
 
+        altitude_points = self._max_points(self.altitude_plot)
+        accel_points = self._max_points(self.accel_plot)
+
         if len(times) > 2:
-            self.alt_line.setData(times, altitude)
+            self._set_decimated(self.alt_line, times, altitude, altitude_points)
 
         if len(t2) > 2:
-            self.ax_line.setData(t2, ax)
-            self.ay_line.setData(t2, ay)
-            self.az_line.setData(t2, az)
+            self._set_decimated(self.ax_line, t2, ax, accel_points)
+            self._set_decimated(self.ay_line, t2, ay, accel_points)
+            self._set_decimated(self.az_line, t2, az, accel_points)
 
         if len(t3) > 2:
-            self.est_apogee_line.setData(t3, est_apogee)
+            self._set_decimated(self.est_apogee_line, t3, est_apogee, altitude_points)
@@ -1,10 +1,12 @@
 from PyQt6.QtWidgets import (
+    QCheckBox,
     QWidget,
     QPushButton,
     QVBoxLayout,
     QComboBox,
     QLabel,
     QSizePolicy,
+    QSlider,
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
@@ -62,6 +64,19 @@ class Sidebar(QWidget):
         self.refresh_button.setStyleSheet(BUTTON_STYLE)
         layout.addWidget(self.refresh_button)
 
+        # Radio only: read the serial port on a background thread instead of
+        # from the GUI update timer
+        self.threaded_reader_checkbox = QCheckBox("Background serial reader")
+        self.threaded_reader_checkbox.setFont(QFont(self.font_family, 12))
+        self.threaded_reader_checkbox.setStyleSheet(
+            "color: white; background-color: transparent;"
+        )
+        self.threaded_reader_checkbox.setToolTip(
+            "Keep reading the radio while the GUI is busy"
+        )
+        self.threaded_reader_checkbox.setChecked(False)
+        layout.addWidget(self.threaded_reader_checkbox)
+
         # Connect button
         self.connect_button = QPushButton("Connect")
         self.connect_button.setFont(QFont(self.font_family, 16))
@@ -71,6 +86,30 @@ class Sidebar(QWidget):
         # Spacer for bottom buttons
         layout.addStretch()
 
+        # Recording playback controls (CSV only, initially hidden)
+        self.playback_label = QLabel("0:00 / 0:00")
+        self.playback_label.setFont(QFont(self.font_family, 12))
+        self.playback_label.setStyleSheet(
+            "color: white; background-color: transparent;"
+        )
+        layout.addWidget(self.playback_label)
+
+        self.playback_slider = QSlider(Qt.Orientation.Horizontal)
+        self.playback_slider.setToolTip("Drag to seek through the recording")
+        layout.addWidget(self.playback_slider)
+
+        self.playback_pause_button = QPushButton("Pause")
+        self.playback_pause_button.setFont(QFont(self.font_family, 14))
+        self.playback_pause_button.setStyleSheet(BUTTON_STYLE)
+        layout.addWidget(self.playback_pause_button)
+
+        self.playback_speed_combo = QComboBox()
+        self.playback_speed_combo.setStyleSheet(COMBO_BOX_STYLE)
+        self.playback_speed_combo.setFont(QFont(self.font_family, 12))
+        self.playback_speed_combo.setToolTip("Playback speed")
+        layout.addWidget(self.playback_speed_combo)
+        self.hide_playback_controls()
+
         # Control buttons (initially hidden)
         self.live_update_button = QPushButton("Start Streaming")
         self.live_update_button.setFont(QFont(self.font_family, 14))
@@ -84,6 +123,13 @@ class Sidebar(QWidget):
         layout.addWidget(self.graph_button)
         self.graph_button.hide()
 
+        self.graph_history_combo = QComboBox()
+        self.graph_history_combo.setStyleSheet(COMBO_BOX_STYLE)
+        self.graph_history_combo.setFont(QFont(self.font_family, 12))
+        self.graph_history_combo.setToolTip("Graph history")
+        layout.addWidget(self.graph_history_combo)
+        self.graph_history_combo.hide()
+
         self.clear_graphs_button = QPushButton("Clear Graphs")
         self.clear_graphs_button.setFont(QFont(self.font_family, 14))
         self.clear_graphs_button.setStyleSheet(BUTTON_STYLE)
@@ -117,6 +163,7 @@ class Sidebar(QWidget):
             self.port_dropdown.hide()
             self.port_label.hide()
             self.refresh_button.hide()
+            self.threaded_reader_checkbox.hide()
             self.connect_button.hide()
             self.hide_control_buttons()
         elif source_lower == "csv":
@@ -125,6 +172,7 @@ class Sidebar(QWidget):
             self.port_dropdown.show()
             self.port_label.show()
             self.refresh_button.show()
+            self.threaded_reader_checkbox.hide()
             self.connect_button.show()
             self.hide_control_buttons()
         else:
@@ -133,12 +181,14 @@ class Sidebar(QWidget):
             self.port_dropdown.show()
             self.port_label.show()
             self.refresh_button.show()
+            self.threaded_reader_checkbox.show()
             self.connect_button.show()
             self.hide_control_buttons()
 
     def show_control_buttons(self):
         self.live_update_button.show()
         self.graph_button.show()
+        self.graph_history_combo.show()
         self.clear_plm_button.show()
         self.clear_graphs_button.show()
         self.command_mode_button.show()
@@ -146,9 +196,23 @@ class Sidebar(QWidget):
     def hide_control_buttons(self):
         self.live_update_button.hide()
         self.graph_button.hide()
+        self.graph_history_combo.hide()
         self.clear_plm_button.hide()
         self.clear_graphs_button.hide()
         self.command_mode_button.hide()
+        self.hide_playback_controls()
+
+    def show_playback_controls(self):
+        self.playback_label.show()
+        self.playback_slider.show()
+        self.playback_pause_button.show()
+        self.playback_speed_combo.show()
+
+    def hide_playback_controls(self):
+        self.playback_label.hide()
+        self.playback_slider.hide()
+        self.playback_pause_button.hide()
+        self.playback_speed_combo.hide()
 
     def update_connect_button_text(self, text):
         self.connect_button.setText(text)
@@ -159,6 +223,9 @@ class Sidebar(QWidget):
     def get_port_dropdown(self):
         return self.port_dropdown
 
+    def get_threaded_reader_checkbox(self) -> QCheckBox:
+        return self.threaded_reader_checkbox
+
     def get_refresh_button(self):
         return self.refresh_button
 
@@ -171,6 +238,9 @@ class Sidebar(QWidget):
     def get_graph_button(self):
         return self.graph_button
 
+    def get_graph_history_combo(self):
+        return self.graph_history_combo
+
     def get_clear_plm_button(self):
         return self.clear_plm_button
 
@@ -179,3 +249,15 @@ class Sidebar(QWidget):
 
     def get_command_mode_button(self):
         return self.command_mode_button
+
+    def get_playback_label(self):
+        return self.playback_label
+
+    def get_playback_slider(self):
+        return self.playback_slider
+
+    def get_playback_pause_button(self):
+        return self.playback_pause_button
+
+    def get_playback_speed_combo(self):
+        return self.playback_speed_combo